@@ -0,0 +1,440 @@
+## libraries
+import os
+import gc
+import json
+import time
+import warnings
+import tracemalloc
+import numpy as np
+from extractor import people_splitter
+from extractor import name_section_processor
+from extractor import name_educat_processor
+from extractor import branch_extractor
+from extractor import section_processor
+from namer import name_processor
+from scraper import data_cleaner
+from ruler import rule_loader
+
+
+## synthetic name parts
+givens = [
+    'Alice', 'Anthony', 'Beth', 'Carlos', 'Catharine', 'Daniel', 'David',
+    'Deepti', 'Elizabeth', 'Hirsh', 'Ian', 'Jennifer', 'John', 'Karen',
+    'Kirk', 'Li', 'Louis', 'Maria', 'Melody', 'Michael', 'Pamela', 'Paneez',
+    'Rashida', 'Richard', 'Sumati', 'Temeri', 'Zhihui'
+]
+
+syllables = [
+    'al', 'an', 'ber', 'ca', 'da', 'del', 'fi', 'gor', 'ha', 'kin', 'la',
+    'ler', 'ma', 'mor', 'na', 'ne', 'ri', 'ro', 'sa', 'son', 'ta', 'vi', 'wil'
+]
+
+units = [
+    'Section', 'Unit', 'Laboratory', 'Core', 'Program'
+]
+
+topics = [
+    'Allergy', 'Bacterial', 'Cellular', 'Clinical', 'Genomic', 'Host',
+    'Immune', 'Molecular', 'Parasitic', 'Pathogen', 'Structural', 'Viral'
+]
+
+## data features *strictly* named and ordered
+feats = [
+    'Name',
+    'Education',
+    'Branch',
+    'Section'
+]
+
+
+## synthetic roster
+def roster_generator(n, seed = 0, lab_size = 12):
+
+    """
+    Desc:
+        Generates a seeded synthetic roster of 'n' raw list item strings, each
+        'Name, Credentials\nSection' as extracted from a laboratory description,
+        grouped into labs of about 'lab_size' people with a branch heading. Names
+        recur across sections and labs with and without middle initials, and
+        carry one to three credentials and occasional job titles.
+
+    Args:
+        n (int): Number of list items.
+        seed (int): Random seed.
+        lab_size (int): Mean number of list items per lab.
+
+    Returns:
+        tuple: List of raw list item strings and list of branch heading per item.
+
+    Raises:
+        None.
+    """
+
+    rng = np.random.default_rng(seed)
+    rules = rule_loader()
+
+    ## people, a person appears about twice
+    n_people = max(n // 2, 1)
+
+    surnames = np.array([
+        ''.join(rng.choice(syllables, size = rng.integers(2, 4))).capitalize()
+        for i in range(0, n_people)
+    ])
+
+    people = np.char.add(
+        np.char.add(rng.choice(givens, size = n_people), ' '),
+        np.where(
+            rng.random(n_people) < 0.4,
+            np.char.add(rng.choice(list('ABCDEFGHJKLMNPRST'), size = n_people), ' '),
+            ''
+        )
+    )
+
+    people = np.char.add(people, surnames)
+
+    ## list items
+    person = rng.integers(0, n_people, size = n)
+    n_creds = rng.choice([1, 2, 3], size = n, p = [0.6, 0.3, 0.1])
+    edu = np.array(list(rules['edu_rank']))
+    titles = np.array(['', '', '', '', ', Chief', ', Senior Investigator', ', Staff Clinician'])
+
+    items = list()
+    branches = list()
+    lab = 0
+
+    for i in range(0, n):
+        if i % lab_size == 0:
+            lab = rng.integers(0, max(n // lab_size, 1))
+
+        name = people[person[i]]
+
+        ## drop middle initial now and then
+        if rng.random() < 0.1:
+            name = name.split()[0] + ' ' + name.split()[-1]
+
+        creds = ', '.join(rng.choice(edu, size = n_creds[i], replace = False))
+        section = '{a} {b} {c}'.format(
+            a = topics[lab % len(topics)],
+            b = ['Biology', 'Immunology', 'Genetics', 'Medicine'][lab % 4],
+            c = units[lab % len(units)] if rng.random() > 0.02 else 'Unit, Core'
+        )
+
+        items.append('{a}, {b}{c}\n{d}'.format(
+                a = name,
+                b = creds,
+                c = titles[rng.integers(0, len(titles))],
+                d = section
+            )
+        )
+
+        branches.append('Laboratory of {x} {y}'.format(
+                x = topics[lab % len(topics)],
+                y = lab // len(topics)
+            )
+        )
+
+    return items, branches
+
+
+## measure one stage
+def stage_bencher(func, args, memory = True):
+
+    """
+    Desc:
+        Measures wall time and peak traced memory of calling 'func' with a
+        fresh copy of its arguments from 'args'. Time and memory are measured
+        in separate calls, as tracing memory slows execution.
+
+    Args:
+        func (func): Stage function.
+        args (func): Called without args for a fresh dict of keyword args.
+        memory (bool): Measure peak memory.
+
+    Returns:
+        tuple: Return value of 'func', time (seconds), and peak memory (MB).
+
+    Raises:
+        None.
+    """
+
+    gc.collect()
+    kwargs = args()
+
+    start = time.perf_counter()
+    result = func(**kwargs)
+    latency = time.perf_counter() - start
+
+    peak = None
+
+    if memory:
+        kwargs = args()
+        gc.collect()
+
+        tracemalloc.start()
+        func(**kwargs)
+        peak = tracemalloc.get_traced_memory()[1] / 2 ** 20
+        tracemalloc.stop()
+
+    return result, latency, peak
+
+
+## measure all stages
+def stages_bencher(n, seed = 0, memory = True):
+
+    """
+    Desc:
+        Runs the processing stages on a synthetic roster of 'n' list items, as
+        one block per stage, and measures time and peak memory of each. The
+        branch feature is the frame work of 'branch_extractor' with a known
+        heading, where the heading per lab is then restored for the stages
+        after it.
+
+    Args:
+        n (int): Number of list items.
+        seed (int): Random seed.
+        memory (bool): Measure peak memory.
+
+    Returns:
+        dict: Time (seconds), peak memory (MB), and rows per stage.
+
+    Raises:
+        None.
+    """
+
+    items, branches = roster_generator(
+        n = n,
+        seed = seed
+    )
+
+    results = dict()
+
+    def recorder(stage, func, args):
+        result, latency, peak = stage_bencher(
+            func = func,
+            args = args,
+            memory = memory
+        )
+
+        results[stage] = {
+            'time': latency,
+            'memory': peak,
+            'rows': len(result)
+        }
+
+        return result
+
+    data = recorder('people_splitter', people_splitter,
+        lambda: {'people_all': items, 'people_sub': list(items)})
+
+    data = recorder('name_section_processor', name_section_processor,
+        lambda: {'data': [list(i) for i in data], 'feat_a': feats[0], 'feat_b': feats[3]})
+
+    data = recorder('name_educat_processor', name_educat_processor,
+        lambda: {'data': data.copy(), 'feat_a': feats[0], 'feat_b': feats[1]})
+
+    data = recorder('branch_extractor', branch_extractor,
+        lambda: {'driver': None, 'data': data.copy(), 'feat_a': feats[3], 'feat_b': feats[2],
+            'anch_c': '//h1', 't': 1, 'heading': 'Laboratory'})
+
+    ## heading per lab
+    data[feats[2]] = np.array(branches, dtype = object)[
+        np.minimum(data.index.to_numpy(), len(branches) - 1)
+    ]
+
+    data = recorder('name_processor', name_processor,
+        lambda: {'data': data.copy(), 'feat': feats[0], 'reap': 2})
+
+    data = recorder('section_processor', section_processor,
+        lambda: {'data': data.copy(), 'feat_a': feats[3], 'feat_b': feats[2]})
+
+    data = recorder('data_cleaner', data_cleaner,
+        lambda: {'data': data.copy(), 'feats': feats})
+
+    return results
+
+
+## load baselines
+def baseline_loader(path):
+
+    """
+    Desc:
+        Loads stored benchmark baselines from 'path'.
+
+    Args:
+        path (str): Path to baselines file.
+
+    Returns:
+        dict: Results per roster size, keyed by size as str.
+
+    Raises:
+        None.
+    """
+
+    if not os.path.exists(path):
+        return dict()
+
+    with open(path, 'r') as file:
+        return json.load(file)
+
+
+## save baselines
+def baseline_saver(path, baselines):
+
+    """
+    Desc:
+        Saves benchmark baselines to 'path'.
+
+    Args:
+        path (str): Path to baselines file.
+        baselines (dict): Results per roster size, keyed by size as str.
+
+    Returns:
+        None.
+
+    Raises:
+        None.
+    """
+
+    if os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok = True)
+
+    with open(path + '.tmp', 'w') as file:
+        json.dump(baselines, file, indent = 1, sort_keys = True)
+
+    os.replace(path + '.tmp', path)
+
+
+## compare results to baselines
+def baseline_comparer(results, baselines, tolerance = 0.25, floor = 0.05):
+
+    """
+    Desc:
+        Compares benchmark results to stored baselines per roster size and
+        stage. A stage regresses when its time or peak memory exceeds the
+        baseline by more than 'tolerance', where times under 'floor' seconds
+        are too noisy to compare.
+
+    Args:
+        results (dict): Results per roster size, keyed by size as str.
+        baselines (dict): Results per roster size, keyed by size as str.
+        tolerance (float): Allowed relative increase over baseline.
+        floor (float): Min baseline time to compare (seconds).
+
+    Returns:
+        list: Regressions as tuples of size, stage, measure, baseline, result.
+
+    Raises:
+        None.
+    """
+
+    regressions = list()
+
+    for size, stages in results.items():
+        for stage, result in stages.items():
+            base = baselines.get(size, dict()).get(stage)
+
+            if base is None:
+                continue
+
+            if base['time'] >= floor and result['time'] > base['time'] * (1 + tolerance):
+                regressions.append((size, stage, 'time', base['time'], result['time']))
+
+            if None not in [base['memory'], result['memory']] and (
+                result['memory'] > base['memory'] * (1 + tolerance)):
+                regressions.append((size, stage, 'memory', base['memory'], result['memory']))
+
+    return regressions
+
+
+## benchmark report
+def bench_reporter(results, regressions):
+
+    """
+    Desc:
+        Prints benchmark results per roster size and stage, and regressions
+        against baselines.
+
+    Args:
+        results (dict): Results per roster size, keyed by size as str.
+        regressions (list): Regressions from 'baseline_comparer'.
+
+    Returns:
+        None.
+
+    Raises:
+        None.
+    """
+
+    flagged = {(i[0], i[1]) for i in regressions}
+
+    for size, stages in results.items():
+        print('Roster size: {x}'.format(x = size))
+
+        for stage, result in stages.items():
+            print('  {s:<24}{t:>10.3f} s{m:>10} MB{r:>10} rows{f}'.format(
+                    s = stage,
+                    t = result['time'],
+                    m = '-' if result['memory'] is None else '{x:.1f}'.format(x = result['memory']),
+                    r = result['rows'],
+                    f = '  REGRESSION' if (size, stage) in flagged else ''
+                )
+            )
+
+    for size, stage, measure, base, result in regressions:
+        print('Regression at roster size {a}, {b} {c}: {d:.3f} baseline, {e:.3f} now'.format(
+                a = size,
+                b = stage,
+                c = measure,
+                d = base,
+                e = result
+            )
+        )
+
+
+## -- benchmark run -- ##
+if __name__ == '__main__':
+
+    ## roster sizes, seed, and peak memory
+    sizes = [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6]
+    seed = 0
+    memory = True
+
+    ## stored baselines in repo, written for new sizes or when 'save' is True
+    baseline_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'bench', 'baselines.json')
+    save = False
+    tolerance = 0.25
+
+    warnings.simplefilter('ignore')
+
+    results = {
+        str(i): stages_bencher(
+            n = i,
+            seed = seed,
+            memory = memory
+        ) for i in sizes
+    }
+
+    baselines = baseline_loader(
+        path = baseline_path
+    )
+
+    regressions = baseline_comparer(
+        results = results,
+        baselines = baselines,
+        tolerance = tolerance
+    )
+
+    bench_reporter(
+        results = results,
+        regressions = regressions
+    )
+
+    ## keep baselines of new sizes
+    if save or any(i not in baselines for i in results):
+        baseline_saver(
+            path = baseline_path,
+            baselines = dict(baselines, **(results if save else {i: j for i, j in results.items() if i not in baselines}))
+        )
+
+    if len(regressions) > 0:
+        raise SystemExit(1)
@@ -0,0 +1,144 @@
+## libraries
+import os
+import json
+import shutil
+import pandas as pd
+
+
+## checkpoint path
+def checkpoint_pather(checkpoint, anch_x):
+
+    """
+    Desc:
+        Determines the path of the checkpoint of anchor ID in 'anch_x' in
+        'checkpoint' directory.
+
+    Args:
+        checkpoint (str): Path to checkpoint directory.
+        anch_x (str): Anchor ID of link.
+
+    Returns:
+        str: Path to checkpoint file.
+
+    Raises:
+        None.
+    """
+
+    return os.path.join(
+        checkpoint,
+        anch_x + '.json'
+    )
+
+
+## save checkpoint of one anchor
+def checkpoint_saver(checkpoint, anch_x, data):
+
+    """
+    Desc:
+        Saves pre-processed rows of a single laboratory description to its own
+        checkpoint file as soon as it is scraped, so that they survive a failure
+        later in the website traversal. Written atomically, where an interrupted
+        write never leaves a partial checkpoint.
+
+    Args:
+        checkpoint (str): Path to checkpoint directory.
+        anch_x (str): Anchor ID of link.
+        data (df): Pre-processed rows.
+
+    Returns:
+        None.
+
+    Raises:
+        None.
+    """
+
+    os.makedirs(checkpoint, exist_ok = True)
+    path = checkpoint_pather(
+        checkpoint = checkpoint,
+        anch_x = anch_x
+    )
+
+    with open(path + '.tmp', 'w') as file:
+        json.dump({
+            'anchor': anch_x,
+            'columns': list(data.columns),
+            'rows': data.values.tolist()
+        }, file, ensure_ascii = False)
+
+    os.replace(path + '.tmp', path)
+
+
+## load checkpoints of finished anchors
+def checkpoint_loader(checkpoint, feats):
+
+    """
+    Desc:
+        Loads pre-processed rows of all laboratory descriptions finished by a
+        prior failed run from 'checkpoint' directory. Checkpoints with other
+        columns than 'feats' are ignored, as are unreadable or partial
+        checkpoint files, whose anchor ID's are scraped again.
+
+    Args:
+        checkpoint (str): Path to checkpoint directory.
+        feats (list): Columns as string values.
+
+    Returns:
+        dict: DataFrame per anchor ID.
+
+    Raises:
+        None.
+    """
+
+    done = dict()
+
+    if not os.path.isdir(checkpoint):
+        return done
+
+    for i in sorted(os.listdir(checkpoint)):
+        if not i.endswith('.json'):
+            continue
+
+        try:
+            with open(os.path.join(checkpoint, i), 'r') as file:
+                record = json.load(file)
+
+            if record['columns'] != list(feats):
+                continue
+
+            done[record['anchor']] = pd.DataFrame(
+                data = record['rows'],
+                columns = feats
+            )
+
+        ## partial or corrupt checkpoint
+        except (OSError, ValueError, KeyError, TypeError):
+            print('Cannot read checkpoint, skipping. Checkpoint: {x}'.format(
+                    x = i
+                )
+            )
+
+    return done
+
+
+## remove checkpoints
+def checkpoint_clearer(checkpoint):
+
+    """
+    Desc:
+        Removes all checkpoints in 'checkpoint' directory, either before a new
+        website traversal or after a finished one.
+
+    Args:
+        checkpoint (str): Path to checkpoint directory.
+
+    Returns:
+        None.
+
+    Raises:
+        None.
+    """
+
+    shutil.rmtree(
+        path = checkpoint,
+        ignore_errors = True
+    )
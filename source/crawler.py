@@ -0,0 +1,265 @@
+## libraries
+import os
+import json
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from driver import driver_pool
+from scraper import data_scraper
+from deduper import person_deduper
+from monitor import stage_timer
+
+
+## site settings when not in site config
+site_defaults = {
+    'anchors': {
+        'prefix': 'anch_',
+        'start': None,
+        'end': None
+    },
+    'backend': 'lxml',
+    'nav': 'index',
+    'workers': 1,
+    'limit': 8,
+    't': 12
+}
+
+
+## load site config
+def site_loader(path):
+
+    """
+    Desc:
+        Loads the declarative site config of institute directories to crawl,
+        where each site lists its entry URL, anchor discovery rules, XPaths,
+        extraction backend, and concurrency limits. Site names are used in
+        paths, and may not be empty or contain path separators. Missing
+        settings take their value from 'site_defaults'.
+
+    Args:
+        path (str): Path to site config file.
+
+    Returns:
+        list: Settings per site, in config order.
+
+    Raises:
+        ValueError: Unsupported site config version.
+        ValueError: Incorrect or missing site settings.
+    """
+
+    with open(path, 'r') as file:
+        config = json.load(file)
+
+    if config.get('version') != 1:
+        raise ValueError('Unsupported site config version.')
+
+    sites = list()
+
+    for i in config['sites']:
+        if not {'name', 'url', 'xpaths'} <= set(i):
+            raise ValueError("Site config requires 'name', 'url', and 'xpaths'.")
+
+        ## site name in state, snapshot, and checkpoint paths
+        if type(i['name']) is not str or i['name'] in ['', '.', '..'] or any(
+            j in i['name'] for j in ['/', '\\', os.sep]):
+            raise ValueError('Site config requires site names without path separators. Site: {x}'.format(
+                    x = i['name']
+                )
+            )
+
+        if not {'anch_a', 'anch_b', 'anch_c', 'anch_d'} <= set(i['xpaths']):
+            raise ValueError("Site config requires xpaths 'anch_a' to 'anch_d'. Site: {x}".format(
+                    x = i['name']
+                )
+            )
+
+        site = dict(site_defaults, **i)
+        site['anchors'] = dict(site_defaults['anchors'], **i.get('anchors', dict()))
+        sites.append(site)
+
+    names = [i['name'] for i in sites]
+
+    if len(set(names)) != len(names):
+        raise ValueError('Site config requires unique site names.')
+
+    return sites
+
+
+## crawl one site
+def site_crawler(site, feats, exe_path = None, opt = None, cache = None, store = None,
+    state = None, checkpoint = None, resume = False, lean = False, template = None,
+    pages = 50, rss = 1024, metrics = None):
+
+    """
+    Desc:
+        Subordinate crawling function. Scrapes one site from 'site_loader' with
+        'data_scraper', with at most 'workers' concurrent WebDrivers ('selenium'
+        backend) or 'limit' concurrent requests ('lxml' backend) for the site.
+        Cache, snapshot store, state, and checkpoints are kept per site, under
+        the site name in the specified paths. WebDrivers are shut down once the
+        site is crawled. If 'metrics' is specified, run metrics are labeled by
+        site name.
+
+    Args:
+        site (dict): Settings of site.
+        feats (tuple): Columns as string values.
+        exe_path (str): Path to GeckoDriver executable ('selenium' backend).
+        opt (list): Browser option flags ('selenium' backend).
+        cache (str): Path to cache directories (optional).
+        store (str): Path to snapshot store directories (optional).
+        state (str): Path to incremental state files (optional).
+        checkpoint (str): Path to checkpoint directories (optional).
+        resume (bool): Skip anchor ID's checkpointed by a prior failed run.
+        lean (bool): Lean browser profile ('selenium' backend).
+        template (str): Path to browser profile templates (optional).
+        pages (int): Max number of pages per browser before recycling.
+        rss (int): Max resident memory per browser before recycling (MB).
+        metrics (obj): Run metrics object (optional).
+
+    Returns:
+        DataFrame: 'Name', 'Education', 'Branch', 'Section' features.
+
+    Raises:
+        TypeError: Incorrect data type in an argument.
+        ValueError: Incorrect value in an argument.
+    """
+
+    ## per site paths
+    def site_pather(path, ext = ''):
+        if path is None:
+            return None
+
+        return os.path.join(path, site['name'] + ext)
+
+    ## webdriver initalization, started on first use
+    driver = None
+
+    if site['backend'] == 'selenium':
+        driver = driver_pool(
+            exe_path = exe_path,
+            opt = opt,
+            workers = site['workers'],
+            lean = lean,
+            template = site_pather(template),
+            pages = pages,
+            rss = rss
+        )
+
+        if site['workers'] == 1:
+            driver = driver[0]
+
+    if metrics is not None:
+        metrics = metrics.labeled(
+            site = site['name']
+        )
+
+    try:
+        with stage_timer(metrics, 'data_scraper'):
+            return data_scraper(
+                feats = feats,
+                driver = driver,
+                url = site['url'],
+                anch_a = site['anchors']['start'],
+                anch_b = site['anchors']['end'],
+                t = site['t'],
+                nav = site['nav'],
+                backend = site['backend'],
+                limit = site['limit'],
+                cache = site_pather(cache) if site['backend'] == 'lxml' else None,
+                store = site_pather(store),
+                state = site_pather(state, ext = '.json'),
+                batch = True,
+                checkpoint = site_pather(checkpoint),
+                resume = resume,
+                xpaths = site['xpaths'],
+                prefix = site['anchors']['prefix'],
+                metrics = metrics
+            )
+
+    ## webdriver shutdown and temp profile clean up
+    finally:
+        if site['backend'] == 'selenium':
+            for i in driver if type(driver) is list else [driver]:
+                i.quit()
+
+
+## crawl many sites
+def sites_crawler(sites, feats, concurrency = 2, dedupe = True, threshold = 0.85,
+    metrics = None, **kwargs):
+
+    """
+    Desc:
+        Primary crawling function. Crawls all sites from 'site_loader' with at
+        most 'concurrency' sites at once, each within its own concurrency
+        limits, and merges their results in config order into one data set. If
+        more than one site returns data, duplicate observations across sites
+        are removed, and if 'dedupe' is True, names of the same person across
+        sites are merged with 'person_deduper' at 'threshold' before. Data of
+        a single site is returned as scraped. A failed site is raised once all other
+        sites are crawled, where checkpoints allow resuming it. If 'metrics' is
+        specified, records run metrics of all sites.
+
+    Args:
+        sites (list): Settings per site.
+        feats (tuple): Columns as string values.
+        concurrency (int): Max number of sites crawled at once.
+        dedupe (bool): Merge names of the same person across sites.
+        threshold (float): Min similarity to merge names (0 to 1).
+        metrics (obj): Run metrics object (optional).
+        **kwargs: Passed to 'site_crawler'.
+
+    Returns:
+        DataFrame: 'Name', 'Education', 'Branch', 'Section' features.
+
+    Raises:
+        TypeError: Incorrect data type in an argument.
+        ValueError: Incorrect value in an argument.
+    """
+
+    ## arg quality
+    if type(concurrency) is not int or concurrency < 1:
+        raise TypeError('concurrency arg requires a pos int.')
+
+    if len(sites) == 0:
+        raise ValueError('sites arg requires at least one site.')
+
+    else:
+        pass
+
+    ## crawl sites concurrently
+    with ThreadPoolExecutor(max_workers = concurrency) as executor:
+        futures = [
+            executor.submit(site_crawler, site = i, feats = feats, metrics = metrics,
+                **kwargs) for i in sites
+        ]
+
+        data = [i.result() for i in futures]
+
+    ## sites with data
+    n_data = sum(len(i) > 0 for i in data)
+
+    ## merge sites
+    data = pd.concat(
+        objs = data,
+        ignore_index = True
+    )
+
+    ## same person across sites
+    if n_data > 1:
+        if dedupe:
+            with stage_timer(metrics, 'person_deduper'):
+                data = person_deduper(
+                    data = data,
+                    feat = feats[0],
+                    threshold = threshold
+                )
+
+        data.drop_duplicates(
+            inplace = True
+        )
+
+    data.reset_index(
+        drop = True,
+        inplace = True
+    )
+
+    return data
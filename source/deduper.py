@@ -0,0 +1,348 @@
+## libraries
+import re
+import unicodedata
+import numpy as np
+import pandas as pd
+from functools import lru_cache
+from namer import name_canonizer
+
+
+## soundex letter codes
+soundex_codes = {
+    **dict.fromkeys('bfpv', '1'),
+    **dict.fromkeys('cgjkqsxz', '2'),
+    **dict.fromkeys('dt', '3'),
+    'l': '4',
+    **dict.fromkeys('mn', '5'),
+    'r': '6'
+}
+
+
+## normalize names for comparison
+def name_normalizer(names):
+
+    """
+    Desc:
+        Normalizes full names for comparison across rosters. Removes accents,
+        case, and all characters but letters, hyphens, and single spaces.
+
+    Args:
+        names (series): Full name string values.
+
+    Returns:
+        Series: Normalized full name string values.
+
+    Raises:
+        None.
+    """
+
+    return names.map(
+        lambda x: unicodedata.normalize('NFKD', x).encode('ascii', 'ignore').decode('ascii')
+    ).str.casefold().str.replace(
+        pat = r"[^a-z\- ]",
+        repl = '',
+        regex = True
+    ).str.replace(
+        pat = ' +',
+        repl = ' ',
+        regex = True
+    ).str.strip()
+
+
+## phonetic code of surname
+@lru_cache(maxsize = None)
+def phonetic_coder(name):
+
+    """
+    Desc:
+        Determines the American Soundex code of a normalized surname, where
+        surnames that sound alike share a code, typically 'Smith' and 'Smyth'.
+
+    Args:
+        name (str): Normalized surname.
+
+    Returns:
+        str: Soundex code of four characters, or empty str without letters.
+
+    Raises:
+        None.
+    """
+
+    letters = re.sub('[^a-z]', '', name)
+
+    if len(letters) == 0:
+        return ''
+
+    code = letters[0].upper()
+    last = soundex_codes.get(letters[0], '')
+
+    for i in letters[1:]:
+        digit = soundex_codes.get(i, '')
+
+        ## vowels separate repeated codes, 'h' and 'w' do not
+        if digit != '' and digit != last:
+            code += digit
+
+        if i not in 'hw':
+            last = digit
+
+    return (code + '000')[:4]
+
+
+## bounded edit distance
+def distance_bounder(name_a, name_b, k):
+
+    """
+    Desc:
+        Determines the Levenshtein edit distance between two strings when it
+        is at most 'k'. Only a band of width 2k + 1 around the diagonal is
+        computed, and computation stops as soon as the bound is exceeded.
+
+    Args:
+        name_a (str): First string.
+        name_b (str): Second string.
+        k (int): Max edit distance.
+
+    Returns:
+        int: Edit distance, or 'k' + 1 when greater than 'k'.
+
+    Raises:
+        None.
+    """
+
+    n_a = len(name_a)
+    n_b = len(name_b)
+
+    if abs(n_a - n_b) > k:
+        return k + 1
+
+    out = k + 1
+    prior = [j if j <= k else out for j in range(0, n_b + 1)]
+
+    for i in range(1, n_a + 1):
+        row = [out] * (n_b + 1)
+        row[0] = i if i <= k else out
+
+        for j in range(max(1, i - k), min(n_b, i + k) + 1):
+            row[j] = min(
+                prior[j] + 1,
+                row[j - 1] + 1,
+                prior[j - 1] + (name_a[i - 1] != name_b[j - 1]),
+                out
+            )
+
+        if min(row) > k:
+            return out
+
+        prior = row
+
+    return min(prior[n_b], out)
+
+
+## blocking index of names
+def name_blocker(names, reap = 3, block_max = 500):
+
+    """
+    Desc:
+        Builds a blocking index of unique names, keyed on normalized given name
+        with either the first 'reap' letters of the surname or the phonetic
+        code of the surname. Only names sharing a block are paired, where the
+        number of pairs grows with block sizes rather than roster size. Blocks
+        with more than 'block_max' names are skipped.
+
+    Args:
+        names (series): Full name string values.
+        reap (int): Number of letters in surname prefix key.
+        block_max (int): Max number of names per block.
+
+    Returns:
+        DataFrame: Candidate pairs of names, 'name_a' and 'name_b'.
+
+    Raises:
+        None.
+    """
+
+    names = pd.Series(names.dropna().unique())
+    norms = name_normalizer(
+        names = names
+    )
+
+    tokens = norms.str.split()
+    given = tokens.str[0]
+    sir = tokens.str[-1]
+
+    keys = pd.DataFrame(
+        data = {
+            'name': names,
+            'prefix': given + ' ' + sir.str[0:reap],
+            'phonetic': given + ' ' + sir.fillna('').map(phonetic_coder)
+        }
+    ).dropna()
+
+    ## pairs within each block of both keys
+    pairs = list()
+
+    for i in ['prefix', 'phonetic']:
+        sizes = keys[i].map(keys[i].value_counts())
+
+        for j in keys[i][sizes > block_max].unique():
+            print('Block exceeds max number of names, skipping. Block: {x}'.format(
+                    x = j
+                )
+            )
+
+        block = keys[sizes.between(2, block_max)][['name', i]]
+        block = block.merge(
+            right = block,
+            on = i,
+            suffixes = ('_a', '_b')
+        )
+
+        pairs.append(block[block['name_a'] < block['name_b']][['name_a', 'name_b']])
+
+    return pd.concat(
+        objs = pairs
+    ).drop_duplicates().reset_index(
+        drop = True
+    )
+
+
+## merge decisions of candidate pairs
+def merge_decider(names, threshold = 0.85, reap = 3, block_max = 500):
+
+    """
+    Desc:
+        Scores candidate pairs of names from the blocking index by similarity
+        of their normalized full names, one minus the edit distance over the
+        length of the longer name. The edit distance is bounded by the most
+        edits still allowed by 'threshold', so dissimilar pairs stop early.
+        Pairs scoring at least 'threshold' are merged.
+
+    Args:
+        names (series): Full name string values.
+        threshold (float): Min similarity to merge a pair (0 to 1).
+        reap (int): Number of letters in surname prefix key.
+        block_max (int): Max number of names per block.
+
+    Returns:
+        DataFrame: Candidate pairs with 'distance', 'score', and 'merge'.
+
+    Raises:
+        ValueError: Incorrect value in argument.
+    """
+
+    ## arg quality
+    if not 0 < threshold <= 1:
+        raise ValueError('threshold arg requires a number between 0 and 1.')
+
+    else:
+        pass
+
+    pairs = name_blocker(
+        names = names,
+        reap = reap,
+        block_max = block_max
+    )
+
+    norm_a = name_normalizer(
+        names = pairs['name_a']
+    )
+
+    norm_b = name_normalizer(
+        names = pairs['name_b']
+    )
+
+    n_max = pd.concat([norm_a.str.len(), norm_b.str.len()], axis = 1).max(axis = 1)
+
+    ## most edits allowed, tolerant of float error at 'threshold'
+    bounds = np.floor((1 - threshold) * n_max + 1e-9).astype(int)
+
+    ## length difference alone exceeds bound
+    near = (norm_a.str.len() - norm_b.str.len()).abs() <= bounds
+
+    pairs['distance'] = bounds + 1
+    pairs.loc[near, 'distance'] = [
+        distance_bounder(
+            name_a = i,
+            name_b = j,
+            k = k
+        ) for i, j, k in zip(norm_a[near], norm_b[near], bounds[near])
+    ]
+
+    pairs['score'] = 1 - pairs['distance'] / n_max.clip(lower = 1)
+    pairs['merge'] = (pairs['distance'] <= bounds) & (pairs['score'] >= threshold - 1e-9)
+
+    return pairs
+
+
+## merge duplicate persons
+def person_deduper(data, feat, threshold = 0.85, reap = 3, block_max = 500):
+
+    """
+    Desc:
+        Addresses 'Name' feature. Merges names of the same person across
+        rosters. Merged pairs from 'merge_decider' are joined into groups,
+        where all names of a group take its canonical variant, the longest
+        name, then the most frequent. Removes duplicate observations.
+
+    Args:
+        data (df): A valid DataFrame.
+        feat (str): Target column, typically 'Name'.
+        threshold (float): Min similarity to merge a pair (0 to 1).
+        reap (int): Number of letters in surname prefix key.
+        block_max (int): Max number of names per block.
+
+    Returns:
+        DataFrame: Merged name string values in 'feat' column.
+
+    Raises:
+        ValueError: Incorrect value in argument.
+    """
+
+    pairs = merge_decider(
+        names = data[feat],
+        threshold = threshold,
+        reap = reap,
+        block_max = block_max
+    )
+
+    pairs = pairs[pairs['merge']]
+
+    ## join merged pairs into groups
+    group = dict()
+
+    def finder(i):
+        while i in group:
+            i = group[i]
+
+        return i
+
+    for i, j in zip(pairs['name_a'], pairs['name_b']):
+        root_a = finder(i)
+        root_b = finder(j)
+
+        if root_a != root_b:
+            group[max(root_a, root_b)] = min(root_a, root_b)
+
+    members = set(pairs['name_a']) | set(pairs['name_b'])
+    keys = data[feat].map(lambda x: finder(x) if x in members else None)
+
+    ## canonical variant per group
+    canon = keys.map(
+        name_canonizer(
+            names = data[feat],
+            keys = keys,
+            ranks = data[feat].str.len()
+        )
+    )
+
+    data[feat] = data[feat].where(
+        cond = canon.isna(),
+        other = canon
+    )
+
+    data.drop_duplicates(
+        inplace = True
+    )
+
+    return data
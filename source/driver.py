@@ -1,28 +1,75 @@
 ## libraries
+import os
+import json
+import shutil
+import psutil
+import threading
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from urllib3.exceptions import HTTPError
+from retrier import error_classifier
 from selenium.webdriver import FirefoxProfile
 from selenium.webdriver import FirefoxOptions
 
 
+## serialize template builds across webdrivers
+lock = threading.Lock()
+
+## lean browser preferences, text only
+lean_prefs = {
+
+    ## images and stylesheets
+    'permissions.default.image': 2,
+    'permissions.default.stylesheet': 2,
+
+    ## web fonts
+    'browser.display.use_document_fonts': 0,
+    'gfx.downloadable_fonts.enabled': False,
+
+    ## media autoplay
+    'media.autoplay.default': 5,
+    'media.autoplay.blocking_policy': 2,
+
+    ## prefetch and speculative connections
+    'network.prefetch-next': False,
+    'network.dns.disablePrefetch': True,
+    'network.http.speculative-parallel-limit': 0,
+    'network.predictor.enabled': False,
+
+    ## third-party trackers and cookies
+    'privacy.trackingprotection.enabled': True,
+    'privacy.trackingprotection.socialtracking.enabled': True,
+    'network.cookie.cookieBehavior': 1
+}
+
+
 ## make webdriver options
-def driver_options(opt):
+def driver_options(opt, strategy = None):
 
     """
     Desc:
-        Specifies Selenium WebDriver options for Firefox.
+        Specifies Selenium WebDriver options for Firefox. If 'strategy' is 
+        specified, sets the page load strategy (e.g. "eager" to return once 
+        the document is parsed, without waiting for subresources).
 
     Args:
         opt (list): Option string value flags (e.g. "--headless").
+        strategy (str): Page load strategy, either 'normal', 'eager', or 'none'.
 
     Returns:
         FirefoxOptions: Selenium WebDriver options object for Firefox.
 
     Raises:
         TypeError: Incorrect data type in argument.
+        ValueError: Incorrect value in argument.
     """
 
     ## arg quality
     if type(opt) is not list:
         raise TypeError('opt arg requires list of str.')
+
+    if strategy not in [None, 'normal', 'eager', 'none']:
+        raise ValueError("strategy arg requires either 'normal', 'eager', or 'none'.")
     
     else:
         pass
@@ -35,18 +82,82 @@ def driver_options(opt):
             argument = i
         )
 
+    ## page load strategy
+    if strategy is not None:
+        options.set_capability(
+            name = 'pageLoadStrategy',
+            value = strategy
+        )
+
     return options
 
 
-## make webdriver profile
-def driver_profile():
+## make webdriver profile template
+def driver_template(path, lean = False):
 
     """
     Desc:
-        Creates Selenium WebDriver profile for Firefox.
+        Creates a Firefox profile template directory in 'path', with its
+        preferences written to 'user.js'. Reused by 'driver_profile' on later
+        runs instead of building preferences for a new profile each time, and
+        rewritten when its preferences differ from those requested, such as a
+        template of a prior run with another 'lean' flag.
 
     Args:
+        path (str): Path to profile template directory.
+        lean (bool): Include lean browser preferences.
+
+    Returns:
+        str: Path to profile template directory.
+
+    Raises:
         None.
+    """
+
+    prefs = {'browser.startup.homepage': 'about.blank'}
+
+    if lean:
+        prefs.update(lean_prefs)
+
+    text = ''.join(
+        'user_pref({k}, {v});\n'.format(
+            k = json.dumps(i),
+            v = json.dumps(j)
+        ) for i, j in prefs.items()
+    )
+
+    with lock:
+
+        ## reuse pre-built template of same preferences
+        if os.path.exists(os.path.join(path, 'user.js')):
+            with open(os.path.join(path, 'user.js'), 'r') as file:
+                if file.read() == text:
+                    return path
+
+        os.makedirs(path, exist_ok = True)
+
+        with open(os.path.join(path, 'user.js.tmp'), 'w') as file:
+            file.write(text)
+
+        os.replace(os.path.join(path, 'user.js.tmp'), os.path.join(path, 'user.js'))
+
+    return path
+
+
+## make webdriver profile
+def driver_profile(lean = False, template = None):
+
+    """
+    Desc:
+        Creates Selenium WebDriver profile for Firefox. If 'lean' is True, 
+        disables images, web fonts, stylesheets, media autoplay, prefetch, and 
+        third-party trackers and cookies, as only text is read. If 'template' 
+        is specified, the profile is created from the pre-built profile 
+        template directory, built on first use.
+
+    Args:
+        lean (bool): Include lean browser preferences.
+        template (str): Path to profile template directory (optional).
 
     Returns:
         FirefoxProfile: Selenium WebDriver profile object for Firefox.
@@ -55,6 +166,15 @@ def driver_profile():
         None.
     """
 
+    ## firefox profile from template
+    if template is not None:
+        return FirefoxProfile(
+            profile_directory = driver_template(
+                path = template,
+                lean = lean
+            )
+        )
+
     ## firefox profile
     profile = FirefoxProfile()
 
@@ -63,5 +183,393 @@ def driver_profile():
         value = 'about.blank'
     )
 
+    if lean:
+        for i, j in lean_prefs.items():
+            profile.set_preference(
+                key = i,
+                value = j
+            )
+
     return profile
 
+
+## webdriver lifecycle
+class DriverManager:
+
+    """
+    Desc:
+        Owns start up and shut down of one Selenium WebDriver object for 
+        Firefox, built from 'driver_options' and 'driver_profile'. Recycles the 
+        browser after 'pages' number of web pages or when its resident memory 
+        exceeds 'rss', restarts it transparently when it crashes, and always 
+        removes its temporary profiles on shut down. Started on first use.
+
+    Args:
+        exe_path (str): Path to GeckoDriver executable.
+        opt (list): Option string value flags (e.g. "--headless").
+        lean (bool): Include lean browser preferences.
+        template (str): Path to profile template directory (optional).
+        pages (int): Number of web pages before recycling (None for no limit).
+        rss (int): Resident memory before recycling (MB, None for no limit).
+        restarts (int): Number of restarts per web page after a crash.
+
+    Raises:
+        TypeError: Incorrect data type in argument.
+    """
+
+    def __init__(self, exe_path, opt, lean = False, template = None, pages = 50,
+        rss = 1024, restarts = 2):
+
+        ## arg quality
+        if type(exe_path) is not str:
+            raise TypeError('exe_path arg requires a valid str.')
+
+        if pages is not None and (type(pages) is not int or pages < 1):
+            raise TypeError('pages arg requires a pos int or None.')
+
+        if rss is not None and (type(rss) not in [int, float] or rss <= 0):
+            raise TypeError('rss arg requires a pos number or None.')
+
+        else:
+            pass
+
+        self.exe_path = exe_path
+        self.opt = opt
+        self.lean = lean
+        self.template = template
+        self.pages = pages
+        self.rss = rss
+        self.restarts = restarts
+
+        self.driver = None
+        self.profiles = list()
+        self.n_pages = 0
+        self.n_recycles = 0
+        self.n_restarts = 0
+
+    ## start browser
+    def start(self):
+
+        """
+        Desc:
+            Starts a new browser with a new profile.
+
+        Args:
+            None.
+
+        Returns:
+            obj: Selenium WebDriver object.
+
+        Raises:
+            None.
+        """
+
+        profile = driver_profile(
+            lean = self.lean,
+            template = self.template
+        )
+
+        self.profiles.append(profile.path)
+
+        if profile.tempfolder is not None:
+            self.profiles.append(profile.tempfolder)
+
+        self.driver = webdriver.Firefox(
+            executable_path = self.exe_path,
+            firefox_profile = profile,
+            options = driver_options(
+                opt = self.opt,
+                strategy = 'eager' if self.lean else None
+            )
+        )
+
+        ## profile copied by geckodriver
+        for i in self.processes():
+            cmd = i.cmdline()
+            if '-profile' in cmd and cmd.index('-profile') + 1 < len(cmd):
+                self.profiles.append(cmd[cmd.index('-profile') + 1])
+
+        self.n_pages = 0
+
+        return self.driver
+
+    ## shut down browser
+    def quit(self):
+
+        """
+        Desc:
+            Shuts down the browser, kills any remaining browser processes, and
+            removes its temporary profiles.
+
+        Args:
+            None.
+
+        Returns:
+            None.
+
+        Raises:
+            None.
+        """
+
+        if self.driver is not None:
+            processes = self.processes()
+
+            try:
+                self.driver.quit()
+
+            except Exception as err:
+                print(err.args, 'Cannot quit WebDriver.')
+
+            for i in processes:
+                try:
+                    i.kill()
+
+                except psutil.Error:
+                    pass
+
+            self.driver = None
+
+        for i in self.profiles:
+            shutil.rmtree(i, ignore_errors = True)
+
+        self.profiles = list()
+
+    ## current browser
+    def get(self):
+
+        """
+        Desc:
+            Returns the current browser, starting it when not yet started.
+
+        Args:
+            None.
+
+        Returns:
+            obj: Selenium WebDriver object.
+
+        Raises:
+            None.
+        """
+
+        if self.driver is None:
+            return self.start()
+
+        return self.driver
+
+    ## recycle browser
+    def recycle(self):
+
+        """
+        Desc:
+            Shuts down the current browser and starts a new one.
+
+        Args:
+            None.
+
+        Returns:
+            obj: Selenium WebDriver object.
+
+        Raises:
+            None.
+        """
+
+        self.quit()
+
+        return self.start()
+
+    ## browser processes
+    def processes(self):
+
+        """
+        Desc:
+            Determines the GeckoDriver process and all of its child processes.
+
+        Args:
+            None.
+
+        Returns:
+            list: psutil process objects.
+
+        Raises:
+            None.
+        """
+
+        try:
+            parent = psutil.Process(self.driver.service.process.pid)
+            return [parent] + parent.children(recursive = True)
+
+        except (AttributeError, psutil.Error):
+            return list()
+
+    ## browser memory
+    def memory(self):
+
+        """
+        Desc:
+            Determines the resident memory of the GeckoDriver process and all of 
+            its child processes.
+
+        Args:
+            None.
+
+        Returns:
+            float: Resident memory (MB).
+
+        Raises:
+            None.
+        """
+
+        rss = 0
+
+        for i in self.processes():
+            try:
+                rss += i.memory_info().rss
+
+            except psutil.Error:
+                pass
+
+        return rss / 1024 ** 2
+
+    ## browser liveness
+    def alive(self):
+
+        """
+        Desc:
+            Determines if the browser still responds to WebDriver commands.
+
+        Args:
+            None.
+
+        Returns:
+            bool: True if browser responds.
+
+        Raises:
+            None.
+        """
+
+        if self.driver is None:
+            return False
+
+        try:
+            self.driver.current_url
+            return True
+
+        except (WebDriverException, HTTPError, ConnectionError):
+            return False
+
+    ## call with browser
+    def call(self, func):
+
+        """
+        Desc:
+            Calls 'func' with the current browser. Restarts the browser and 
+            calls 'func' again when the browser crashed. Afterwards, recycles 
+            the browser when its page or memory limit is reached.
+
+        Args:
+            func (func): Called with Selenium WebDriver object as only arg.
+
+        Returns:
+            obj: Return value of 'func'.
+
+        Raises:
+            RuntimeError: Max 'restarts' number of restarts reached.
+        """
+
+        i = 0
+
+        while True:
+            try:
+                result = func(self.get())
+                break
+
+            ## restart on crash
+            except (WebDriverException, HTTPError, ConnectionError) as err:
+                if error_classifier(err) or self.alive():
+                    raise
+
+                i += 1
+
+                if i > self.restarts:
+                    raise RuntimeError(
+                        'Browser crashed, now stopping. Max number of restarts.'
+                    ) from err
+
+                print('Browser crashed, restarting. Restart: {x}'.format(
+                        x = i
+                    )
+                )
+
+                self.n_restarts += 1
+                self.recycle()
+
+        ## recycle on page or memory limit
+        self.n_pages += 1
+
+        if (self.pages is not None and self.n_pages >= self.pages) or (
+            self.rss is not None and self.memory() > self.rss):
+
+            self.n_recycles += 1
+            self.recycle()
+
+        return result
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.quit()
+
+
+## make webdriver pool
+def driver_pool(exe_path, opt, workers, lean = False, template = None, pages = 50,
+    rss = 1024):
+
+    """
+    Desc:
+        Creates a pool of 'workers' lifecycle managers of Selenium WebDriver
+        objects for Firefox, one per worker. Each browser is started on first
+        use, where workers start their browsers concurrently. The profile
+        template is built once before. If 'lean' is True, browsers use lean
+        browser preferences and the eager page load strategy.
+
+    Args:
+        exe_path (str): Path to GeckoDriver executable.
+        opt (list): Option string value flags (e.g. "--headless").
+        workers (int): Number of WebDriver objects in pool.
+        lean (bool): Include lean browser preferences.
+        template (str): Path to profile template directory (optional).
+        pages (int): Number of web pages before recycling (None for no limit).
+        rss (int): Resident memory before recycling (MB, None for no limit).
+
+    Returns:
+        list: Lifecycle manager objects.
+
+    Raises:
+        TypeError: Incorrect data type in argument.
+    """
+
+    ## arg quality
+    if type(workers) is not int or workers < 1:
+        raise TypeError('workers arg requires a pos int.')
+
+    else:
+        pass
+
+    ## build template once before concurrent start up
+    if template is not None:
+        driver_template(
+            path = template,
+            lean = lean
+        )
+
+    return [
+        DriverManager(
+            exe_path = exe_path,
+            opt = opt,
+            lean = lean,
+            template = template,
+            pages = pages,
+            rss = rss
+        ) for i in range(0, workers)
+    ]
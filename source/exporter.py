@@ -1,15 +1,64 @@
 ## libraries
-from selenium import webdriver
-from driver import driver_options
-from driver import driver_profile
-from scraper import data_scraper
+import os
+from crawler import site_loader
+from crawler import sites_crawler
 from scraper import data_cleaner
+from writer import parquet_writer
+from writer import arrow_writer
+from grapher import import_writer
+from grapher import cypher_writer
+from monitor import RunMetrics
+from monitor import stage_timer
+from monitor import report_saver
+from monitor import textfile_saver
 
 
 ## -- local machine input -- ##
 exe_path = '/usr/local/bin/geckodriver'
 csv_path = '/usr/local/niaid-dir-org.csv'
 
+## columnar data set with dictionary encoded features, next to csv (None to disable)
+parquet_path = '/usr/local/niaid-dir-org.parquet'
+arrow_path = '/usr/local/niaid-dir-org.arrow'
+
+## neo4j-admin import files and batched cypher script of nodes and relationships (None to disable)
+import_path = '/usr/local/niaid-dir-import'
+
+## site config of institute directories, backend and concurrency per site
+## 'lxml' backend re-fetches unchanged pages with conditional requests, for incremental runs
+sites_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'sites.json')
+
+## number of sites crawled concurrently
+concurrency = 2
+
+## merge names of the same person across sites
+dedupe = True
+
+## cache for conditional requests per site ('lxml' only)
+cache_path = '/usr/local/niaid-dir-cache'
+
+## snapshot store of visited web pages per site, replayed with backend 'replay' (None to disable)
+store_path = '/usr/local/niaid-dir-snapshots'
+
+## incremental state of processed rows per anchor and site (None for full rebuild)
+state_path = '/usr/local/niaid-dir-state'
+
+## per anchor checkpoints, resumed after a failed run (None to disable)
+checkpoint_path = '/usr/local/niaid-dir-checkpoint'
+resume = True
+
+## lean browser profile, built once from template directory
+lean = True
+template_path = '/usr/local/niaid-dir-profile'
+
+## recycle browser after number of pages or resident memory (MB)
+recycle_pages = 50
+recycle_rss = 1024
+
+## run report and prometheus textfile of stage times, page load latency, and retries (None to disable)
+report_path = '/usr/local/niaid-dir-metrics/report.json'
+textfile_path = '/usr/local/niaid-dir-metrics/niaid_dir.prom'
+
 ## webdriver settings
 option_flags = [
     '--headless',
@@ -19,19 +68,6 @@ option_flags = [
     '--disable-extensions'
 ]
 
-options = driver_options(
-    opt = option_flags
-)
-
-profile = driver_profile()
-
-## webdriver initalization
-driver = webdriver.Firefox(
-    executable_path = exe_path,
-    firefox_profile = profile,
-    options = options
-)
-
 ## data features *strictly* named and ordered
 feats = tuple((
     'Name',
@@ -41,23 +77,83 @@ feats = tuple((
     )
 )
 
-## web scraping and processing
-data = data_scraper(
+## run metrics
+metrics = RunMetrics()
+
+## web scraping and processing of all sites
+data = sites_crawler(
+    sites = site_loader(
+        path = sites_path
+    ),
     feats = feats,
-    driver = driver,
-    url = 'https://www.niaid.nih.gov/research/division-intramural-research-labs',
-    t = 12
+    concurrency = concurrency,
+    dedupe = dedupe,
+    exe_path = exe_path,
+    opt = option_flags,
+    cache = cache_path,
+    store = store_path,
+    state = state_path,
+    checkpoint = checkpoint_path,
+    resume = resume,
+    lean = lean,
+    template = template_path,
+    pages = recycle_pages,
+    rss = recycle_rss,
+    metrics = metrics
 )
 
 ## data processing
-data = data_cleaner(
-    data = data,
-    feats = feats
-)
+with stage_timer(metrics, 'data_cleaner'):
+    data = data_cleaner(
+        data = data,
+        feats = feats
+    )
 
 ## data to disk
-data.to_csv(
-    path_or_buf = csv_path,
-    index = False
-)
+with stage_timer(metrics, 'exporter'):
+    data.to_csv(
+        path_or_buf = csv_path,
+        index = False
+    )
 
+    if parquet_path is not None:
+        parquet_writer(
+            data = data,
+            feats = feats,
+            path = parquet_path
+        )
+
+    if arrow_path is not None:
+        arrow_writer(
+            data = data,
+            feats = feats,
+            path = arrow_path
+        )
+
+## graph db bulk load files to disk
+if import_path is not None:
+    with stage_timer(metrics, 'grapher'):
+        import_writer(
+            data = data,
+            feats = feats,
+            path = import_path
+        )
+
+        cypher_writer(
+            data = data,
+            feats = feats,
+            path = os.path.join(import_path, 'int-pkg-batch.cql')
+        )
+
+## run metrics to disk
+if report_path is not None:
+    report_saver(
+        metrics = metrics,
+        path = report_path
+    )
+
+if textfile_path is not None:
+    textfile_saver(
+        metrics = metrics,
+        path = textfile_path
+    )
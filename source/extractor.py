@@ -1,18 +1,23 @@
 ## libraries
+import json
 import pandas as pd
 from selenium.webdriver.common.by import By
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from retrier import RetryPolicy
+from ruler import rule_loader
 
 
 ## navigation by link anchors
-def link_clicker(driver, url, anch_x, n, t):
+def link_clicker(driver, url, anch_x, n, t, policy = None):
 
     """ 
     Desc:
         Navigates to link in website specified by anchor ID in 'anch_x'. Makes 
         'n' number of web request attempts before time out failure with 't' load 
-        latency time. 
+        latency time. If 'policy' is specified, attempts, timeouts, and backoff
+        are derived from it instead.
 
     Args:
         url (str): URL of website.
@@ -20,6 +25,7 @@ def link_clicker(driver, url, anch_x, n, t):
         anch_x (int): Anchor ID of link.
         n (int): Number of web request attempts after first failure.
         t (int): Load latency of website (seconds).
+        policy (obj): Retry policy object (optional).
     
     Returns:
         None
@@ -28,6 +34,63 @@ def link_clicker(driver, url, anch_x, n, t):
         RuntimeError: Max 'n' number of attempts reached.
     """
 
+    ## retry policy
+    if policy is None:
+        policy = RetryPolicy(
+            n = n,
+            t = t
+        )
+
+    ## nav to link
+    def clicker(timeout):
+
+        ## get request url
+        driver.get(
+            url = url
+        )
+
+        ## load latency
+        wait = WebDriverWait(
+            driver = driver,
+            timeout = timeout
+        )
+
+        branch = wait.until(
+            method = EC.element_to_be_clickable(
+                locator = (By.ID, anch_x)
+            )
+        )
+        branch.click()
+
+    policy.call(
+        func = clicker,
+        stage = 'navigation',
+        page = anch_x
+    )
+
+
+## anchor index of link anchors
+def anchor_indexer(driver, url, t, prefix = 'anch_'):
+
+    """
+    Desc:
+        Reads all link anchors in website with an anchor ID prefixed with 
+        'prefix' and their URL's in one pass. Utilized to navigate directly to 
+        each link without reloading the website in 'url' for every anchor.
+
+    Args:
+        driver (obj): Selenium WebDriver object.
+        url (str): URL of website.
+        t (int): Load latency of website (seconds).
+        prefix (str): Prefix of anchor ID's.
+
+    Returns:
+        dict: URL of link per anchor ID, in website order.
+
+    Raises:
+        ValueError: No link anchors found in website.
+    """
+
     ## get request url
     driver.get(
         url = url
@@ -39,43 +102,196 @@ def link_clicker(driver, url, anch_x, n, t):
         timeout = t
     )
 
-    ## try n times
-    i = 1
+    wait.until(
+        method = EC.presence_of_element_located(
+            locator = (By.XPATH, '//*[starts-with(@id, {p})]'.format(p = json.dumps(prefix)))
+        )
+    )
+
+    ## anchor id and link url in one call
+    anchors = driver.execute_script(
+        """
+        var prefix = arguments[0];
+        return Array.from(document.querySelectorAll('[id]')).filter(
+            function (e) {
+                return e.id.startsWith(prefix);
+            }
+        ).map(
+            function (e) {
+                var a = e.href ? e : e.querySelector('a[href]');
+                return [e.id, a ? a.href : null];
+            }
+        );
+        """,
+        prefix
+    )
+
+    index = dict()
+
+    for i, j in anchors:
+        if j is not None and i not in index:
+            index[i] = j
+
+    if len(index) == 0:
+        raise ValueError('Could not find link anchors in website.')
+
+    return index
+
+
+## anchor range of link anchors
+def anchor_ranger(index, prefix = 'anch_'):
+
+    """
+    Desc:
+        Determines the anchor ID range of an anchor index from 'anchor_indexer'.
+
+    Args:
+        index (dict): URL of link per anchor ID.
+        prefix (str): Prefix of anchor ID's.
+
+    Returns:
+        tuple: Anchor ID at start and end of website traversal.
+
+    Raises:
+        ValueError: No numbered anchor ID's found in index.
+    """
+
+    anchors = [int(i[len(prefix):]) for i in index if i.startswith(prefix) and i[len(prefix):].isdigit()]
+
+    if len(anchors) == 0:
+        raise ValueError('Could not find numbered anchor IDs in index.')
+
+    return min(anchors), max(anchors) + 1
+
+
+## navigation by link url
+def link_navigator(driver, link, n, t, policy = None, xpath = '//h1'):
+
+    """
+    Desc:
+        Navigates directly to link URL in 'link', typically from an anchor 
+        index, and waits for the element in 'xpath' to load. Makes 'n' number 
+        of web request attempts before time out failure with 't' load latency 
+        time. If 'policy' is specified, attempts, timeouts, and backoff are 
+        derived from it instead.
+
+    Args:
+        driver (obj): Selenium WebDriver object.
+        link (str): URL of link.
+        n (int): Number of web request attempts after first failure.
+        t (int): Load latency of website (seconds).
+        policy (obj): Retry policy object (optional).
+        xpath (str): XPath of element loaded on link, typically 'anch_c'.
+
+    Returns:
+        None
+
+    Raises:
+        RuntimeError: Max 'n' number of attempts reached.
+    """
+
+    ## retry policy
+    if policy is None:
+        policy = RetryPolicy(
+            n = n,
+            t = t
+        )
 
     ## nav to link
-    while i < n:
-        try:
-            branch = wait.until(
-                method = EC.element_to_be_clickable(
-                    locator = (By.ID, anch_x)
-                )
-            )
-            branch.click()
-            break
-
-        ## try again on failure
-        except:
-            i += 1
-            print('Unsuccessful request, trying again. Attempt: {x}'.format(
-                    x = i
-                )
+    def navigator(timeout):
+        driver.get(
+            url = link
+        )
+
+        ## load latency
+        wait = WebDriverWait(
+            driver = driver,
+            timeout = timeout
+        )
+
+        wait.until(
+            method = EC.presence_of_element_located(
+                locator = (By.XPATH, xpath)
             )
+        )
+
+    policy.call(
+        func = navigator,
+        stage = 'navigation',
+        page = link
+    )
+
+
+## name and section splitting
+def people_splitter(people_all, people_sub):
+
+    """
+    Desc:
+        Subordinate function for splitting raw list item text into names and 
+        lab desc. Shared by all extraction backends. 'people_all' contains the 
+        text of all list items in the global web element, 'people_sub' the text
+        of all list items in the subset web element.
+
+    Args:
+        people_all (list): Strings of list items in global web element.
+        people_sub (list): Strings of list items in subset web element.
+
+    Returns:
+        list: List of lists containing strings of names and lab desc.
+
+    Raises:
+        ValueError: Cannot split strings.
+    """
+
+    ## global list to contain only names, edu, section/unit
+    people_all = [i for i in people_all if "\n" in i]
+
+    ## subset web element list to contain only names, edu, section/unit
+    people_sub = [i for i in people_sub if "\n" in i]
+
+    ## section/unit list
+    n = len(people_sub)
+    people_sec = people_all[n:]
+
+    people_sec_spt = list()
+    n = len(people_sec)
 
-            ## get request url again
-            driver.get(
-                url = url
+    for i in range(0, n):
+        try:
+            people_sec_spt.append(
+                [people_sec[i].split('\n')[1], people_sec[i].split('\n')[0]]
             )
-            pass
 
-        ## time out failure on too many attempts
-        if n == i:
-            raise RuntimeError(
-                'Unsuccessful request, now stopping. Max number of attempts.'
+        except ValueError as err:
+            print(err.args, 'Cannot split strings in Sections and Units element.')
+
+    ## branch list
+    people_sub_spt = list()
+    n = len(people_sub)
+
+    for i in range(0, n):
+        try:
+            people_sub_spt.append(
+                people_sub[i].split('\n')
             )
+        except ValueError as err:
+            print(err.args, 'Cannot split strings in People element.')
+
+    ## combined branch and section/unit list
+    people_all_spt = people_sec_spt + people_sub_spt
+
+    ## remove duplicates
+    for i in people_all_spt:
+        n = len(i)
+        if n > 2:
+            people_all_spt.remove(i)
+
+    return people_all_spt
 
 
 ## name and section data
-def name_section_extractor(driver, anch_a, anch_b, anch_c, anch_d, n, t):
+def name_section_extractor(driver, anch_a, anch_b, anch_c, anch_d, n, t,
+    policy = None):
 
     """
     Desc:
@@ -83,7 +299,8 @@ def name_section_extractor(driver, anch_a, anch_b, anch_c, anch_d, n, t):
         'Section' features. Makes 'n' number of web request attempts before 
         time out failure with 't' load latency time. Anchor ID's 'anch_a', 
         'anch_b', 'anch_c', 'anch_d' pre-specified from known information 
-        based on prior website inspection.
+        based on prior website inspection. If 'policy' is specified, attempts, 
+        timeouts, and backoff are derived from it instead.
 
     Args:
         driver (obj): Selenium WebDriver object.
@@ -93,6 +310,7 @@ def name_section_extractor(driver, anch_a, anch_b, anch_c, anch_d, n, t):
         anch_d (str): Anchor ID of link.
         n (int): Number of web request attempts after first failure.
         t (int): Load latency of website (seconds).
+        policy (obj): Retry policy object (optional).
 
     Returns:
         list: List of lists containing strings of names and lab desc.
@@ -102,147 +320,252 @@ def name_section_extractor(driver, anch_a, anch_b, anch_c, anch_d, n, t):
         RuntimeError: Max 'n' number of attempts reached. 
     """
 
-    ## load latency
-    wait = WebDriverWait(
-        driver = driver,
-        timeout = t
-    )
+    ## retry policy
+    if policy is None:
+        policy = RetryPolicy(
+            n = n,
+            t = t
+        )
 
-    ## try n times
-    i = 1
+    ## raw extraction
+    def extractor(timeout):
 
-    ## nav to link
-    while i < n:
-        try:
+        ## load latency
+        wait = WebDriverWait(
+            driver = driver,
+            timeout = timeout
+        )
 
-            ## -- multiple researcher profiles -- ##
-            ## contains branch and section/unit columns
-            try:
+        ## -- multiple researcher profiles -- ##
+        ## contains branch and section/unit columns
+        try:
 
-                ## global web elements
-                element_all = wait.until(
-                    method = EC.presence_of_element_located(
-                        locator = (By.XPATH, anch_a)
-                    )
+            ## global web elements
+            element_all = wait.until(
+                method = EC.presence_of_element_located(
+                    locator = (By.XPATH, anch_a)
                 )
+            )
 
-                ## global list
-                element_all_lst = element_all.find_elements_by_tag_name(
-                    name = "li"
+            ## subset web elements
+            element_sub = wait.until(
+                method = EC.presence_of_element_located(
+                    locator = (By.XPATH, anch_b)
                 )
+            )
 
-                people_all = list()
+        ## -- single researcher profile -- ##
+        ## does not contain branch and section/unit columns
+        except TimeoutException:
 
-                for i in element_all_lst:
-                    people_all.append(i.text)
+            ## name, edu, section/unit
+            people_all_spt = list()
+            string_all_spt = list()
 
-                ## global list to contain only names, edu, section/unit
-                people_all = [i for i in people_all if "\n" in i]
+            ## name, section/unit text
+            anchors = [
+                anch_c,
+                anch_d
+            ]
 
-                ## subset web elements
-                element_sub = wait.until(
+            n = len(anchors)
+
+            for i in range(0, n):
+                element_all = wait.until(
                     method = EC.presence_of_element_located(
-                        locator = (By.XPATH, anch_b)
+                        locator = (By.XPATH, anchors[i])
                     )
                 )
+                string_all_spt.insert(i, element_all.text)
 
-                ## subset web element list
-                element_sub_lst = element_sub.find_elements_by_tag_name(
-                    name = "li"
-                )
+            ## store list in list
+            people_all_spt.insert(0, string_all_spt)
+
+            return people_all_spt
+
+        ## global list
+        element_all_lst = element_all.find_elements_by_tag_name(
+            name = "li"
+        )
+
+        people_all = list()
 
-                people_sub = list()
+        for i in element_all_lst:
+            people_all.append(i.text)
 
-                for i in element_sub_lst:
-                    people_sub.append(i.text)
+        ## subset web element list
+        element_sub_lst = element_sub.find_elements_by_tag_name(
+            name = "li"
+        )
+
+        people_sub = list()
+
+        for i in element_sub_lst:
+            people_sub.append(i.text)
+
+        ## split names, edu, section/unit
+        return people_splitter(
+            people_all = people_all,
+            people_sub = people_sub
+        )
+
+    return policy.call(
+        func = extractor,
+        stage = 'extraction'
+    )
 
-                ## subset web element list to contain only names, edu, section/unit
-                people_sub = [i for i in people_sub if "\n" in i]
 
-                ## section/unit list
-                n = len(people_sub)
-                people_sec = people_all[n:]
+## rendered text normalization
+def text_normalizer(text):
 
-                people_sec_spt = list()
-                n = len(people_sec)
+    """
+    Desc:
+        Normalizes rendered text to the form returned by the 'text' attribute 
+        of a Selenium web element. Collapses whitespace within lines and 
+        removes empty lines.
 
-                for i in range(0, n):
-                    try:
-                        people_sec_spt.append(
-                            [people_sec[i].split('\n')[1], people_sec[i].split('\n')[0]]
-                        )
+    Args:
+        text (str): Rendered text.
 
-                    except ValueError as err:
-                        print(err.args, 'Cannot split strings in Sections and Units element.')
+    Returns:
+        str: Normalized rendered text.
 
-                ## branch list
-                people_sub_spt = list()
-                n = len(people_sub)
+    Raises:
+        None.
+    """
 
-                for i in range(0, n):
-                    try:
-                        people_sub_spt.append(
-                            people_sub[i].split('\n')
-                        )
-                    except ValueError as err:
-                        print(err.args, 'Cannot split strings in People element.')
+    lines = [' '.join(i.split()) for i in text.split('\n')]
 
-                ## combined branch and section/unit list
-                people_all_spt = people_sec_spt + people_sub_spt
+    return '\n'.join([i for i in lines if i])
 
-                ## remove duplicates
-                for i in people_all_spt:
-                    n = len(i)
-                    if n > 2:
-                        people_all_spt.remove(i)
 
-            ## -- single researcher profile -- ##
-            ## does not contain branch and section/unit columns
-            except:
+## raw text blocks in one round trip
+def block_extractor(driver, anch_a, anch_b, anch_c, anch_d, n, t, policy = None):
 
-                ## name, edu, section/unit
-                people_all_spt = list()
-                string_all_spt = list()
+    """
+    Desc:
+        Batched alternative to 'name_section_extractor' and 'branch_extractor'. 
+        Retrieves the text of every list item in 'anch_a' and 'anch_b', and the
+        text of 'anch_c' and 'anch_d', in one scripted WebDriver call instead 
+        of one call per web element. Waits with 't' load latency time and makes 
+        'n' number of attempts only when the web page is not yet loaded. If 
+        'policy' is specified, attempts, timeouts, and backoff are derived from 
+        it instead.
 
-                ## name, section/unit text
-                anchors = [
-                    anch_c,
-                    anch_d
-                ]
+    Args:
+        driver (obj): Selenium WebDriver object.
+        anch_a (str): Anchor ID of link.
+        anch_b (str): Anchor ID of link.
+        anch_c (str): Anchor ID of link.
+        anch_d (str): Anchor ID of link.
+        n (int): Number of web request attempts after first failure.
+        t (int): Load latency of website (seconds).
+        policy (obj): Retry policy object (optional).
 
-                n = len(anchors)
+    Returns:
+        dict: List item text in 'all' and 'sub', heading text in 'heading', 
+            and single profile text in 'single', None where not found.
 
-                for i in range(0, n):
-                    element_all = wait.until(
-                        method = EC.presence_of_element_located(
-                            locator = (By.XPATH, anchors[i])
-                        )
-                    )
-                    string_all_spt.insert(i, element_all.find_element_by_xpath(
-                            xpath = anchors[i]
-                        ).text
-                    )
+    Raises:
+        RuntimeError: Max 'n' number of attempts reached.
+    """
 
-                ## store list in list
-                people_all_spt.insert(0, string_all_spt)
+    ## all text blocks in one call
+    script = """
+        var node = function (x) {
+            return document.evaluate(
+                x, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+            ).singleNodeValue;
+        };
+        var items = function (e) {
+            return e ? Array.from(e.getElementsByTagName('li')).map(
+                function (i) { return i.innerText; }
+            ) : null;
+        };
+        var text = function (e) { return e ? e.innerText : null; };
+        return {
+            'all': items(node(arguments[0])),
+            'sub': items(node(arguments[1])),
+            'heading': text(node(arguments[2])),
+            'single': text(node(arguments[3]))
+        };
+    """
 
-            finally:
-                return people_all_spt
+    ## retry policy
+    if policy is None:
+        policy = RetryPolicy(
+            n = n,
+            t = t
+        )
 
-        ## try again on failure
-        except:
-            i += 1
-            print('Unsuccessful request to link, trying again. Attempt: {x}'.format(
-                    x = i
-                )
-            )
-            pass
+    ## web page loaded when heading found, first check without waiting
+    def loader(driver):
+        block = driver.execute_script(script, anch_a, anch_b, anch_c, anch_d)
 
-        ## time out failure on too many attempts
-        if n == i:
-            raise RuntimeError(
-                'Unsuccessful request, now stopping. Max number of attempts.'
-            )
+        if block['heading'] is None:
+            return False
+
+        return block
+
+    def extractor(timeout):
+        wait = WebDriverWait(
+            driver = driver,
+            timeout = timeout
+        )
+
+        return wait.until(
+            method = loader
+        )
+
+    block = policy.call(
+        func = extractor,
+        stage = 'extraction'
+    )
+
+    ## normalize rendered text
+    for j in ['all', 'sub']:
+        if block[j] is not None:
+            block[j] = [text_normalizer(k) for k in block[j]]
+
+    for j in ['heading', 'single']:
+        if block[j] is not None:
+            block[j] = text_normalizer(block[j])
+
+    return block
+
+
+## raw text block splitting
+def block_splitter(block):
+
+    """
+    Desc:
+        Splits raw text blocks from 'block_extractor' into names and lab desc,
+        equivalent to the list returned by 'name_section_extractor'.
+
+    Args:
+        block (dict): Raw text blocks of web page.
+
+    Returns:
+        list: List of lists containing strings of names and lab desc.
+
+    Raises:
+        None.
+    """
+
+    ## -- multiple researcher profiles -- ##
+    ## contains branch and section/unit columns
+    if block['all'] is not None and block['sub'] is not None:
+        return people_splitter(
+            people_all = block['all'],
+            people_sub = block['sub']
+        )
+
+    ## -- single researcher profile -- ##
+    ## does not contain branch and section/unit columns
+    if block['heading'] is None or block['single'] is None:
+        return list()
+
+    return [[block['heading'], block['single']]]
 
 
 ## name and section pre-processing
@@ -289,7 +612,10 @@ def name_educat_processor(data, feat_a, feat_b):
         Creates new 'Education' feature. Removes job title and family suffix 
         from values in 'feat_a'. Utilizes remaining substring values to move 
         specified education credentials to 'feat_b'. Duplicate values in 
-        'feat_a' will occure where there are multiple education credentials.
+        'feat_a' will occure where there are multiple education credentials. 
+        All credentials are found with one compiled pattern from the rules 
+        file, where each name keeps its last credential in place and rows for 
+        additional credentials are appended after all others.
 
     Args:
         data (df): A valid DataFrame.
@@ -303,63 +629,20 @@ def name_educat_processor(data, feat_a, feat_b):
         None.
     """
     
-    ## job title suffix
-    titles = [
-        'Chief',
-        'Director',
-        'Diplomate',
-        'Senior Investigator',
-        'Facility Veterinarian',
-        'FRCPA Staff Clinician',
-        'FRCPA',
-        'Diplomate ACLAM',
-        'ACLAM',
-        'FAAAAI',
-        'Acting',
-        'Associate',
-        'Staff Clinician'
-    ]
-
-    ## punctuation
-    puncs = [
-        ';',
-        ',',
-        '.'
-    ]
-
-    ## remove job title suffix and punctuation
-    remove = titles + puncs
+    ## compiled normalization rules
+    rules = rule_loader()
 
-    for i in remove:
-        data[feat_a] = data[feat_a].str.replace(
-            pat = i,
-            repl = '',
-            case = True,
-            regex = False
-        )
+    ## remove job title suffix and punctuation in one pass
+    data[feat_a] = data[feat_a].str.replace(
+        pat = rules['remove'],
+        repl = '',
+        regex = True
+    )
 
     ## remove leading and trailing whitespace
     for i in data.columns:
         data[i] = data[i].str.strip()
 
-    ## edu suffix
-    edu = [
-        'MA',
-        'MSc',
-        'MS',
-        'MHSc',
-        'MHS',
-        'MPVM',
-        'MPH',
-        'MD',
-        'ScD',
-        'DSc',
-        'DVM',
-        'DPhil',
-        'PhD',
-        'Dr rer nat'
-    ]
-
     ## make edu feature
     data.insert(
         loc = 1,
@@ -367,42 +650,55 @@ def name_educat_processor(data, feat_a, feat_b):
         value = None
     )
 
-    ## move edu from suffix to edu feature
-    n = len(data)
+    ## all edu credentials per name, one row each in edu order
+    found = data[feat_a].reset_index(drop = True).str.findall(
+        pat = rules['edu']
+    ).explode().dropna()
+
+    found = pd.DataFrame(
+        data = {
+            'pos': found.index,
+            feat_b: found.values,
+            'rank': found.map(rules['edu_rank']).values
+        }
+    ).drop_duplicates().sort_values(
+        by = ['pos', 'rank'],
+        kind = 'mergesort'
+    )
 
-    for i in range(0, n):
-        for j in edu:
-            if j in data[feat_a].iloc[i]:
-                data[feat_a].iloc[i] = data[feat_a].iloc[i].replace(j, '')
-                data[feat_a].iloc[i] = data[feat_a].iloc[i].replace('  ', ' ')
-                if data[feat_b].iloc[i] is None:
-                    data[feat_b].iloc[i] = j
-                else:
-                    data = data.append(data.iloc[i])
-                    data[feat_b].iloc[i] = None
-                    data[feat_b].iloc[i] = j
+    ## last credential stays in place, the others are appended in order
+    last = ~found['pos'].duplicated(keep = 'last')
 
-    ## assume credentials not listed
-    data[feat_b].fillna(
-        value = 'Other',
-        inplace = True
+    data[feat_b] = found[last].set_index('pos')[feat_b].reindex(
+        range(0, len(data))
+    ).values
+
+    data_add = data.iloc[found['pos'][~last].values].copy()
+    data_add[feat_b] = found[feat_b][~last].values
+
+    data = pd.concat(
+        objs = [data, data_add]
     )
 
-    ## remove duplicate edu
-    for i in edu:
-        data[feat_a] = data[feat_a].str.replace(
-            pat = i,
-            repl = '',
-            case = True,
-            regex = False
-        )
+    ## assume credentials not listed
+    data[feat_b] = data[feat_b].fillna(
+        value = 'Other'
+    )
 
-    ## remove parath
+    ## remove edu and parath from names
     data[feat_a] = data[feat_a].str.replace(
-            pat = r"\(.*\)",
-            repl = '',
-            regex = True
-        )
+        pat = rules['edu'],
+        repl = '',
+        regex = True
+    ).str.replace(
+        pat = r"\(.*\)",
+        repl = '',
+        regex = True
+    ).str.replace(
+        pat = ' +',
+        repl = ' ',
+        regex = True
+    )
 
     ## remove leading and trailing whitespace
     for i in data.columns:
@@ -417,14 +713,16 @@ def name_educat_processor(data, feat_a, feat_b):
 
 
 ## branch data and pre-processing
-def branch_extractor(driver, data, feat_a, feat_b, anch_c, t):
+def branch_extractor(driver, data, feat_a, feat_b, anch_c, t, heading = None):
 
     """
     Desc:
         Creates new 'Branch' feature. Utilizies web requests and DataFrame 
         referencing. For multiple researchers per 'feat_b', 'feat_a' will 
         contain different values than 'feat_b'. For one researcher per 'feat_b',
-        'feat_a' and 'feat_b' contain the same values.
+        'feat_a' and 'feat_b' contain the same values. If 'heading' is 
+        specified, it is used in place of a web request, typically from 
+        'block_extractor'.
 
     Args:
         driver (obj): Selenium WebDriver object.
@@ -433,6 +731,7 @@ def branch_extractor(driver, data, feat_a, feat_b, anch_c, t):
         feat_b (str): Target column, typically 'Branch'.
         anch_c (str): Anchor ID of link.
         t (int): Load latency of website (seconds).
+        heading (str): Heading text of web page (optional).
 
     Returns:
         Dataframe: Contains new 'feat_b' feature.
@@ -452,7 +751,10 @@ def branch_extractor(driver, data, feat_a, feat_b, anch_c, t):
     n = len(data)
 
     ## multiple researchers
-    if n > 1:
+    if n > 1 and heading is not None:
+        feat_branch = heading
+
+    elif n > 1:
         try:
             element = wait.until(
                 method = EC.presence_of_element_located(
@@ -460,9 +762,7 @@ def branch_extractor(driver, data, feat_a, feat_b, anch_c, t):
                 )
             )
 
-            feat_branch = element.find_element_by_xpath(
-                xpath = anch_c
-            ).text
+            feat_branch = element.text
 
         except ValueError as err:
             print(err.args, 'Cannot find heading.')
@@ -491,7 +791,8 @@ def section_processor(data, feat_a, feat_b):
         Addresses 'Section' feature. Modifies string values to observations in 
         'feat_a' by including the corresponding string values found in 'feat_b' 
         if there are duplicate values in 'feat_a', where the values found in 
-        'feat_b' are different.
+        'feat_b' are different. Sections with different values in 'feat_b' 
+        are found in one grouped pass and annotated at once.
 
     Args:
         data (df): A valid DataFrame.
@@ -505,24 +806,19 @@ def section_processor(data, feat_a, feat_b):
         None.
     """
 
-    ## add parenth for matching sections with different branch
-    mix_sec = list()
-
-    for i in data[feat_a].unique():
-        if len(data[data[feat_a] == i][feat_b].unique()) > 1:
-            mix_sec.append(i)
-
-    for i in mix_sec:
-        data_sec = data[data[feat_a] == i].copy()
-        n = len(data_sec)
-        for j in range(0, n):
-            name_sec = (
-                data_sec[feat_a].iloc[j] + ' ' + '(' + data_sec[feat_b].iloc[j] + ')'
-            )
-            data_sec[feat_a].iloc[j] = name_sec
+    ## matching sections with different branch, in one grouped pass
+    n_branch = data.groupby(
+        by = feat_a
+    )[feat_b].nunique(
+        dropna = False
+    )
 
-        data.update(
-            other = data_sec
+    mix_sec = data[feat_a].map(n_branch) > 1
+
+    ## add parenth for matching sections with different branch
+    if mix_sec.any():
+        data.loc[mix_sec, feat_a] = (
+            data.loc[mix_sec, feat_a] + ' ' + '(' + data.loc[mix_sec, feat_b] + ')'
         )
 
     ## reindex data
@@ -532,4 +828,3 @@ def section_processor(data, feat_a, feat_b):
     )
 
     return data
-
@@ -0,0 +1,350 @@
+## libraries
+import os
+import json
+import time
+import asyncio
+import hashlib
+import aiohttp
+from reader import headers
+from retrier import RetryPolicy
+from monitor import page_recorder
+
+
+## load conditional request validators
+def validator_loader(cache):
+
+    """
+    Desc:
+        Loads conditional request validators ('ETag' and 'Last-Modified') of
+        previously fetched web pages from 'cache' directory.
+
+    Args:
+        cache (str): Path to cache directory.
+
+    Returns:
+        dict: Validators per URL.
+
+    Raises:
+        None.
+    """
+
+    path = os.path.join(cache, 'validators.json')
+
+    if not os.path.exists(path):
+        return dict()
+
+    with open(path, 'r') as file:
+        return json.load(file)
+
+
+## save conditional request validators
+def validator_saver(cache, validators):
+
+    """
+    Desc:
+        Saves conditional request validators ('ETag' and 'Last-Modified') of
+        fetched web pages to 'cache' directory.
+
+    Args:
+        cache (str): Path to cache directory.
+        validators (dict): Validators per URL.
+
+    Returns:
+        None.
+
+    Raises:
+        None.
+    """
+
+    os.makedirs(cache, exist_ok = True)
+    path = os.path.join(cache, 'validators.json')
+
+    with open(path + '.tmp', 'w') as file:
+        json.dump(validators, file, indent = 1, sort_keys = True)
+
+    os.replace(path + '.tmp', path)
+
+
+## cached body path
+def body_pather(cache, url):
+
+    """
+    Desc:
+        Determines the path of the cached body of a web page in 'cache'
+        directory by its URL.
+
+    Args:
+        cache (str): Path to cache directory.
+        url (str): URL of web page.
+
+    Returns:
+        str: Path to cached body.
+
+    Raises:
+        None.
+    """
+
+    return os.path.join(
+        cache,
+        'pages',
+        hashlib.sha1(url.encode('utf-8')).hexdigest() + '.html'
+    )
+
+
+## fetch one web page
+async def page_fetcher(session, url, sem, policy, validators, cache, metrics = None,
+    page = None):
+
+    """
+    Desc:
+        Fetches web page in 'url' over a pooled keep-alive HTTP session with
+        at most as many concurrent requests as allowed by 'sem'. Sends
+        'If-None-Match' and 'If-Modified-Since' when the web page is cached,
+        and reuses the cached body when the server responds not modified.
+        Attempts, timeouts, and backoff are derived from 'policy' with
+        'acall', where only transient errors are retried and other errors are
+        raised at once, and 'sem' is only held during attempts. If
+        'metrics' is specified, records the load latency of the web page under
+        'page'.
+
+    Args:
+        session (obj): aiohttp HTTP session object.
+        url (str): URL of web page.
+        sem (obj): asyncio semaphore bounding concurrent requests.
+        policy (obj): Retry policy object.
+        validators (dict): Validators per URL, updated in place.
+        cache (str): Path to cache directory (optional).
+        metrics (obj): Run metrics object (optional).
+        page (str): Page key of web page, typically anchor ID (optional).
+
+    Returns:
+        tuple: URL and body of web page.
+
+    Raises:
+        RuntimeError: Max 'n' number of attempts reached.
+    """
+
+    ## conditional request headers
+    request_headers = dict()
+    path = None
+
+    if cache is not None:
+        path = body_pather(
+            cache = cache,
+            url = url
+        )
+
+        if url in validators and os.path.exists(path):
+            if validators[url].get('etag') is not None:
+                request_headers['If-None-Match'] = validators[url]['etag']
+
+            if validators[url].get('modified') is not None:
+                request_headers['If-Modified-Since'] = validators[url]['modified']
+
+    ## web request attempt
+    async def requester(timeout):
+        start = time.perf_counter()
+
+        async with session.get(url, headers = request_headers,
+            timeout = aiohttp.ClientTimeout(total = timeout)) as response:
+
+            ## not modified since last fetch
+            if response.status == 304:
+                with open(path, 'rb') as file:
+                    return file.read(), time.perf_counter() - start
+
+            response.raise_for_status()
+            body = await response.read()
+
+            ## keep body and validators for next fetch
+            if cache is not None:
+                os.makedirs(os.path.dirname(path), exist_ok = True)
+                with open(path, 'wb') as file:
+                    file.write(body)
+
+                validators[url] = {
+                    'etag': response.headers.get('ETag'),
+                    'modified': response.headers.get('Last-Modified')
+                }
+
+            return body, time.perf_counter() - start
+
+    body, latency = await policy.acall(
+        func = requester,
+        stage = 'fetch',
+        page = url,
+        sem = sem
+    )
+
+    page_recorder(
+        metrics = metrics,
+        page = page or url,
+        latency = latency
+    )
+
+    return url, body
+
+
+## stream web pages as they arrive
+async def page_streamer(urls, limit, n, t, cache = None, metrics = None,
+    keys = None, policy = None):
+
+    """
+    Desc:
+        Fetches all web pages in 'urls' concurrently over one pooled keep-alive
+        HTTP session, with at most 'limit' concurrent requests. Yields each web
+        page as soon as it arrives, not in the order of 'urls'. If 'policy' is
+        specified, attempts, timeouts, and backoff are derived from it instead
+        of 'n' and 't'. If 'metrics' is specified, records load latency per
+        web page, keyed by 'keys'.
+
+    Args:
+        urls (list): URL's of web pages.
+        limit (int): Max number of concurrent requests.
+        n (int): Number of web request attempts after first failure.
+        t (int): Load latency of website (seconds).
+        cache (str): Path to cache directory for conditional requests (optional).
+        metrics (obj): Run metrics object (optional).
+        keys (dict): Page key per URL, typically anchor ID (optional).
+        policy (obj): Retry policy object (optional).
+
+    Yields:
+        tuple: URL and body of web page.
+
+    Raises:
+        RuntimeError: Max 'n' number of attempts reached.
+    """
+
+    validators = dict()
+
+    if keys is None:
+        keys = dict()
+
+    ## retry policy
+    if policy is None:
+        policy = RetryPolicy(
+            n = n,
+            t = t
+        )
+
+    if cache is not None:
+        validators = validator_loader(
+            cache = cache
+        )
+
+    sem = asyncio.Semaphore(limit)
+    connector = aiohttp.TCPConnector(
+        limit = limit
+    )
+
+    timeout = aiohttp.ClientTimeout(
+        total = t
+    )
+
+    async with aiohttp.ClientSession(connector = connector, timeout = timeout,
+        headers = headers) as session:
+
+        tasks = [
+            asyncio.ensure_future(
+                page_fetcher(
+                    session = session,
+                    url = i,
+                    sem = sem,
+                    policy = policy,
+                    validators = validators,
+                    cache = cache,
+                    metrics = metrics,
+                    page = keys.get(i)
+                )
+            ) for i in urls
+        ]
+
+        try:
+            for i in asyncio.as_completed(tasks):
+                yield await i
+
+        finally:
+            for i in tasks:
+                i.cancel()
+
+            if cache is not None:
+                validator_saver(
+                    cache = cache,
+                    validators = validators
+                )
+
+
+## fetch web pages and hand them over as they arrive
+def pages_fetcher(urls, handler, limit = 8, n = 3, t = 30, cache = None,
+    metrics = None, keys = None, policy = None):
+
+    """
+    Desc:
+        Primary fetching function. Fetches all web pages in 'urls' concurrently
+        and calls 'handler' on each web page as soon as it arrives, so that
+        extraction overlaps with fetching. Duplicate URL's are fetched once. If
+        'policy' is specified, attempts, timeouts, and backoff are derived from
+        it instead of 'n' and 't', and its retries are left to its owner. If
+        'metrics' is specified, records load latency per web page, keyed by
+        'keys', and retries.
+
+    Args:
+        urls (list): URL's of web pages.
+        handler (func): Called with URL and body of each web page.
+        limit (int): Max number of concurrent requests.
+        n (int): Number of web request attempts after first failure.
+        t (int): Load latency of website (seconds).
+        cache (str): Path to cache directory for conditional requests (optional).
+        metrics (obj): Run metrics object (optional).
+        keys (dict): Page key per URL, typically anchor ID (optional).
+        policy (obj): Retry policy object (optional).
+
+    Returns:
+        dict: Return value of 'handler' per URL.
+
+    Raises:
+        TypeError: Incorrect data type in argument.
+        RuntimeError: Max 'n' number of attempts reached.
+    """
+
+    ## arg quality
+    if type(limit) is not int or limit < 1:
+        raise TypeError('limit arg requires a pos int.')
+
+    else:
+        pass
+
+    results = dict()
+
+    ## retry policy, retries counted here
+    owned = policy is None
+
+    if owned:
+        policy = RetryPolicy(
+            n = n,
+            t = t
+        )
+
+    async def stream_handler():
+        async for url, body in page_streamer(
+            urls = list(dict.fromkeys(urls)),
+            limit = limit,
+            n = n,
+            t = t,
+            cache = cache,
+            metrics = metrics,
+            keys = keys,
+            policy = policy
+            ):
+
+            results[url] = handler(url, body)
+
+    try:
+        asyncio.run(stream_handler())
+
+    finally:
+        if owned and metrics is not None:
+            metrics.count('retries', policy.retries)
+            metrics.count('wait_seconds', policy.waited)
+
+    return results
@@ -0,0 +1,256 @@
+## libraries
+import os
+import json
+import hashlib
+import pandas as pd
+
+
+## node labels of data features *strictly* by feature order
+graph_labels = [
+    'NAME',
+    'EDUCATION',
+    'BRANCH',
+    'SECTION'
+]
+
+## relationships between data features by feature order
+graph_rels = [
+    (0, 'HAS', 1),
+    (0, 'BELONGS_TO', 3),
+    (3, 'PART_OF', 2)
+]
+
+
+## stable node id
+def node_ider(label, name):
+
+    """
+    Desc:
+        Determines the stable ID of a node from its label and name, the first
+        16 hex digits of their SHA-1 hash. The same node has the same ID in
+        every build of the data set.
+
+    Args:
+        label (str): Node label.
+        name (str): Node name.
+
+    Returns:
+        str: Node ID.
+
+    Raises:
+        None.
+    """
+
+    return hashlib.sha1(
+        '{l}:{n}'.format(l = label, n = name).encode('utf-8')
+    ).hexdigest()[:16]
+
+
+## nodes and relationships
+def graph_maker(data, feats):
+
+    """
+    Desc:
+        Makes the deduplicated nodes and relationships of the data set, as
+        created per row by the integration query ('/queries/int-pkg.cql').
+        Each distinct name, credential, branch, and section is one node, and
+        each distinct pair one relationship, where missing values are dropped.
+
+    Args:
+        data (df): A valid DataFrame.
+        feats (tuple): Columns as string values.
+
+    Returns:
+        tuple: Nodes DataFrame ('id', 'Name') per label, and relationships
+            DataFrame ('start', 'end') per type, in dicts.
+
+    Raises:
+        None.
+    """
+
+    nodes = dict()
+
+    for i, j in zip(feats, graph_labels):
+        names = pd.Series(data[i].dropna().astype(str).unique())
+        nodes[j] = pd.DataFrame(
+            data = {
+                'id': names.map(lambda x: node_ider(label = j, name = x)),
+                'Name': names
+            }
+        ).sort_values(
+            by = 'Name'
+        ).reset_index(
+            drop = True
+        )
+
+    rels = dict()
+
+    for a, rel, b in graph_rels:
+        pairs = data[[feats[a], feats[b]]].dropna().astype(str).drop_duplicates()
+        rels[rel] = pd.DataFrame(
+            data = {
+                'start': pairs[feats[a]].map(lambda x: node_ider(label = graph_labels[a], name = x)),
+                'end': pairs[feats[b]].map(lambda x: node_ider(label = graph_labels[b], name = x)),
+                'start_name': pairs[feats[a]],
+                'end_name': pairs[feats[b]]
+            }
+        ).sort_values(
+            by = ['start_name', 'end_name']
+        ).reset_index(
+            drop = True
+        )
+
+    return nodes, rels
+
+
+## neo4j-admin import files
+def import_writer(data, feats, path):
+
+    """
+    Desc:
+        Writes node and relationship files of the data set in 'neo4j-admin
+        import' format to 'path' directory, one file per label and type with
+        a header line, and the import command in 'neo4j-admin-import.sh'.
+        Node ID's are stable across builds, within one ID space per label.
+        'neo4j-admin import' builds a new database, typically together with
+        the PKG dumps, where 'cypher_writer' adds the data set to an existing
+        PKG Graph DB.
+
+    Args:
+        data (df): A valid DataFrame.
+        feats (tuple): Columns as string values.
+        path (str): Path to import directory.
+
+    Returns:
+        None.
+
+    Raises:
+        None.
+    """
+
+    os.makedirs(path, exist_ok = True)
+
+    nodes, rels = graph_maker(
+        data = data,
+        feats = feats
+    )
+
+    args = list()
+
+    for i, j in nodes.items():
+        file = 'nodes-{x}.csv'.format(x = i.lower())
+        j[['id', 'Name']].assign(label = i).rename(
+            columns = {
+                'id': 'id:ID({x})'.format(x = i),
+                'label': ':LABEL'
+            }
+        ).to_csv(
+            path_or_buf = os.path.join(path, file),
+            index = False
+        )
+
+        args.append('--nodes={l}=import/{f}'.format(l = i, f = file))
+
+    for a, rel, b in graph_rels:
+        file = 'rels-{x}.csv'.format(x = rel.lower().replace('_', '-'))
+        rels[rel][['start', 'end']].assign(rel = rel).rename(
+            columns = {
+                'start': ':START_ID({x})'.format(x = graph_labels[a]),
+                'end': ':END_ID({x})'.format(x = graph_labels[b]),
+                'rel': ':TYPE'
+            }
+        ).to_csv(
+            path_or_buf = os.path.join(path, file),
+            index = False
+        )
+
+        args.append('--relationships={r}=import/{f}'.format(r = rel, f = file))
+
+    with open(os.path.join(path, 'neo4j-admin-import.sh'), 'w') as file:
+        file.write('#!/bin/bash\nneo4j-admin import --database=${1:-neo4j} \\\n    ' + ' \\\n    '.join(args) + '\n')
+
+
+## batched cypher statements
+def cypher_writer(data, feats, path, batch = 1000):
+
+    """
+    Desc:
+        Writes the Cypher script adding the data set to an existing PKG Graph
+        DB, as a fallback to 'import_writer'. Creates a uniqueness constraint
+        on 'Name' per label, then merges nodes and relationships in 'UNWIND'
+        batches of at most 'batch' rows, where each node and relationship is
+        merged once. Nodes carry their stable ID in property 'id'. Run with
+        'cypher-shell -f'.
+
+    Args:
+        data (df): A valid DataFrame.
+        feats (tuple): Columns as string values.
+        path (str): Path to Cypher script.
+        batch (int): Max number of rows per statement.
+
+    Returns:
+        None.
+
+    Raises:
+        TypeError: Incorrect data type in argument.
+    """
+
+    ## arg quality
+    if type(batch) is not int or batch < 1:
+        raise TypeError('batch arg requires a pos int.')
+
+    else:
+        pass
+
+    nodes, rels = graph_maker(
+        data = data,
+        feats = feats
+    )
+
+    ## cypher literal of rows
+    def rower(rows, keys):
+        return '[' + ', '.join(
+            '{' + ', '.join(
+                '{k}: {v}'.format(k = k, v = json.dumps(v)) for k, v in zip(keys, i)
+            ) + '}' for i in rows
+        ) + ']'
+
+    lines = ['// integrate niaid data into pkg, batched', '']
+
+    for i in graph_labels:
+        lines.append('CREATE CONSTRAINT {x}_name IF NOT EXISTS ON (n:{y}) ASSERT n.Name IS UNIQUE;'.format(
+                x = i.lower(),
+                y = i
+            )
+        )
+
+    lines.append('')
+
+    for i, j in nodes.items():
+        rows = list(zip(j['id'], j['Name']))
+
+        for k in range(0, len(rows), batch):
+            lines.append('UNWIND {r} AS i\nMERGE (n:{l} {{Name: i.Name}})\nSET n.id = i.id;\n'.format(
+                    r = rower(rows[k:k + batch], ['id', 'Name']),
+                    l = i
+                )
+            )
+
+    for a, rel, b in graph_rels:
+        rows = list(zip(rels[rel]['start_name'], rels[rel]['end_name']))
+
+        for k in range(0, len(rows), batch):
+            lines.append(('UNWIND {r} AS i\nMATCH (a:{la} {{Name: i.a}})\nMATCH (b:{lb} {{Name: i.b}})\n'
+                'MERGE (a)-[:{t}]->(b);\n').format(
+                    r = rower(rows[k:k + batch], ['a', 'b']),
+                    la = graph_labels[a],
+                    lb = graph_labels[b],
+                    t = rel
+                )
+            )
+
+    if os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok = True)
+
+    with open(path, 'w') as file:
+        file.write('\n'.join(lines))
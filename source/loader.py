@@ -0,0 +1,338 @@
+## libraries
+import os
+import json
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+
+## stream dump file
+def dump_reader(path, cols, chunk = 10 ** 6):
+
+    """
+    Desc:
+        Streams the columns 'cols' of a PKG dump file (CSV, or TSV by '.tsv'
+        extension) as strings, in chunks of 'chunk' rows.
+
+    Args:
+        path (str): Path to dump file.
+        cols (list): Columns to read.
+        chunk (int): Number of rows per chunk.
+
+    Yields:
+        DataFrame: Chunk of dump file.
+
+    Raises:
+        None.
+    """
+
+    for i in pd.read_csv(path, sep = '\t' if path.endswith('.tsv') else ',',
+        usecols = cols, dtype = str, chunksize = chunk):
+
+        yield i.dropna()
+
+
+## dense integer ids
+def key_ider(keys, index):
+
+    """
+    Desc:
+        Maps string keys to dense int32 ID's, where keys not yet in 'index'
+        take the next free ID's in order of first appearance. 'index' is
+        updated in place, so that ID's stay the same across chunks and files.
+
+    Args:
+        keys (series): Key string values.
+        index (dict): ID per key of one label.
+
+    Returns:
+        array: ID per key (int32).
+
+    Raises:
+        None.
+    """
+
+    return np.fromiter(
+        (index.setdefault(i, len(index)) for i in keys),
+        dtype = np.int32,
+        count = len(keys)
+    )
+
+
+## csr adjacency
+def csr_maker(starts, ends, n):
+
+    """
+    Desc:
+        Makes the compressed sparse row (CSR) adjacency of edges, where each
+        distinct edge is kept once and neighbors are sorted by ID.
+
+    Args:
+        starts (array): Start ID per edge (int32).
+        ends (array): End ID per edge (int32).
+        n (int): Number of start ID's.
+
+    Returns:
+        tuple: Row pointers (int64) and neighbor ID's (int32).
+
+    Raises:
+        None.
+    """
+
+    ## sort and dedupe edges as one int64 key
+    edges = np.unique(
+        starts.astype(np.int64) << 32 | ends.astype(np.int64)
+    )
+
+    counts = np.bincount(
+        (edges >> 32).astype(np.int64),
+        minlength = n
+    )
+
+    indptr = np.zeros(n + 1, dtype = np.int64)
+    np.cumsum(counts, out = indptr[1:])
+
+    return indptr, (edges & 0xFFFFFFFF).astype(np.int32)
+
+
+## load pkg dumps into csr graph
+def graph_loader(rels, path, chunk = 10 ** 6):
+
+    """
+    Desc:
+        Primary loading function. Streams the relationship dumps in 'rels' in
+        chunks, maps their string keys to dense int32 ID's per node label, and
+        saves each relationship type as an on-disk CSR adjacency in 'path'
+        directory. Only int32 ID's of edges are held in memory while reading.
+        ID's are shared by all relationship types of a label, so that
+        traversals chain across types. Saves keys per label in ID order, and
+        a 'graph.json' of labels and relationship types.
+
+    Args:
+        rels (list): Relationship types, each a dict of 'type', 'path' of dump
+            file, 'start' and 'end' key columns, and 'start_label' and
+            'end_label' node labels.
+        path (str): Path to graph directory.
+        chunk (int): Number of rows per chunk.
+
+    Returns:
+        dict: Number of nodes per label and edges per relationship type.
+
+    Raises:
+        ValueError: Duplicate relationship types.
+    """
+
+    ## arg quality
+    if len({i['type'] for i in rels}) != len(rels):
+        raise ValueError('rels arg requires unique relationship types.')
+
+    else:
+        pass
+
+    os.makedirs(path, exist_ok = True)
+
+    ## string keys to ids, per label
+    index = dict()
+    edges = dict()
+
+    for i in rels:
+        starts = list()
+        ends = list()
+
+        for j in dump_reader(
+            path = i['path'],
+            cols = [i['start'], i['end']],
+            chunk = chunk
+            ):
+
+            starts.append(
+                key_ider(
+                    keys = j[i['start']],
+                    index = index.setdefault(i['start_label'], dict())
+                )
+            )
+
+            ends.append(
+                key_ider(
+                    keys = j[i['end']],
+                    index = index.setdefault(i['end_label'], dict())
+                )
+            )
+
+        edges[i['type']] = (
+            np.concatenate(starts) if starts else np.zeros(0, dtype = np.int32),
+            np.concatenate(ends) if ends else np.zeros(0, dtype = np.int32)
+        )
+
+    ## keys in id order
+    for i, j in index.items():
+        pd.DataFrame(
+            data = {
+                'key': list(j)
+            }
+        ).to_csv(
+            path_or_buf = os.path.join(path, 'keys-{x}.csv'.format(x = i)),
+            index = False
+        )
+
+    ## csr per relationship type, once all ids are known
+    meta = {
+        'version': 1,
+        'labels': {i: len(j) for i, j in index.items()},
+        'rels': dict()
+    }
+
+    for i in rels:
+        starts, ends = edges.pop(i['type'])
+
+        indptr, indices = csr_maker(
+            starts = starts,
+            ends = ends,
+            n = len(index.get(i['start_label'], dict()))
+        )
+
+        np.save(os.path.join(path, '{x}-indptr.npy'.format(x = i['type'])), indptr)
+        np.save(os.path.join(path, '{x}-indices.npy'.format(x = i['type'])), indices)
+
+        meta['rels'][i['type']] = {
+            'start': i['start_label'],
+            'end': i['end_label'],
+            'edges': len(indices)
+        }
+
+    with open(os.path.join(path, 'graph.json'), 'w') as file:
+        json.dump(meta, file, indent = 1)
+
+    return meta
+
+
+## graph metadata
+def graph_reader(path):
+
+    """
+    Desc:
+        Reads the labels and relationship types of a graph saved by
+        'graph_loader'.
+
+    Args:
+        path (str): Path to graph directory.
+
+    Returns:
+        dict: Number of nodes per label and edges per relationship type.
+
+    Raises:
+        ValueError: Unsupported graph version.
+    """
+
+    with open(os.path.join(path, 'graph.json'), 'r') as file:
+        meta = json.load(file)
+
+    if meta.get('version') != 1:
+        raise ValueError('Unsupported graph version.')
+
+    return meta
+
+
+## keys of a label
+def key_reader(path, label):
+
+    """
+    Desc:
+        Reads the keys of a node label saved by 'graph_loader', where the
+        position of a key is its ID.
+
+    Args:
+        path (str): Path to graph directory.
+        label (str): Node label.
+
+    Returns:
+        Index: Key string values in ID order.
+
+    Raises:
+        None.
+    """
+
+    return pd.Index(
+        pd.read_csv(
+            os.path.join(path, 'keys-{x}.csv'.format(x = label)),
+            dtype = str,
+            keep_default_na = False
+        )['key']
+    )
+
+
+## csr adjacency of a relationship type
+def csr_reader(path, rel, mmap = True):
+
+    """
+    Desc:
+        Reads the CSR adjacency of a relationship type saved by 'graph_loader'
+        as a boolean sparse matrix of start by end ID's. If 'mmap' is True,
+        neighbor ID's are memory mapped rather than read into memory.
+
+    Args:
+        path (str): Path to graph directory.
+        rel (str): Relationship type.
+        mmap (bool): Memory map neighbor ID's.
+
+    Returns:
+        obj: SciPy CSR matrix object.
+
+    Raises:
+        None.
+    """
+
+    meta = graph_reader(
+        path = path
+    )
+
+    mode = 'r' if mmap else None
+    indptr = np.load(os.path.join(path, '{x}-indptr.npy'.format(x = rel)), mmap_mode = mode)
+    indices = np.load(os.path.join(path, '{x}-indices.npy'.format(x = rel)), mmap_mode = mode)
+
+    return sparse.csr_matrix(
+        (np.ones(len(indices), dtype = bool), indices, indptr),
+        shape = (
+            meta['labels'][meta['rels'][rel]['start']],
+            meta['labels'][meta['rels'][rel]['end']]
+        )
+    )
+
+
+## -- pkg dump loading run -- ##
+if __name__ == '__main__':
+
+    ## pkg relationship dumps and data set relationships from 'import_writer' and 'proxy_writer'
+    dump_path = '/usr/local/pkg-dump'
+    import_path = '/usr/local/niaid-dir-import'
+
+    ## compact graph of csr adjacencies
+    graph_path = '/usr/local/niaid-dir-graph'
+
+    rels = [
+        {'type': 'BELONGS_TO', 'path': os.path.join(import_path, 'rels-belongs-to.csv'),
+            'start': ':START_ID(NAME)', 'end': ':END_ID(SECTION)', 'start_label': 'NAME', 'end_label': 'SECTION'},
+        {'type': 'PROXY_TO', 'path': os.path.join(import_path, 'rels-proxy-to.csv'),
+            'start': ':START_ID(PERSON)', 'end': ':END_ID(NAME)', 'start_label': 'PERSON', 'end_label': 'NAME'},
+        {'type': 'AUTHORED', 'path': os.path.join(dump_path, 'authored.csv'),
+            'start': ':START_ID', 'end': ':END_ID', 'start_label': 'PERSON', 'end_label': 'PAPER'},
+        {'type': 'HAS_KEYWORD', 'path': os.path.join(dump_path, 'has_keyword.csv'),
+            'start': ':START_ID', 'end': ':END_ID', 'start_label': 'PAPER', 'end_label': 'KEYWORD'},
+        {'type': 'HAS_MESH_KEYWORD', 'path': os.path.join(dump_path, 'has_mesh_keyword.csv'),
+            'start': ':START_ID', 'end': ':END_ID', 'start_label': 'PAPER', 'end_label': 'MESH_KEYWORD'},
+        {'type': 'PUBLISHED_IN', 'path': os.path.join(dump_path, 'published_in.csv'),
+            'start': ':START_ID', 'end': ':END_ID', 'start_label': 'PAPER', 'end_label': 'JOURNAL'},
+        {'type': 'IN_CATEGORY', 'path': os.path.join(dump_path, 'in_category.csv'),
+            'start': ':START_ID', 'end': ':END_ID', 'start_label': 'JOURNAL', 'end_label': 'CATEGORY'},
+        {'type': 'HAS_PI', 'path': os.path.join(dump_path, 'has_pi.csv'),
+            'start': ':START_ID', 'end': ':END_ID', 'start_label': 'PROJECT', 'end_label': 'PERSON'},
+        {'type': 'IN_SPENDING_CAT', 'path': os.path.join(dump_path, 'in_spending_cat.csv'),
+            'start': ':START_ID', 'end': ':END_ID', 'start_label': 'PROJECT', 'end_label': 'SPENDING_CAT'},
+        {'type': 'HAS_TERM', 'path': os.path.join(dump_path, 'has_term.csv'),
+            'start': ':START_ID', 'end': ':END_ID', 'start_label': 'PROJECT', 'end_label': 'TERM'}
+    ]
+
+    graph_loader(
+        rels = rels,
+        path = graph_path
+    )
@@ -0,0 +1,276 @@
+## libraries
+import os
+import pandas as pd
+from grapher import node_ider
+
+
+## name key
+def name_keyer(names):
+
+    """
+    Desc:
+        Determines the match key of full names, the first initial and surname
+        ('J Smith' for 'John A Smith'), as in the integration query
+        ('/queries/int-pkg.cql').
+
+    Args:
+        names (series): Full name string values.
+
+    Returns:
+        Series: Match key string values.
+
+    Raises:
+        None.
+    """
+
+    return names.str[0:1] + ' ' + names.str.rsplit(' ', n = 1).str[-1]
+
+
+## stream candidates from person dump
+def person_streamer(path, names, id_col = 'id', name_col = 'name', tier_col = None,
+    chunk = 10 ** 6):
+
+    """
+    Desc:
+        Streams the PKG person dump in 'path' (CSV, or TSV by '.tsv' extension)
+        in chunks of 'chunk' rows, and yields the persons sharing a match key
+        with a name in 'names'. The names are held in a hash index by key,
+        where each chunk is first cut to persons with a known surname, then
+        joined to the index. If 'tier_col' is specified, it is kept as the
+        match tier of each person, lower tiers preferred.
+
+    Args:
+        path (str): Path to person dump file.
+        names (series): Full name string values of data set.
+        id_col (str): Column of person ID.
+        name_col (str): Column of person full name.
+        tier_col (str): Column of person match tier (optional).
+        chunk (int): Number of rows per chunk.
+
+    Yields:
+        DataFrame: Candidates, 'person_id', 'person', 'tier', and 'name'.
+
+    Raises:
+        None.
+    """
+
+    ## hash index of names by key
+    names = pd.Series(names.dropna().astype(str).unique())
+    index = pd.DataFrame(
+        data = {
+            'key': name_keyer(
+                names = names
+            ),
+            'name': names
+        }
+    )
+
+    surnames = set(names.str.rsplit(' ', n = 1).str[-1])
+
+    cols = [id_col, name_col] + ([tier_col] if tier_col is not None else [])
+
+    for i in pd.read_csv(path, sep = '\t' if path.endswith('.tsv') else ',',
+        usecols = cols, dtype = {id_col: str, name_col: str}, chunksize = chunk):
+
+        i = i.dropna(subset = [name_col])
+        i = i[i[name_col].str.rsplit(' ', n = 1).str[-1].isin(surnames)]
+
+        if len(i) == 0:
+            continue
+
+        yield pd.DataFrame(
+            data = {
+                'person_id': i[id_col],
+                'person': i[name_col],
+                'tier': i[tier_col] if tier_col is not None else 0,
+                'key': name_keyer(
+                    names = i[name_col]
+                )
+            }
+        ).merge(
+            right = index,
+            on = 'key'
+        ).drop(
+            columns = 'key'
+        )
+
+
+## prune ambiguous candidates
+def proxy_pruner(edges):
+
+    """
+    Desc:
+        Removes candidates of names with more than one candidate, in four
+        passes as in the integration query, each recounting candidates per
+        name. Removes mismatched first names, then mismatched middle names,
+        then mismatched middle initials, then persons without a middle name
+        or initial for names with a first initial and a middle name.
+
+    Args:
+        edges (df): Candidates, 'person_id', 'person', and 'name'.
+
+    Returns:
+        DataFrame: Remaining candidates.
+
+    Raises:
+        None.
+    """
+
+    p_tok = edges['person'].str.split(' ')
+    n_tok = edges['name'].str.split(' ')
+
+    p_len = p_tok.str.len()
+    n_len = n_tok.str.len()
+    p_first = p_tok.str[0]
+    n_first = n_tok.str[0]
+    p_mid = p_tok.str[1].fillna('')
+    n_mid = n_tok.str[1].fillna('')
+
+    rules = [
+        ## mismatched first names
+        (p_first.str.len() > 1) & (n_first.str.len() > 1) & (p_first != n_first),
+
+        ## mismatched middle name
+        (p_len > 2) & (n_len > 2) & (p_mid.str.len() > 1) & (n_mid.str.len() > 1) & (
+            p_mid != n_mid),
+
+        ## mismatched middle initial
+        (p_len > 2) & (n_len > 2) & (p_mid.str[0:1] != n_mid.str[0:1]),
+
+        ## unknown middle initial or name
+        (n_first.str.len() == 1) & (n_len > 2) & (p_len == 2) & (p_first.str.len() > 2)
+    ]
+
+    keep = pd.Series(True, index = edges.index)
+
+    for i in rules:
+        multi = edges['name'].where(keep).map(
+            edges['name'][keep].value_counts()
+        ) > 1
+
+        keep &= ~(multi & i)
+
+    return edges[keep]
+
+
+## proxy edges
+def proxy_matcher(names, path, id_col = 'id', name_col = 'name', tier_col = None,
+    chunk = 10 ** 6):
+
+    """
+    Desc:
+        Primary matching function. Matches names of the data set to PKG persons
+        in the person dump in 'path' by first initial and surname, outside the
+        database. If 'tier_col' is specified, a name only takes candidates of
+        its lowest tier, as the integration query only widens its search for
+        names without candidates. Candidates are then pruned by first, middle,
+        and initial rules with 'proxy_pruner'.
+
+    Args:
+        names (series): Full name string values of data set.
+        path (str): Path to person dump file.
+        id_col (str): Column of person ID.
+        name_col (str): Column of person full name.
+        tier_col (str): Column of person match tier (optional).
+        chunk (int): Number of rows per chunk.
+
+    Returns:
+        DataFrame: Proxy edges, 'person_id', 'person', and 'name'.
+
+    Raises:
+        None.
+    """
+
+    edges = [
+        i for i in person_streamer(
+            path = path,
+            names = names,
+            id_col = id_col,
+            name_col = name_col,
+            tier_col = tier_col,
+            chunk = chunk
+        )
+    ]
+
+    if len(edges) == 0:
+        return pd.DataFrame(
+            columns = ['person_id', 'person', 'name']
+        )
+
+    edges = pd.concat(
+        objs = edges,
+        ignore_index = True
+    )
+
+    ## lowest tier per name
+    edges = edges[edges['tier'] == edges.groupby('name')['tier'].transform('min')]
+
+    ## one edge per pair
+    edges = edges.drop_duplicates(
+        subset = ['person_id', 'name']
+    ).reset_index(
+        drop = True
+    )
+
+    return proxy_pruner(
+        edges = edges
+    )[['person_id', 'person', 'name']].reset_index(
+        drop = True
+    )
+
+
+## proxy edges to disk
+def proxy_writer(edges, path):
+
+    """
+    Desc:
+        Writes proxy edges in 'neo4j-admin import' relationship format, from
+        PKG person ID's to the stable NAME node ID's of 'import_writer'.
+
+    Args:
+        edges (df): Proxy edges from 'proxy_matcher'.
+        path (str): Path to relationship file.
+
+    Returns:
+        None.
+
+    Raises:
+        None.
+    """
+
+    if os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok = True)
+
+    pd.DataFrame(
+        data = {
+            ':START_ID(PERSON)': edges['person_id'],
+            ':END_ID(NAME)': edges['name'].map(lambda x: node_ider(label = 'NAME', name = x)),
+            ':TYPE': 'PROXY_TO'
+        }
+    ).to_csv(
+        path_or_buf = path,
+        index = False
+    )
+
+
+## -- proxy matching run -- ##
+if __name__ == '__main__':
+
+    ## data set and pkg person dump, with optional match tier per person
+    csv_path = '/usr/local/niaid-dir-org.csv'
+    person_path = '/usr/local/pkg-dump/person.csv'
+    tier_col = None
+
+    ## proxy edges for bulk load
+    proxy_path = '/usr/local/niaid-dir-import/rels-proxy-to.csv'
+
+    edges = proxy_matcher(
+        names = pd.read_csv(csv_path)['Name'],
+        path = person_path,
+        tier_col = tier_col
+    )
+
+    proxy_writer(
+        edges = edges,
+        path = proxy_path
+    )
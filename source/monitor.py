@@ -0,0 +1,528 @@
+## libraries
+import os
+import sys
+import json
+import time
+import psutil
+import resource
+import threading
+from contextlib import contextmanager
+from contextlib import nullcontext
+
+
+## prefix of exported metric names
+metric_prefix = 'niaid_dir_'
+
+## descriptions of exported counters
+counter_descs = {
+    'retries': 'Retries of failed web requests.',
+    'wait_seconds': 'Time waited on failed web requests and backoff.',
+    'rows': 'Rows produced.'
+}
+
+
+## peak resident memory of process
+def rss_peaker():
+
+    """
+    Desc:
+        Determines the peak resident memory of the process so far, its high
+        water mark since start. Browser processes are not included.
+
+    Args:
+        None.
+
+    Returns:
+        float: Peak resident memory (MB).
+
+    Raises:
+        None.
+    """
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    ## bytes on macos, kilobytes otherwise
+    if sys.platform == 'darwin':
+        return peak / 2 ** 20
+
+    return peak / 2 ** 10
+
+
+## resident memory of process tree
+def rss_sampler():
+
+    """
+    Desc:
+        Determines the current resident memory of the process and all its
+        child processes, including WebDriver and browser processes. Processes
+        ending while sampled are left out.
+
+    Args:
+        None.
+
+    Returns:
+        float: Resident memory (MB).
+
+    Raises:
+        None.
+    """
+
+    process = psutil.Process()
+    rss = 0
+
+    for i in [process] + process.children(recursive = True):
+        try:
+            rss += i.memory_info().rss
+
+        except psutil.Error:
+            pass
+
+    return rss / 2 ** 20
+
+
+## run metrics
+class RunMetrics:
+
+    """
+    Desc:
+        Run metrics of a web scraping run. Records wall time, number of calls,
+        peak resident memory, and memory growth per stage, page load latency
+        and rows per anchor ID, and counters such as retries and wait time.
+        Resident memory is of the process and its browser processes, sampled
+        every 'interval' seconds while any stage runs. Metrics carry labels,
+        typically the site name, where a labeled view of the same run is made
+        with 'labeled'. Safe to share across threads.
+
+    Args:
+        interval (float): Time between resident memory samples (seconds).
+
+    Raises:
+        None.
+    """
+
+    def __init__(self, interval = 0.1):
+
+        self.started = time.time()
+        self.interval = interval
+        self.labels = tuple()
+        self.stages = dict()
+        self.pages = dict()
+        self.counters = dict()
+        self.lock = threading.Lock()
+
+        ## peak memory per running stage call, shared by labeled views
+        self.running = dict()
+        self.sampler = {'thread': None, 'peak': 0.0}
+
+    ## sample memory while stages run
+    def sample(self):
+
+        """
+        Desc:
+            Samples resident memory every 'interval' seconds and raises the
+            peak of each running stage call, until no stage runs.
+
+        Args:
+            None.
+
+        Returns:
+            None.
+
+        Raises:
+            None.
+        """
+
+        while True:
+            rss = rss_sampler()
+
+            with self.lock:
+                self.sampler['peak'] = max(self.sampler['peak'], rss)
+
+                for i in self.running:
+                    self.running[i] = max(self.running[i], rss)
+
+                if len(self.running) == 0:
+                    self.sampler['thread'] = None
+                    return
+
+            time.sleep(self.interval)
+
+    ## labeled view
+    def labeled(self, **labels):
+
+        """
+        Desc:
+            Makes a view of the run metrics with added labels, where metrics
+            recorded through the view are kept with the run metrics.
+
+        Args:
+            **labels: Label names and str values, typically 'site'.
+
+        Returns:
+            obj: Run metrics object.
+
+        Raises:
+            None.
+        """
+
+        view = RunMetrics.__new__(RunMetrics)
+        view.__dict__.update(self.__dict__)
+        view.labels = tuple(sorted(dict(self.labels, **labels).items()))
+
+        return view
+
+    ## time a stage
+    @contextmanager
+    def stage(self, name):
+
+        """
+        Desc:
+            Records the wall time, peak resident memory, and memory growth of
+            the code run within the context as one call of stage 'name'.
+            Stages may nest and run concurrently, where wall times add up per
+            stage and peaks include memory of concurrent stages.
+
+        Args:
+            name (str): Stage name.
+
+        Yields:
+            None.
+
+        Raises:
+            None.
+        """
+
+        rss = rss_sampler()
+        call = object()
+
+        with self.lock:
+            self.running[call] = rss
+
+            if self.sampler['thread'] is None:
+                self.sampler['thread'] = threading.Thread(
+                    target = self.sample,
+                    daemon = True
+                )
+                self.sampler['thread'].start()
+
+        start = time.perf_counter()
+
+        try:
+            yield
+
+        finally:
+            latency = time.perf_counter() - start
+            rss_end = rss_sampler()
+            delta = rss_end - rss
+            key = (name, self.labels)
+
+            with self.lock:
+                peak = max(self.running.pop(call), rss_end)
+                self.sampler['peak'] = max(self.sampler['peak'], peak)
+
+                if key not in self.stages:
+                    self.stages[key] = {
+                        'calls': 0,
+                        'seconds': 0.0,
+                        'max_seconds': 0.0,
+                        'peak_rss_mb': 0.0,
+                        'max_rss_delta_mb': delta
+                    }
+
+                record = self.stages[key]
+                record['calls'] += 1
+                record['seconds'] += latency
+                record['max_seconds'] = max(record['max_seconds'], latency)
+                record['peak_rss_mb'] = max(record['peak_rss_mb'], peak)
+                record['max_rss_delta_mb'] = max(record['max_rss_delta_mb'], delta)
+
+    ## record a page
+    def page(self, page, **values):
+
+        """
+        Desc:
+            Records values of a page, typically load latency ('latency') and
+            number of rows ('rows') of an anchor ID. Latest values are kept.
+
+        Args:
+            page (str): Page key, typically anchor ID.
+            **values: Value names and numbers.
+
+        Returns:
+            None.
+
+        Raises:
+            None.
+        """
+
+        with self.lock:
+            self.pages.setdefault((page, self.labels), dict()).update(values)
+
+    ## add to a counter
+    def count(self, name, value = 1):
+
+        """
+        Desc:
+            Adds 'value' to counter 'name', such as 'retries' or
+            'wait_seconds'.
+
+        Args:
+            name (str): Counter name.
+            value (float): Number added.
+
+        Returns:
+            None.
+
+        Raises:
+            None.
+        """
+
+        with self.lock:
+            key = (name, self.labels)
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    ## run report
+    def report(self):
+
+        """
+        Desc:
+            Summarizes the run metrics of all labels, including run wall time,
+            peak resident memory of the process, and sampled peak resident
+            memory of the process and its browser processes.
+
+        Args:
+            None.
+
+        Returns:
+            dict: Run, stage, page, and counter metrics.
+
+        Raises:
+            None.
+        """
+
+        with self.lock:
+            return {
+                'run': {
+                    'started': self.started,
+                    'seconds': time.time() - self.started,
+                    'peak_rss_mb': rss_peaker(),
+                    'peak_tree_rss_mb': self.sampler['peak']
+                },
+                'stages': [
+                    dict(stage = i, **dict(j), **k) for (i, j), k in self.stages.items()
+                ],
+                'pages': [
+                    dict(page = i, **dict(j), **k) for (i, j), k in self.pages.items()
+                ],
+                'counters': [
+                    dict(counter = i, **dict(j), value = k) for (i, j), k in self.counters.items()
+                ]
+            }
+
+
+## stage context without run metrics
+def stage_timer(metrics, name):
+
+    """
+    Desc:
+        Times stage 'name' with the run metrics in 'metrics', or does nothing
+        if 'metrics' is None.
+
+    Args:
+        metrics (obj): Run metrics object (optional).
+        name (str): Stage name.
+
+    Returns:
+        obj: Context manager.
+
+    Raises:
+        None.
+    """
+
+    if metrics is None:
+        return nullcontext()
+
+    return metrics.stage(
+        name = name
+    )
+
+
+## page record without run metrics
+def page_recorder(metrics, page, **values):
+
+    """
+    Desc:
+        Records values of a page with the run metrics in 'metrics', or does
+        nothing if 'metrics' or 'page' is None.
+
+    Args:
+        metrics (obj): Run metrics object (optional).
+        page (str): Page key, typically anchor ID.
+        **values: Value names and numbers.
+
+    Returns:
+        None.
+
+    Raises:
+        None.
+    """
+
+    if metrics is not None and page is not None:
+        metrics.page(page, **values)
+
+
+## file write in one step
+def file_replacer(path, text):
+
+    """
+    Desc:
+        Writes 'text' to a temp file next to 'path' and moves it into place, so
+        that readers never see a partial file.
+
+    Args:
+        path (str): Path to file.
+        text (str): File contents.
+
+    Returns:
+        None.
+
+    Raises:
+        None.
+    """
+
+    if os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok = True)
+
+    with open(path + '.tmp', 'w') as file:
+        file.write(text)
+
+    os.replace(path + '.tmp', path)
+
+
+## json run report
+def report_saver(metrics, path):
+
+    """
+    Desc:
+        Saves the run report of 'metrics' as JSON.
+
+    Args:
+        metrics (obj): Run metrics object.
+        path (str): Path to report file.
+
+    Returns:
+        None.
+
+    Raises:
+        None.
+    """
+
+    file_replacer(
+        path = path,
+        text = json.dumps(metrics.report(), indent = 1)
+    )
+
+
+## prometheus textfile
+def textfile_saver(metrics, path):
+
+    """
+    Desc:
+        Saves the run report of 'metrics' in the Prometheus text exposition
+        format, for the node exporter textfile collector. Page load latency is
+        exported per anchor ID and as its max per site for alerting on a slow
+        website.
+
+    Args:
+        metrics (obj): Run metrics object.
+        path (str): Path to textfile, typically ending in '.prom'.
+
+    Returns:
+        None.
+
+    Raises:
+        None.
+    """
+
+    report = metrics.report()
+    lines = list()
+
+    def exposer(name, kind, desc, samples):
+        name = metric_prefix + name
+        lines.append('# HELP {n} {d}'.format(n = name, d = desc))
+        lines.append('# TYPE {n} {k}'.format(n = name, k = kind))
+
+        for labels, value in samples:
+            labels = ','.join(
+                '{i}="{j}"'.format(
+                    i = i,
+                    j = str(j).replace('\\', '\\\\').replace('"', '\\"')
+                ) for i, j in labels.items()
+            )
+
+            lines.append('{n}{l} {v}'.format(
+                    n = name,
+                    l = '{' + labels + '}' if labels else '',
+                    v = repr(float(value))
+                )
+            )
+
+    def labeler(record, *drop):
+        return {i: j for i, j in record.items() if i not in drop and type(j) is str}
+
+    ## run
+    exposer('run_seconds', 'gauge', 'Wall time of last run.',
+        [({}, report['run']['seconds'])])
+
+    exposer('run_peak_rss_megabytes', 'gauge', 'Peak resident memory of last run, process only.',
+        [({}, report['run']['peak_rss_mb'])])
+
+    exposer('run_peak_tree_rss_megabytes', 'gauge', 'Sampled peak resident memory of last run, with browsers.',
+        [({}, report['run']['peak_tree_rss_mb'])])
+
+    exposer('run_timestamp_seconds', 'gauge', 'Start time of last run.',
+        [({}, report['run']['started'])])
+
+    ## stages
+    exposer('stage_seconds_total', 'counter', 'Wall time per stage.',
+        [(labeler(i), i['seconds']) for i in report['stages']])
+
+    exposer('stage_calls_total', 'counter', 'Number of calls per stage.',
+        [(labeler(i), i['calls']) for i in report['stages']])
+
+    exposer('stage_max_seconds', 'gauge', 'Slowest call per stage.',
+        [(labeler(i), i['max_seconds']) for i in report['stages']])
+
+    exposer('stage_peak_rss_megabytes', 'gauge', 'Sampled peak resident memory during stage, with browsers.',
+        [(labeler(i), i['peak_rss_mb']) for i in report['stages']])
+
+    exposer('stage_max_rss_delta_megabytes', 'gauge', 'Largest growth of resident memory over one call, with browsers.',
+        [(labeler(i), i['max_rss_delta_mb']) for i in report['stages']])
+
+    ## pages
+    pages = [i for i in report['pages'] if 'latency' in i]
+
+    exposer('page_load_seconds', 'gauge', 'Page load latency per anchor ID.',
+        [(labeler(i), i['latency']) for i in pages])
+
+    slowest = dict()
+
+    for i in pages:
+        site = i.get('site', '')
+        slowest[site] = max(slowest.get(site, 0), i['latency'])
+
+    exposer('page_load_max_seconds', 'gauge', 'Slowest page load latency per site.',
+        [({'site': i} if i else {}, j) for i, j in slowest.items()])
+
+    exposer('page_rows', 'gauge', 'Rows produced per anchor ID.',
+        [(labeler(i), i['rows']) for i in report['pages'] if 'rows' in i])
+
+    ## counters
+    for i in sorted({i['counter'] for i in report['counters']}):
+        exposer(i + '_total', 'counter', counter_descs.get(i, 'Run counter {x}.'.format(x = i)),
+            [(labeler(j, 'counter'), j['value']) for j in report['counters'] if j['counter'] == i])
+
+    file_replacer(
+        path = path,
+        text = '\n'.join(lines) + '\n'
+    )
@@ -1,11 +1,17 @@
+## libraries
+import pandas as pd
+from ruler import rule_loader
+
+
 ## modify first names
 def first_namer(data, feat):
 
     """
     Desc:
         Addresses 'Name' feature. Performs ad hoc changes to abbreviated or 
-        otherwise misspelled first names. This function should evolve when 
-        errors in first names are recognized or improved info.
+        otherwise misspelled first names, from the first name corrections in 
+        the rules file. The rules file should evolve when errors in first 
+        names are recognized or improved info.
      
     Args:
         data (df): A valid DataFrame.
@@ -19,22 +25,57 @@ def first_namer(data, feat):
     """
 
     ## individual name corrections
-    feat_repl = {
+    ## info: https://ned.nih.gov/search/
+    corrections = rule_loader()['corrections']['first']
 
-        ## slight abuse of original purpose
-        ## info: https://ned.nih.gov/search/
-        feat: {
-            'Beth Fischer': 'Elizabeth Fischer',
-            'David Hackstadt': 'Ted Hackstadt'
-        }
-    }
+    data[feat] = data[feat].map(corrections).fillna(
+        value = data[feat]
+    )
 
-    data.replace(
-        to_replace = feat_repl,
+    return data
+
+
+## canonical name per key
+def name_canonizer(names, keys, ranks):
+
+    """
+    Desc:
+        Determines the canonical full name per key in 'keys', as the name in 
+        'names' with the highest value in 'ranks', then the most frequent, then 
+        the last in descending order. Computed in one grouped pass.
+     
+    Args:
+        names (series): Full name string values.
+        keys (series): Key string values per name.
+        ranks (series): Numeric rank per name, higher preferred.
+
+    Returns:
+        Series: Canonical full name, indexed by key.
+    
+    Raises:
+        None.
+    """
+
+    counts = pd.DataFrame(
+        data = {
+            'name': names.values,
+            'key': keys.values,
+            'rank': ranks.values
+        }
+    ).dropna().groupby(
+        by = ['key', 'rank', 'name']
+    ).size().rename('count').reset_index()
+
+    counts.sort_values(
+        by = ['key', 'rank', 'count', 'name'],
+        ascending = [True, False, False, False],
+        kind = 'mergesort',
         inplace = True
     )
 
-    return data
+    return counts.drop_duplicates(
+        subset = 'key'
+    ).set_index('key')['name']
 
 
 ## modify middle names
@@ -44,7 +85,10 @@ def middle_namer(data, feat):
     Desc:
         Addresses 'Name' feature. Inserts middle initial or name into string
         values that have matching first and last names when compared to other
-        observation, but where the middle initial or name is absent.
+        observation, but where the middle initial or name is absent. Names are 
+        grouped by first and last name, where names without a middle initial 
+        or name take the canonical variant of their group. Then performs the 
+        middle name corrections in the rules file.
      
     Args:
         data (df): A valid DataFrame.
@@ -57,63 +101,36 @@ def middle_namer(data, feat):
         None.
     """
 
-    ## clean names
-    n = len(data) - 1
+    ## first and last name key, computed once
+    tokens = data[feat].str.split()
+    n_tokens = tokens.str.len()
 
-    for i in range(0, n):
+    keys = tokens.str[0] + ' ' + tokens.str[-1]
 
-        ## use full name containing middle initial
-        name_one = str(
-            data[feat].iloc[i].split()[0] + ' ' + 
-            data[feat].iloc[i].split()[-1]
-        )
+    ## use full name containing middle initial
+    middle = n_tokens > 2
 
-        name_two = str(
-            data[feat].iloc[i + 1].split()[0] + ' ' + 
-            data[feat].iloc[i + 1].split()[-1]
+    canon = keys.map(
+        name_canonizer(
+            names = data[feat][middle],
+            keys = keys[middle],
+            ranks = n_tokens[middle]
         )
+    )
 
-        if name_one == name_two:
-            n_name_one = len(data[feat].iloc[i].split())
-            n_name_two = len(data[feat].iloc[i + 1].split())
-
-            if n_name_one != n_name_two:
-                if n_name_one > 2:
-                    name_use = data[feat].iloc[i]
-                if n_name_two > 2:
-                    name_use = data[feat].iloc[i + 1]
-                else:
-                    pass
-
-                data[feat].iloc[i] = name_use
-                data[feat].iloc[i + 1] = name_use
-
-            else:
-                pass
+    data[feat] = data[feat].where(
+        cond = (n_tokens != 2) | canon.isna(),
+        other = canon
+    )
 
-        else:
-            pass
-    
     ## individual name corrections
-    feat_repl = {
-
-        ## slight abuse of original purpose
-        ## info: https://ned.nih.gov/search/
-        feat: {
-            'Elizabeth Fischer': 'Elizabeth R Fischer', 
-            'David Sacks': 'David L Sacks',
-            'Daniella Schwartz': 'Daniella M Schwartz',
-            'Richard Davey': 'Richard T Davey',
-            'Louis Miller': 'Louis H Miller',
-            'Catharine Bosio': 'Catharine M Bosio'
-        }
-    }
+    ## info: https://ned.nih.gov/search/
+    corrections = rule_loader()['corrections']['middle']
 
-    data.replace(
-        to_replace = feat_repl,
-        inplace = True
+    data[feat] = data[feat].map(corrections).fillna(
+        value = data[feat]
     )
-
+    
     ## remove duplicates
     data.drop_duplicates(
         inplace = True
@@ -130,7 +147,12 @@ def last_namer(data, feat, reap = 3):
         Addresses 'Name' feature. Modifies last name substring by correcting 
         errors when misspellings are assumed to be missing letters. Replaces 
         assumed misspelling with string value of greater length. Also removes 
-        family name suffix.
+        family name suffix. Names are grouped by first name and the first 
+        'reap' letters of the last name, where names with a shorter last name 
+        than the longest in their group take the canonical variant of it. 
+        Names with a middle name of another initial than the canonical 
+        variant only take its last name. Then performs the last name 
+        corrections in the rules file.
      
     Args:
         data (df): A valid DataFrame.
@@ -144,75 +166,64 @@ def last_namer(data, feat, reap = 3):
         None.
     """
 
-    ## clean names
-    n = len(data) - 1
-
-    for i in range(0, n):
-
-        ## remove suffix from last names
-        name_sir = data[feat].iloc[i].split()[-1]
-        n_name_sir = len(name_sir)
+    ## family suffix
+    fam_suf = rule_loader()['fam_suf']
 
-        ## remove suffix errors
-        if n_name_sir == 1:
-            data[feat].iloc[i] = data[feat].iloc[i][:-2]
+    tokens = data[feat].str.split()
+    name_sir = tokens.str[-1]
 
-        ## remove family suffix
-        if n_name_sir <= 3:
-            fam_suf = [
-                'III',
-                'II',
-                'Jr',
-                'Sr'
-            ]
-
-            for j in fam_suf:
-                if name_sir == j:
-                    data[feat].iloc[i] = ' '.join(data[feat].iloc[i].split()[:-1])
-
-        else:
-            pass
+    ## remove suffix errors
+    names = data[feat].where(
+        cond = name_sir.str.len() != 1,
+        other = data[feat].str[:-2]
+    )
 
-        ## replace missing letters in last names 
-        ## assumes same last name for first 'reap' repeated letters
-        name_giv_one = data[feat].iloc[i].split()[0]
-        name_giv_two = data[feat].iloc[i + 1].split()[0]
+    ## remove family suffix
+    names = names.where(
+        cond = ~name_sir.isin(fam_suf),
+        other = tokens.str[:-1].str.join(' ')
+    )
 
-        name_sir_one = data[feat].iloc[i].split()[-1]
-        name_sir_two = data[feat].iloc[i + 1].split()[-1]
+    ## first name and last name prefix key, computed once
+    ## assumes same last name for first 'reap' repeated letters
+    tokens = names.str.split()
+    name_sir = tokens.str[-1]
+    n_name_sir = name_sir.str.len()
 
-        if name_giv_one == name_giv_two and name_sir_one[0:reap] == name_sir_two[0:reap]:
-            n_name_sir_one = len(name_sir_one)
-            n_name_sir_two = len(name_sir_two)
+    keys = tokens.str[0] + ' ' + name_sir.str[0:reap]
 
-            if n_name_sir_one != n_name_sir_two:
-                if n_name_sir_one > n_name_sir_two:
-                    data[feat].iloc[i + 1] = data[feat].iloc[i]
+    ## replace missing letters in last names
+    canon = keys.map(
+        name_canonizer(
+            names = names,
+            keys = keys,
+            ranks = n_name_sir
+        )
+    )
 
-                if n_name_sir_one < n_name_sir_two:
-                    data[feat].iloc[i] = data[feat].iloc[i + 1]
+    ## keep own middle name when it conflicts with canonical variant
+    canon_tokens = canon.fillna(names).str.split()
+    name_mid = tokens.str[1:-1].str.join(' ')
+    canon_mid = canon_tokens.str[1:-1].str.join(' ')
 
-            else:
-                pass
+    compatible = (name_mid == '') | (name_mid.str[0:1] == canon_mid.str[0:1])
 
-        else:
-            pass
+    name_sir_only = (tokens.str[:-1].str.join(' ') + ' ' + canon_tokens.str[-1]).str.strip()
 
+    data[feat] = names.where(
+        cond = (n_name_sir >= n_name_sir.groupby(keys).transform('max')) | canon.isna(),
+        other = canon.where(
+            cond = compatible,
+            other = name_sir_only
+        )
+    )
 
     ## individual name corrections
-    feat_repl = {
-
-        ## slight abuse of original purpose
-        ## info: https://ned.nih.gov/search/
-        feat: {
-            'Jennifer M Cuellar-Rodriguez': 'Jennifer M Cuellar-Rodríguez',
-            'Sumati Ragagopalan': 'Sumati Rajagopalan'
-        }
-    }
+    ## info: https://ned.nih.gov/search/
+    corrections = rule_loader()['corrections']['last']
 
-    data.replace(
-        to_replace = feat_repl,
-        inplace = True
+    data[feat] = data[feat].map(corrections).fillna(
+        value = data[feat]
     )
 
     return data
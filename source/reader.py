@@ -0,0 +1,369 @@
+## libraries
+import requests
+from functools import lru_cache
+from urllib.parse import urljoin
+from lxml import etree
+from lxml import html
+from extractor import people_splitter
+from extractor import text_normalizer
+from retrier import RetryPolicy
+
+
+## html elements rendered on their own line
+block_tags = frozenset((
+    'address', 'article', 'aside', 'blockquote', 'br', 'dd', 'div', 'dl',
+    'dt', 'fieldset', 'figcaption', 'figure', 'footer', 'form', 'h1', 'h2',
+    'h3', 'h4', 'h5', 'h6', 'header', 'hr', 'li', 'main', 'nav', 'ol', 'p',
+    'pre', 'section', 'table', 'tr', 'ul'
+    )
+)
+
+## html elements not rendered
+hide_tags = frozenset((
+    'head', 'noscript', 'script', 'style', 'template'
+    )
+)
+
+## request headers
+headers = {
+    'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64; rv:95.0) Gecko/20100101 Firefox/95.0'
+}
+
+
+## make http session
+def session_maker():
+
+    """
+    Desc:
+        Creates HTTP session with keep-alive connection pooling, for use in
+        place of a Selenium WebDriver object.
+
+    Args:
+        None.
+
+    Returns:
+        Session: Requests HTTP session object.
+
+    Raises:
+        None.
+    """
+
+    session = requests.Session()
+    session.headers.update(headers)
+
+    return session
+
+
+## compiled xpath
+@lru_cache(maxsize = None)
+def xpath_compiler(xpath):
+
+    """
+    Desc:
+        Compiles XPath expression once for repeated evaluation across pages.
+
+    Args:
+        xpath (str): XPath expression.
+
+    Returns:
+        XPath: Compiled lxml XPath object.
+
+    Raises:
+        None.
+    """
+
+    return etree.XPath(xpath)
+
+
+## html parsing
+def page_parser(body, url):
+
+    """
+    Desc:
+        Parses HTML of a web page into an lxml element tree.
+
+    Args:
+        body (bytes): HTML of web page.
+        url (str): URL of web page.
+
+    Returns:
+        HtmlElement: Root of lxml element tree.
+
+    Raises:
+        None.
+    """
+
+    return html.fromstring(
+        html = body,
+        base_url = url
+    )
+
+
+## web page request
+def body_reader(session, url, n, t, policy = None):
+
+    """
+    Desc:
+        Requests web page in 'url' over HTTP. Makes 'n' number of web request 
+        attempts before time out failure with 't' load latency time. If 
+        'policy' is specified, attempts, timeouts, and backoff are derived from 
+        it instead.
+
+    Args:
+        session (obj): Requests HTTP session object.
+        url (str): URL of web page.
+        n (int): Number of web request attempts after first failure.
+        t (int): Load latency of website (seconds).
+        policy (obj): Retry policy object (optional).
+
+    Returns:
+        tuple: URL after redirects and body of web page.
+
+    Raises:
+        RuntimeError: Max 'n' number of attempts reached.
+    """
+
+    ## retry policy
+    if policy is None:
+        policy = RetryPolicy(
+            n = n,
+            t = t
+        )
+
+    def requester(timeout):
+        response = session.get(
+            url = url,
+            timeout = timeout
+        )
+        response.raise_for_status()
+
+        return response.url, response.content
+
+    return policy.call(
+        func = requester,
+        stage = 'request',
+        page = url
+    )
+
+
+## web page request and parsing
+def page_reader(session, url, n, t, policy = None):
+
+    """
+    Desc:
+        Requests web page in 'url' over HTTP and parses it into an lxml element
+        tree. Makes 'n' number of web request attempts before time out failure
+        with 't' load latency time.
+
+    Args:
+        session (obj): Requests HTTP session object.
+        url (str): URL of web page.
+        n (int): Number of web request attempts after first failure.
+        t (int): Load latency of website (seconds).
+        policy (obj): Retry policy object (optional).
+
+    Returns:
+        HtmlElement: Root of lxml element tree.
+
+    Raises:
+        RuntimeError: Max 'n' number of attempts reached.
+    """
+
+    url, body = body_reader(
+        session = session,
+        url = url,
+        n = n,
+        t = t,
+        policy = policy
+    )
+
+    return page_parser(
+        body = body,
+        url = url
+    )
+
+
+## rendered text of element
+def text_reader(element):
+
+    """
+    Desc:
+        Approximates the rendered text of an lxml element, equivalent to the
+        'text' attribute of a Selenium web element. Block level elements and
+        line breaks start a new line, whitespace within lines is collapsed, and
+        empty lines are removed.
+
+    Args:
+        element (obj): lxml element.
+
+    Returns:
+        str: Rendered text of element.
+
+    Raises:
+        None.
+    """
+
+    parts = list()
+
+    def walker(elem):
+        tag = elem.tag.lower() if type(elem.tag) is str else None
+
+        if tag is not None and tag not in hide_tags:
+            block = tag in block_tags
+
+            if block:
+                parts.append('\n')
+
+            if elem.text:
+                parts.append(elem.text)
+
+            for i in elem:
+                walker(i)
+                if i.tail:
+                    parts.append(i.tail)
+
+            if block:
+                parts.append('\n')
+
+    walker(element)
+
+    return text_normalizer(''.join(parts))
+
+
+## anchor index of link anchors
+def anchor_reader(tree, prefix = 'anch_'):
+
+    """
+    Desc:
+        Reads all link anchors in web page with an anchor ID prefixed with
+        'prefix' and their URL's. Equivalent to 'anchor_indexer' without a
+        Selenium WebDriver object.
+
+    Args:
+        tree (obj): Root of lxml element tree of website.
+        prefix (str): Prefix of anchor ID's.
+
+    Returns:
+        dict: URL of link per anchor ID, in website order.
+
+    Raises:
+        ValueError: No link anchors found in website.
+    """
+
+    index = dict()
+
+    for i in xpath_compiler('//*[starts-with(@id, $prefix)]')(tree, prefix = prefix):
+        link = i.get('href')
+
+        if link is None:
+            link = next(iter(xpath_compiler('.//a/@href')(i)), None)
+
+        if link is not None and i.get('id') not in index:
+            index[i.get('id')] = urljoin(tree.base_url or '', link)
+
+    if len(index) == 0:
+        raise ValueError('Could not find link anchors in website.')
+
+    return index
+
+
+## name and section data
+def name_section_reader(tree, anch_a, anch_b, anch_c, anch_d):
+
+    """
+    Desc:
+        Retrieves raw data for 'Name', 'Education', and 'Section' features from
+        an lxml element tree. Equivalent to 'name_section_extractor' without a
+        Selenium WebDriver object, utilizing the same XPaths.
+
+    Args:
+        tree (obj): Root of lxml element tree of web page.
+        anch_a (str): Anchor ID of link.
+        anch_b (str): Anchor ID of link.
+        anch_c (str): Anchor ID of link.
+        anch_d (str): Anchor ID of link.
+
+    Returns:
+        list: List of lists containing strings of names and lab desc.
+
+    Raises:
+        None.
+    """
+
+    element_all = xpath_compiler(anch_a)(tree)
+    element_sub = xpath_compiler(anch_b)(tree)
+
+    ## -- multiple researcher profiles -- ##
+    ## contains branch and section/unit columns
+    if len(element_all) > 0 and len(element_sub) > 0:
+        people_all = [text_reader(i) for i in xpath_compiler('.//li')(element_all[0])]
+        people_sub = [text_reader(i) for i in xpath_compiler('.//li')(element_sub[0])]
+
+        return people_splitter(
+            people_all = people_all,
+            people_sub = people_sub
+        )
+
+    ## -- single researcher profile -- ##
+    ## does not contain branch and section/unit columns
+    string_all_spt = list()
+
+    for i in [anch_c, anch_d]:
+        element = xpath_compiler(i)(tree)
+
+        if len(element) == 0:
+            return list()
+
+        string_all_spt.append(text_reader(element[0]))
+
+    return [string_all_spt]
+
+
+## branch data and pre-processing
+def branch_reader(tree, data, feat_a, feat_b, anch_c):
+
+    """
+    Desc:
+        Creates new 'Branch' feature from an lxml element tree. Equivalent to
+        'branch_extractor' without a Selenium WebDriver object.
+
+    Args:
+        tree (obj): Root of lxml element tree of web page.
+        data (df): A valid DataFrame.
+        feat_a (str): Reference column, typically 'Section'.
+        feat_b (str): Target column, typically 'Branch'.
+        anch_c (str): Anchor ID of link.
+
+    Returns:
+        Dataframe: Contains new 'feat_b' feature.
+
+    Raises:
+        ValueError: Could not locate web resource.
+        ValueError: 'Branch' feature could not be created.
+    """
+
+    n = len(data)
+
+    ## multiple researchers
+    if n > 1:
+        element = xpath_compiler(anch_c)(tree)
+
+        if len(element) == 0:
+            raise ValueError('Cannot find heading.')
+
+        feat_branch = text_reader(element[0])
+
+    ## single researcher
+    elif n == 1:
+        feat_branch = data[feat_a].iloc[0]
+
+    else:
+        raise ValueError('Could not create branch name feature.')
+
+    data.insert(
+        loc = 2,
+        column = feat_b,
+        value = feat_branch
+    )
+
+    return data
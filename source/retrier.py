@@ -0,0 +1,448 @@
+## libraries
+import time
+import random
+import asyncio
+import threading
+import requests
+import aiohttp
+from collections import deque
+from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import NoSuchElementException
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.common.exceptions import ElementNotInteractableException
+from selenium.common.exceptions import ElementClickInterceptedException
+
+
+## recognized transient errors
+transient_errors = tuple((
+    TimeoutException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    ElementNotInteractableException,
+    ElementClickInterceptedException,
+    requests.ConnectionError,
+    requests.Timeout,
+    aiohttp.ClientConnectionError,
+    asyncio.TimeoutError
+    )
+)
+
+## recognized timeout errors, recorded as latencies
+timeout_errors = tuple((
+    TimeoutException,
+    requests.Timeout,
+    asyncio.TimeoutError
+    )
+)
+
+
+## transient error classification
+def error_classifier(err):
+
+    """
+    Desc:
+        Determines if an error is transient, where a retry may succeed. Server
+        errors (HTTP 5xx) and too many requests (HTTP 429) are transient, other
+        HTTP errors are not.
+
+    Args:
+        err (obj): Raised exception.
+
+    Returns:
+        bool: True if error is transient.
+
+    Raises:
+        None.
+    """
+
+    if isinstance(err, requests.HTTPError) and err.response is not None:
+        return err.response.status_code >= 500 or err.response.status_code == 429
+
+    if isinstance(err, aiohttp.ClientResponseError):
+        return err.status >= 500 or err.status == 429
+
+    return isinstance(err, transient_errors)
+
+
+## retry policy
+class RetryPolicy:
+
+    """
+    Desc:
+        Retry policy for web requests. Retries only transient errors, with
+        exponential backoff and full jitter between attempts. Tracks per page
+        and rolling latencies of successful attempts for each stage, and
+        derives the timeout of the next attempt from their percentiles rather
+        than a fixed load latency time, bound between 'floor' and 't'. Counts
+        retries and time waited on failed attempts and backoff. Timeouts rise
+        toward 't' on each retry, where the last attempt takes 't', and timed
+        out attempts are recorded as latencies of at least their timeout, so
+        that percentiles adapt to slow pages. Safe to share across threads.
+
+    Args:
+        n (int): Number of web request attempts after first failure.
+        t (int): Max load latency of website (seconds).
+        floor (float): Min load latency of website (seconds).
+        quantile (float): Percentile of rolling latencies for timeouts (0 to 1).
+        factor (float): Multiple of latency percentile for timeouts.
+        window (int): Number of rolling latencies per stage.
+        warmup (int): Number of rolling latencies before timeouts are derived.
+        base (float): Backoff before second attempt (seconds).
+        cap (float): Max backoff between attempts (seconds).
+
+    Raises:
+        TypeError: Incorrect data type in argument.
+        ValueError: Incorrect value in argument.
+    """
+
+    def __init__(self, n = 3, t = 30, floor = 2, quantile = 0.95, factor = 3,
+        window = 100, warmup = 5, base = 0.5, cap = 10):
+
+        ## arg quality
+        if type(n) is not int or n < 1:
+            raise TypeError('n arg requires a pos int.')
+
+        if type(t) not in [int, float] or t <= 0:
+            raise TypeError('t arg requires a pos number.')
+
+        if not 0 < quantile <= 1:
+            raise ValueError('quantile arg requires a number between 0 and 1.')
+
+        else:
+            pass
+
+        self.n = n
+        self.t = t
+        self.floor = min(floor, t)
+        self.quantile = quantile
+        self.factor = factor
+        self.window = window
+        self.warmup = warmup
+        self.base = base
+        self.cap = cap
+
+        self.rolling = dict()
+        self.pages = dict()
+        self.retries = 0
+        self.waited = 0.0
+        self.lock = threading.Lock()
+
+    ## latency percentile
+    def percentile(self, q, stage = 'default', page = None):
+
+        """
+        Desc:
+            Determines the 'q' percentile of rolling latencies of a stage, or
+            of a page in a stage if 'page' is specified.
+
+        Args:
+            q (float): Percentile (0 to 1).
+            stage (str): Stage name.
+            page (str): Page key, typically anchor ID or URL (optional).
+
+        Returns:
+            float: Latency percentile (seconds), or None without latencies.
+
+        Raises:
+            None.
+        """
+
+        with self.lock:
+            if page is None:
+                latencies = sorted(self.rolling.get(stage, list()))
+            else:
+                latencies = sorted(self.pages.get((stage, page), list()))
+
+        if len(latencies) == 0:
+            return None
+
+        k = min(int(q * len(latencies)), len(latencies) - 1)
+
+        return latencies[k]
+
+    ## timeout of next attempt
+    def timeout(self, stage = 'default', page = None, attempt = 1):
+
+        """
+        Desc:
+            Derives the timeout of the next attempt from the rolling latency
+            percentile of a stage and the slowest latency of the page, bound
+            between 'floor' and 't'. Returns 't' until 'warmup' latencies of
+            the stage are recorded. Retries rise geometrically from the
+            derived timeout toward 't', where the last attempt takes 't'.
+
+        Args:
+            stage (str): Stage name.
+            page (str): Page key, typically anchor ID or URL (optional).
+            attempt (int): Number of the next attempt, first is 1.
+
+        Returns:
+            float: Timeout (seconds).
+
+        Raises:
+            None.
+        """
+
+        with self.lock:
+            n_rolling = len(self.rolling.get(stage, list()))
+
+        ## last attempt before max, as in 'call'
+        last = max(self.n - 1, 1)
+
+        if n_rolling < self.warmup or attempt >= last:
+            return self.t
+
+        latency = self.percentile(
+            q = self.quantile,
+            stage = stage
+        )
+
+        if page is not None:
+            latency = max(latency, self.percentile(q = 1, stage = stage, page = page) or 0)
+
+        timeout = min(max(latency * self.factor, self.floor), self.t)
+
+        return timeout * (self.t / timeout) ** ((attempt - 1) / (last - 1))
+
+    ## backoff before next attempt
+    def backoff(self, attempt):
+
+        """
+        Desc:
+            Determines exponential backoff with full jitter before the next
+            attempt.
+
+        Args:
+            attempt (int): Number of failed attempts.
+
+        Returns:
+            float: Backoff (seconds).
+
+        Raises:
+            None.
+        """
+
+        return random.uniform(0, min(self.cap, self.base * 2 ** (attempt - 1)))
+
+    ## record latency of attempt
+    def record(self, latency, stage = 'default', page = None):
+
+        """
+        Desc:
+            Records the latency of a successful or timed out attempt for a
+            stage and page.
+
+        Args:
+            latency (float): Latency (seconds).
+            stage (str): Stage name.
+            page (str): Page key, typically anchor ID or URL (optional).
+
+        Returns:
+            None.
+
+        Raises:
+            None.
+        """
+
+        with self.lock:
+            if stage not in self.rolling:
+                self.rolling[stage] = deque(maxlen = self.window)
+
+            self.rolling[stage].append(latency)
+
+            if page is not None:
+                if (stage, page) not in self.pages:
+                    self.pages[(stage, page)] = deque(maxlen = 5)
+
+                self.pages[(stage, page)].append(latency)
+
+    ## failed attempt
+    def failure(self, err, start, timeout, attempt, stage = 'default', page = None):
+
+        """
+        Desc:
+            Handles a failed attempt of 'call' or 'acall'. Raises 'err' at once
+            when not transient, records timed out attempts with at least their
+            timeout as latency, and counts retries and time waited.
+
+        Args:
+            err (obj): Raised exception.
+            start (float): Start time of attempt (perf counter seconds).
+            timeout (float): Timeout of attempt (seconds).
+            attempt (int): Number of the failed attempt, first is 1.
+            stage (str): Stage name.
+            page (str): Page key, typically anchor ID or URL (optional).
+
+        Returns:
+            float: Backoff before next attempt (seconds).
+
+        Raises:
+            RuntimeError: Max 'n' number of attempts reached.
+        """
+
+        if not error_classifier(err):
+            raise err
+
+        ## slow page, widen percentiles
+        if isinstance(err, timeout_errors):
+            self.record(
+                latency = max(time.perf_counter() - start, timeout),
+                stage = stage,
+                page = page
+            )
+
+        with self.lock:
+            self.waited += time.perf_counter() - start
+
+        ## time out failure on too many attempts
+        if attempt + 1 >= self.n:
+            raise RuntimeError(
+                'Unsuccessful request, now stopping. Max number of attempts.'
+            ) from err
+
+        print('Unsuccessful request, trying again. Attempt: {x}'.format(
+                x = attempt + 1
+            )
+        )
+
+        backoff = self.backoff(
+            attempt = attempt
+        )
+
+        with self.lock:
+            self.retries += 1
+            self.waited += backoff
+
+        return backoff
+
+    ## call with retries
+    def call(self, func, stage = 'default', page = None):
+
+        """
+        Desc:
+            Calls 'func' with the derived timeout. Retries transient errors
+            with backoff and a rising timeout up to the max number of
+            attempts, and raises other errors at once. Timed out attempts
+            are recorded with at least their timeout as latency.
+
+        Args:
+            func (func): Called with timeout (seconds) as only arg.
+            stage (str): Stage name.
+            page (str): Page key, typically anchor ID or URL (optional).
+
+        Returns:
+            obj: Return value of 'func'.
+
+        Raises:
+            RuntimeError: Max 'n' number of attempts reached.
+        """
+
+        ## try n times
+        i = 1
+
+        while True:
+            start = time.perf_counter()
+            timeout = self.timeout(
+                stage = stage,
+                page = page,
+                attempt = i
+            )
+
+            try:
+                result = func(timeout)
+
+            ## try again on transient failure
+            except Exception as err:
+                time.sleep(
+                    self.failure(
+                        err = err,
+                        start = start,
+                        timeout = timeout,
+                        attempt = i,
+                        stage = stage,
+                        page = page
+                    )
+                )
+
+                i += 1
+                continue
+
+            self.record(
+                latency = time.perf_counter() - start,
+                stage = stage,
+                page = page
+            )
+
+            return result
+
+    ## async call with retries
+    async def acall(self, func, stage = 'default', page = None, sem = None):
+
+        """
+        Desc:
+            Async counterpart of 'call'. Awaits 'func' with the derived timeout,
+            with the same retries, backoff, and timeouts. If 'sem' is
+            specified, it is held during each attempt only, not while waiting
+            for it or during backoff.
+
+        Args:
+            func (func): Coroutine function called with timeout (seconds) as
+                only arg.
+            stage (str): Stage name.
+            page (str): Page key, typically anchor ID or URL (optional).
+            sem (obj): asyncio semaphore bounding concurrent attempts (optional).
+
+        Returns:
+            obj: Return value of 'func'.
+
+        Raises:
+            RuntimeError: Max 'n' number of attempts reached.
+        """
+
+        ## try n times
+        i = 1
+
+        while True:
+            timeout = self.timeout(
+                stage = stage,
+                page = page,
+                attempt = i
+            )
+
+            if sem is not None:
+                await sem.acquire()
+
+            start = time.perf_counter()
+            backoff = None
+
+            try:
+                result = await func(timeout)
+
+            ## try again on transient failure
+            except Exception as err:
+                backoff = self.failure(
+                    err = err,
+                    start = start,
+                    timeout = timeout,
+                    attempt = i,
+                    stage = stage,
+                    page = page
+                )
+
+            finally:
+                if sem is not None:
+                    sem.release()
+
+            if backoff is not None:
+                await asyncio.sleep(backoff)
+
+                i += 1
+                continue
+
+            self.record(
+                latency = time.perf_counter() - start,
+                stage = stage,
+                page = page
+            )
+
+            return result
@@ -0,0 +1,171 @@
+## libraries
+import os
+import re
+import json
+import hashlib
+from functools import lru_cache
+
+
+## versioned normalization rules
+rules_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'rules.json')
+
+## compiled rules cache, kept beside python bytecode
+cache_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '__pycache__', 'rules.json')
+
+## compiled rules version, increment when compilation changes
+version = 2
+
+
+## trie pattern of words
+def trie_compiler(words):
+
+    """
+    Desc:
+        Compiles words into a single regular expression pattern from a trie,
+        where words with common prefixes share one branch. Optional branches
+        are greedy, so that the longest word at a position is matched.
+
+    Args:
+        words (list): Words as string values.
+
+    Returns:
+        str: Regular expression pattern matching any word.
+
+    Raises:
+        ValueError: No words to compile.
+    """
+
+    if len(words) == 0:
+        raise ValueError('Could not compile rules without words.')
+
+    ## build trie, end of word marked by empty key
+    trie = dict()
+
+    for i in words:
+        node = trie
+        for j in i:
+            node = node.setdefault(j, dict())
+
+        node[''] = dict()
+
+    ## serialize trie
+    def walker(node):
+        branches = [re.escape(i) + walker(node[i]) for i in sorted(node) if i != '']
+
+        if len(branches) == 0:
+            return ''
+
+        if len(branches) == 1:
+            pattern = branches[0]
+        else:
+            pattern = '(?:' + '|'.join(branches) + ')'
+
+        if '' in node:
+            pattern = '(?:' + pattern + ')?'
+
+        return pattern
+
+    return walker(trie)
+
+
+## compile rules
+def rule_compiler(rules):
+
+    """
+    Desc:
+        Compiles normalization rules into one pattern for job titles and
+        punctuation, one pattern for education credentials bounded by anything
+        but a lower case letter, and one exact match dictionary of name
+        corrections per stage ('first', 'middle', and 'last').
+
+    Args:
+        rules (dict): Normalization rules.
+
+    Returns:
+        dict: Compiled rules as serializable values.
+
+    Raises:
+        ValueError: No words to compile.
+    """
+
+    return {
+        'remove': trie_compiler(
+            words = rules['titles'] + rules['puncs']
+        ),
+        'edu': '(?<![a-z])(' + trie_compiler(
+            words = rules['edu']
+        ) + ')(?![a-z])',
+        'edu_rank': {j: i for i, j in enumerate(rules['edu'])},
+        'fam_suf': rules['fam_suf'],
+        'corrections': {
+            i: rules['corrections'][i] for i in ['first', 'middle', 'last']
+        }
+    }
+
+
+## load compiled rules
+@lru_cache(maxsize = None)
+def rule_loader(path = rules_path, cache = cache_path):
+
+    """
+    Desc:
+        Loads normalization rules from versioned rules file in 'path' and
+        compiles them once per process. Compiled rules are kept in 'cache'
+        between runs and reused while the rules file and compilation are
+        unchanged.
+
+    Args:
+        path (str): Path to rules file.
+        cache (str): Path to compiled rules cache (optional).
+
+    Returns:
+        dict: Compiled rules, with patterns compiled and 'hash' of rules file.
+
+    Raises:
+        ValueError: Unsupported rules file version.
+    """
+
+    with open(path, 'rb') as file:
+        body = file.read()
+
+    sha = hashlib.sha256(body).hexdigest()
+    compiled = None
+
+    ## reuse compiled rules of prior run
+    if cache is not None and os.path.exists(cache):
+        with open(cache, 'r') as file:
+            record = json.load(file)
+
+        if record.get('hash') == sha and record.get('version') == version:
+            compiled = record['rules']
+
+    ## compile changed rules
+    if compiled is None:
+        rules = json.loads(body.decode('utf-8'))
+
+        if rules.get('version') != 1:
+            raise ValueError('Unsupported rules file version.')
+
+        compiled = rule_compiler(
+            rules = rules
+        )
+
+        if cache is not None:
+            try:
+                os.makedirs(os.path.dirname(cache), exist_ok = True)
+                with open(cache + '.tmp', 'w') as file:
+                    json.dump({'hash': sha, 'version': version, 'rules': compiled}, file)
+
+                os.replace(cache + '.tmp', cache)
+
+            ## read only install, compile every run
+            except OSError:
+                pass
+
+    return dict(
+        compiled,
+        remove = re.compile(compiled['remove']),
+        edu = re.compile(compiled['edu']),
+        fam_suf = frozenset(compiled['fam_suf']),
+        hash = sha
+    )
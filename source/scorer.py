@@ -0,0 +1,210 @@
+## libraries
+import os
+import numpy as np
+import pandas as pd
+from loader import graph_reader
+from loader import key_reader
+from loader import csr_reader
+
+
+## path from sections to persons, reversed steps prefixed '~'
+section_steps = ['~BELONGS_TO', '~PROXY_TO']
+
+## similarity dimensions by path from persons, as in '/queries/sec-sim.cql'
+sim_dims = {
+    'journal_cat_similarity': ['AUTHORED', 'PUBLISHED_IN', 'IN_CATEGORY'],
+    'journal_similarity': ['AUTHORED', 'PUBLISHED_IN'],
+    'keyword_similarity': ['AUTHORED', 'HAS_KEYWORD'],
+    'mesh_similarity': ['AUTHORED', 'HAS_MESH_KEYWORD'],
+    'paper_similarity': ['AUTHORED'],
+    'project_cat_similarity': ['~HAS_PI', 'IN_SPENDING_CAT'],
+    'project_term_similarity': ['~HAS_PI', 'HAS_TERM']
+}
+
+
+## section by feature incidence
+def incidence_maker(path, dims = None):
+
+    """
+    Desc:
+        Makes the boolean section by feature incidence matrix of each
+        similarity dimension from the CSR graph of 'graph_loader', where a
+        section is incident to the features reachable from its persons. Each
+        path is walked by sparse matrix products, where shared path prefixes
+        are walked once.
+
+    Args:
+        path (str): Path to graph directory.
+        dims (dict): Path of relationship types from persons per dimension,
+            reversed types prefixed '~' (optional).
+
+    Returns:
+        dict: SciPy CSR matrix object per dimension.
+
+    Raises:
+        None.
+    """
+
+    if dims is None:
+        dims = sim_dims
+
+    ## walked path prefixes
+    walks = dict()
+
+    def walker(steps):
+        steps = tuple(steps)
+
+        if steps in walks:
+            return walks[steps]
+
+        step = csr_reader(
+            path = path,
+            rel = steps[-1].lstrip('~')
+        )
+
+        if steps[-1].startswith('~'):
+            step = step.T.tocsr()
+
+        if len(steps) > 1:
+            step = (walker(steps[:-1]).astype(np.int32) @ step.astype(np.int32)).astype(bool)
+
+        walks[steps] = step.tocsr()
+
+        return walks[steps]
+
+    return {
+        i: walker(section_steps + j) for i, j in dims.items()
+    }
+
+
+## jaccard similarity of all section pairs
+def jaccard_scorer(incidences, names):
+
+    """
+    Desc:
+        Primary similarity function. Determines the Jaccard similarity of all
+        section pairs in each dimension, the number of shared features over
+        the number of features of either section. Intersections of all pairs
+        come from one sparse matrix product per dimension, and unions from
+        the number of features per section. As in '/queries/sec-sim.cql', a
+        pair has a similarity in a dimension when both sections have features
+        in it, where 'section_a' is the greater name. Pairs without a
+        similarity in a dimension take 0, as in the similarity notebook.
+
+    Args:
+        incidences (dict): SciPy CSR matrix object per dimension, sections by
+            features.
+        names (index): Section name string values in section ID order.
+
+    Returns:
+        DataFrame: 'section_a', 'section_b', and similarity per dimension.
+
+    Raises:
+        None.
+    """
+
+    scores = dict()
+    masks = dict()
+
+    for i, j in incidences.items():
+        inc = j.astype(bool).astype(np.int32)
+        sizes = np.asarray(inc.sum(axis = 1)).ravel()
+
+        inter = (inc @ inc.T).toarray()
+        union = sizes[:, None] + sizes[None, :] - inter
+
+        with np.errstate(divide = 'ignore', invalid = 'ignore'):
+            scores[i] = np.where(union > 0, inter / union, 0.0)
+
+        masks[i] = (sizes[:, None] > 0) & (sizes[None, :] > 0)
+
+    ## pairs with a similarity in any dimension, greater name first
+    names = np.asarray(names, dtype = object)
+    order = np.argsort(names, kind = 'stable')[::-1]
+
+    a, b = np.triu_indices(len(order), k = 1)
+    a = order[a]
+    b = order[b]
+
+    keep = np.logical_or.reduce([masks[i][a, b] for i in masks])
+
+    a = a[keep]
+    b = b[keep]
+
+    data = pd.DataFrame(
+        data = {
+            'section_a': names[a],
+            'section_b': names[b],
+            **{i: scores[i][a, b] for i in sorted(scores)}
+        }
+    )
+
+    return data.sort_values(
+        by = ['section_a', 'section_b']
+    ).reset_index(
+        drop = True
+    )
+
+
+## section names of graph
+def section_namer(path, import_path):
+
+    """
+    Desc:
+        Determines the section names of the CSR graph of 'graph_loader' in
+        section ID order, from the stable node ID's in the section node file
+        of 'import_writer'.
+
+    Args:
+        path (str): Path to graph directory.
+        import_path (str): Path to import directory of 'import_writer'.
+
+    Returns:
+        Index: Section name string values in section ID order.
+
+    Raises:
+        None.
+    """
+
+    nodes = pd.read_csv(
+        os.path.join(import_path, 'nodes-section.csv'),
+        dtype = str,
+        keep_default_na = False
+    )
+
+    return pd.Index(
+        key_reader(
+            path = path,
+            label = graph_reader(
+                path = path
+            )['rels'][section_steps[0].lstrip('~')]['end']
+        ).map(
+            dict(zip(nodes['id:ID(SECTION)'], nodes['Name']))
+        )
+    )
+
+
+## -- section similarity run -- ##
+if __name__ == '__main__':
+
+    ## compact graph from 'graph_loader' and import files from 'import_writer'
+    graph_path = '/usr/local/niaid-dir-graph'
+    import_path = '/usr/local/niaid-dir-import'
+
+    ## pairwise similarity table of all dimensions
+    pairs_path = '/usr/local/niaid-dir-sec-sim-pairs.csv'
+
+    data = jaccard_scorer(
+        incidences = incidence_maker(
+            path = graph_path
+        ),
+        names = section_namer(
+            path = graph_path,
+            import_path = import_path
+        )
+    )
+
+    data.to_csv(
+        path_or_buf = pairs_path,
+        index = False
+    )
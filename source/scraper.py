@@ -1,54 +1,658 @@
 ## librariers
+import time
 import pandas as pd
 from tqdm import tqdm
+from concurrent.futures import ThreadPoolExecutor
 from extractor import link_clicker
+from extractor import link_navigator
+from extractor import anchor_indexer
+from extractor import anchor_ranger
 from extractor import name_section_extractor
 from extractor import name_section_processor
 from extractor import name_educat_processor
 from extractor import branch_extractor
+from extractor import block_extractor
+from extractor import block_splitter
 from extractor import section_processor
+from reader import session_maker
+from reader import page_reader
+from reader import anchor_reader
+from reader import name_section_reader
+from reader import branch_reader
+from reader import page_parser
+from reader import body_reader
+from snapshotter import snapshot_saver
+from snapshotter import snapshot_indexer
+from snapshotter import snapshot_loader
+from reader import xpath_compiler
+from reader import text_reader
+from tracker import block_fingerprinter
+from tracker import state_reuser
+from tracker import state_updater
+from tracker import state_loader
+from tracker import state_saver
+from checkpointer import checkpoint_saver
+from checkpointer import checkpoint_loader
+from checkpointer import checkpoint_clearer
+from fetcher import pages_fetcher
 from namer import name_processor
+from retrier import RetryPolicy
+from monitor import stage_timer
+from monitor import page_recorder
+from driver import DriverManager
+
+
+## website xpaths *strictly* from prior website inspection, per site config otherwise
+site_xpaths = {
+    'anch_a': '//*[@class="block block-layout-builder block-field-blocknodedivisionfield-subtopic-division"]',
+    'anch_b': '//*[@class="clearfix text-formatted field field--name-field-body field--type-text-long field--label-hidden field__item"]',
+    'anch_c': '//h1',
+    'anch_d': '//*[@id="anch_346"]'
+}
+
+
+## webdriver call
+def driver_caller(driver, func):
+
+    """
+    Desc:
+        Calls 'func' with the Selenium WebDriver object in 'driver'. If 'driver' 
+        is a WebDriver lifecycle manager, the call is handed to it, where the 
+        browser is restarted after a crash and recycled at its limits.
+
+    Args:
+        driver (obj): Selenium WebDriver object or lifecycle manager object.
+        func (func): Called with Selenium WebDriver object as only arg.
+
+    Returns:
+        obj: Return value of 'func'.
+
+    Raises:
+        None.
+    """
+
+    if isinstance(driver, DriverManager):
+        return driver.call(
+            func = func
+        )
+
+    return func(driver)
+
+
+## anchor scraper
+def anchor_scraper(feats, driver, url, anch_x, n, t, link = None, store = None,
+    state = None, batch = False, policy = None, xpaths = None, metrics = None):
+
+    """
+    Desc:
+        Subordinate web scraping function. Navigates to a single laboratory 
+        description by anchor ID in 'anch_x' and pre-processes the data 
+        returned from it in a DataFrame. If 'link' is specified, navigates 
+        directly to it instead of clicking the anchor in 'url'. If 'store' is 
+        specified, saves the web page to the snapshot store. If 'state' is 
+        specified, reuses processed rows of a prior run when the extracted 
+        block is unchanged. If 'batch' is True, all raw text is extracted in 
+        one WebDriver round trip. If 'metrics' is specified, records the page 
+        load latency and rows of the anchor ID and the time of each stage.
+
+    Args:
+        feats (list): Columns as string values.
+        driver (obj): Selenium WebDriver object.
+        url (str): URL of website.
+        anch_x (str): Anchor ID of link.
+        n (int): Number of web request attempts after first failure.
+        t (int): Load latency of website (seconds).
+        link (str): URL of link from anchor index (optional).
+        store (str): Path to snapshot store directory (optional).
+        state (dict): Fingerprint and processed rows per anchor ID (optional).
+        batch (bool): Extract all raw text in one WebDriver round trip.
+        policy (obj): Retry policy object (optional).
+        xpaths (dict): XPaths of web page by key 'anch_a' to 'anch_d' (optional).
+        metrics (obj): Run metrics object (optional).
+
+    Returns:
+        DataFrame: 'Name', 'Education', 'Branch', 'Section' features.
+
+    Raises:
+        None.
+    """
+
+    ## website xpaths
+    if xpaths is None:
+        xpaths = site_xpaths
+
+    ## link nav
+    start = time.perf_counter()
+
+    if link is None:
+        link_clicker(
+            url = url,
+            driver = driver,
+            anch_x = anch_x,
+            n = n,
+            t = t,
+            policy = policy
+        )
+
+    else:
+        link_navigator(
+            driver = driver,
+            link = link,
+            n = n,
+            t = t,
+            policy = policy,
+            xpath = xpaths['anch_c']
+        )
+
+    page_recorder(
+        metrics = metrics,
+        page = anch_x,
+        latency = time.perf_counter() - start
+    )
+
+    ## -- name, edu, section -- ##
+    ## name and section raw extraction in one round trip
+    heading = None
+
+    if batch:
+        block = block_extractor(
+            driver = driver,
+            anch_a = xpaths['anch_a'],
+            anch_b = xpaths['anch_b'],
+            anch_c = xpaths['anch_c'],
+            anch_d = xpaths['anch_d'],
+            n = n,
+            t = t,
+            policy = policy
+        )
+
+        data_list = block_splitter(
+            block = block
+        )
+
+        heading = block['heading']
+
+    ## name and section raw extraction
+    else:
+        data_list = name_section_extractor(
+            driver = driver,
+            anch_a = xpaths['anch_a'],
+            anch_b = xpaths['anch_b'],
+            anch_c = xpaths['anch_c'],
+            anch_d = xpaths['anch_d'],
+            n = n,
+            t = t,
+            policy = policy
+        )
+
+    ## web page snapshot
+    if store is not None:
+        snapshot_saver(
+            store = store,
+            url = driver.current_url,
+            body = driver.page_source,
+            anch_x = anch_x
+        )
+
+    ## reuse unchanged block
+    if state is not None:
+        fingerprint = block_fingerprinter(
+            data_list = data_list,
+            heading = heading if heading is not None else ' '.join(
+                [i.text for i in driver.find_elements_by_xpath(
+                    xpath = xpaths['anch_c']
+                )][:1]
+            )
+        )
+
+        data_loop = state_reuser(
+            state = state,
+            anch_x = anch_x,
+            fingerprint = fingerprint,
+            feats = feats
+        )
+
+        if data_loop is not None:
+            page_recorder(
+                metrics = metrics,
+                page = anch_x,
+                rows = len(data_loop)
+            )
+
+            return data_loop
+
+    ## name and section feat processing
+    with stage_timer(metrics, 'name_section_processor'):
+        data_loop = name_section_processor(
+            data = data_list,
+            feat_a = feats[0],
+            feat_b = feats[3]
+        )
+
+    ## education feat processing
+    with stage_timer(metrics, 'name_educat_processor'):
+        data_loop = name_educat_processor(
+            data = data_loop,
+            feat_a = feats[0],
+            feat_b = feats[1]
+        )
+
+    ## -- branch and section -- ##
+    # branch raw extraction
+    with stage_timer(metrics, 'branch_extractor'):
+        data_loop = branch_extractor(
+            driver = driver,
+            data = data_loop,
+            feat_a = feats[3],
+            feat_b = feats[2],
+            anch_c = xpaths['anch_c'],
+            t = t,
+            heading = heading
+        )
+
+    ## keep processed block
+    if state is not None:
+        state_updater(
+            state = state,
+            anch_x = anch_x,
+            fingerprint = fingerprint,
+            data = data_loop
+        )
+
+    page_recorder(
+        metrics = metrics,
+        page = anch_x,
+        rows = len(data_loop)
+    )
+
+    return data_loop
+
+
+## anchor parser
+def anchor_parser(feats, session, link, n, t, anch_x = None, store = None,
+    state = None, policy = None, xpaths = None, metrics = None):
+
+    """
+    Desc:
+        Subordinate web scraping function without a Selenium WebDriver object. 
+        Requests a single laboratory description in 'link' over HTTP and 
+        pre-processes the data parsed from it in a DataFrame. Equivalent to 
+        'anchor_scraper', utilizing the same XPaths. If 'store' is specified, 
+        saves the web page to the snapshot store. If 'state' is specified, 
+        reuses processed rows of a prior run when the extracted block is 
+        unchanged. If 'metrics' is specified, records the page load latency 
+        and rows of the anchor ID and the time of each stage.
+
+    Args:
+        feats (list): Columns as string values.
+        session (obj): Requests HTTP session object.
+        link (str): URL of link from anchor index.
+        n (int): Number of web request attempts after first failure.
+        t (int): Load latency of website (seconds).
+        anch_x (str): Anchor ID of link (optional).
+        store (str): Path to snapshot store directory (optional).
+        state (dict): Fingerprint and processed rows per anchor ID (optional).
+        policy (obj): Retry policy object (optional).
+        xpaths (dict): XPaths of web page by key 'anch_a' to 'anch_d' (optional).
+        metrics (obj): Run metrics object (optional).
+
+    Returns:
+        DataFrame: 'Name', 'Education', 'Branch', 'Section' features.
+
+    Raises:
+        None.
+    """
+
+    ## link request
+    start = time.perf_counter()
+
+    link, body = body_reader(
+        session = session,
+        url = link,
+        n = n,
+        t = t,
+        policy = policy
+    )
+
+    page_recorder(
+        metrics = metrics,
+        page = anch_x,
+        latency = time.perf_counter() - start
+    )
+
+    ## web page snapshot
+    if store is not None:
+        snapshot_saver(
+            store = store,
+            url = link,
+            body = body,
+            anch_x = anch_x
+        )
+
+    return tree_parser(
+        feats = feats,
+        tree = page_parser(
+            body = body,
+            url = link
+        ),
+        anch_x = anch_x,
+        state = state,
+        xpaths = xpaths,
+        metrics = metrics
+    )
+
+
+## tree parser
+def tree_parser(feats, tree, anch_x = None, state = None, xpaths = None,
+    metrics = None):
+
+    """
+    Desc:
+        Subordinate function for pre-processing the data parsed from the lxml 
+        element tree of a single laboratory description in a DataFrame. If 
+        'state' is specified, reuses processed rows of a prior run when the 
+        extracted block is unchanged. If 'metrics' is specified, records the 
+        rows of the anchor ID and the time of each stage.
+
+    Args:
+        feats (list): Columns as string values.
+        tree (obj): Root of lxml element tree of web page.
+        anch_x (str): Anchor ID of link (optional).
+        state (dict): Fingerprint and processed rows per anchor ID (optional).
+        xpaths (dict): XPaths of web page by key 'anch_a' to 'anch_d' (optional).
+        metrics (obj): Run metrics object (optional).
+
+    Returns:
+        DataFrame: 'Name', 'Education', 'Branch', 'Section' features.
+
+    Raises:
+        None.
+    """
+
+    ## website xpaths
+    if xpaths is None:
+        xpaths = site_xpaths
+
+    ## -- name, edu, section -- ##
+    ## name and section raw extraction
+    data_list = name_section_reader(
+        tree = tree,
+        anch_a = xpaths['anch_a'],
+        anch_b = xpaths['anch_b'],
+        anch_c = xpaths['anch_c'],
+        anch_d = xpaths['anch_d']
+    )
+
+    ## reuse unchanged block
+    if state is not None:
+        fingerprint = block_fingerprinter(
+            data_list = data_list,
+            heading = ' '.join([text_reader(i) for i in xpath_compiler(
+                    xpaths['anch_c']
+                )(tree)][:1]
+            )
+        )
+
+        data_loop = state_reuser(
+            state = state,
+            anch_x = anch_x,
+            fingerprint = fingerprint,
+            feats = feats
+        )
+
+        if data_loop is not None:
+            page_recorder(
+                metrics = metrics,
+                page = anch_x,
+                rows = len(data_loop)
+            )
+
+            return data_loop
+
+    ## name and section feat processing
+    with stage_timer(metrics, 'name_section_processor'):
+        data_loop = name_section_processor(
+            data = data_list,
+            feat_a = feats[0],
+            feat_b = feats[3]
+        )
+
+    ## education feat processing
+    with stage_timer(metrics, 'name_educat_processor'):
+        data_loop = name_educat_processor(
+            data = data_loop,
+            feat_a = feats[0],
+            feat_b = feats[1]
+        )
+
+    ## -- branch and section -- ##
+    # branch raw extraction
+    with stage_timer(metrics, 'branch_reader'):
+        data_loop = branch_reader(
+            tree = tree,
+            data = data_loop,
+            feat_a = feats[3],
+            feat_b = feats[2],
+            anch_c = xpaths['anch_c']
+        )
+
+    ## keep processed block
+    if state is not None:
+        state_updater(
+            state = state,
+            anch_x = anch_x,
+            fingerprint = fingerprint,
+            data = data_loop
+        )
+
+    page_recorder(
+        metrics = metrics,
+        page = anch_x,
+        rows = len(data_loop)
+    )
+
+    return data_loop
+
+
+## pooled anchor scraper
+def pool_scraper(feats, pool, url, anchors, n, t, index = None, store = None,
+    state = None, batch = False, policy = None, checkpoint = None, xpaths = None,
+    prefix = 'anch_', metrics = None):
+
+    """
+    Desc:
+        Splits 'anchors' into contiguous chunks, one per Selenium WebDriver 
+        object in 'pool', and traverses each chunk concurrently. Each chunk 
+        is traversed in order on its own WebDriver object. If 'checkpoint' is 
+        specified, each anchor ID is checkpointed as soon as it is scraped.
+
+    Args:
+        feats (list): Columns as string values.
+        pool (list): Selenium WebDriver objects or lifecycle manager objects.
+        url (str): URL of website.
+        anchors (list): Anchor ID's of links.
+        n (int): Number of web request attempts after first failure.
+        t (int): Load latency of website (seconds).
+        index (dict): URL of link per anchor ID (optional).
+        store (str): Path to snapshot store directory (optional).
+        state (dict): Fingerprint and processed rows per anchor ID (optional).
+        batch (bool): Extract all raw text in one WebDriver round trip.
+        policy (obj): Retry policy object shared across WebDrivers (optional).
+        checkpoint (str): Path to checkpoint directory (optional).
+        xpaths (dict): XPaths of web page by key 'anch_a' to 'anch_d' (optional).
+        prefix (str): Prefix of anchor ID's.
+        metrics (obj): Run metrics object shared across WebDrivers (optional).
+
+    Returns:
+        dict: DataFrame per anchor ID, keyed by anchor ID.
+
+    Raises:
+        None.
+    """
+
+    ## split anchors into contiguous chunks
+    n_pool = min(len(pool), len(anchors))
+    n_chunk, n_rem = divmod(len(anchors), max(n_pool, 1))
+
+    chunks = list()
+    k = 0
+
+    for i in range(0, n_pool):
+        m = n_chunk + (1 if i < n_rem else 0)
+        chunks.append(anchors[k:k + m])
+        k += m
+
+    ## shared progress bar
+    progress = tqdm(
+        total = len(anchors),
+        ascii = True,
+        desc = "Scraping Data from NIAID DIR Laboratory Descriptions"
+    )
+
+    ## anchor index
+    if index is None:
+        index = dict()
+
+    ## traverse chunk on one webdriver
+    def chunk_scraper(driver, chunk):
+        data_chunk = dict()
+        for i in chunk:
+            anch_x = '{p}{x}'.format(p = prefix, x = i)
+            data_chunk[i] = driver_caller(
+                driver = driver,
+                func = lambda d: anchor_scraper(
+                    feats = feats,
+                    driver = d,
+                    url = url,
+                    anch_x = anch_x,
+                    n = n,
+                    t = t,
+                    policy = policy,
+                    link = index.get(anch_x),
+                    store = store,
+                    state = state,
+                    batch = batch,
+                    xpaths = xpaths,
+                    metrics = metrics
+                )
+            )
+
+            ## keep finished lab desc
+            if checkpoint is not None:
+                checkpoint_saver(
+                    checkpoint = checkpoint,
+                    anch_x = anch_x,
+                    data = data_chunk[i]
+                )
+
+            progress.update(1)
+
+        return data_chunk
+
+    data_pool = dict()
+
+    with ThreadPoolExecutor(max_workers = max(n_pool, 1)) as executor:
+        futures = [
+            executor.submit(chunk_scraper, pool[i], chunks[i]) for i in range(0, n_pool)
+        ]
+
+        for i in futures:
+            data_pool.update(i.result())
+
+    progress.close()
+
+    return data_pool
 
 
 ## web scaper
-def data_scraper(feats, driver, url, anch_a = 354, anch_b = 374, n = 3, t = 30):
+def data_scraper(feats, driver, url, anch_a = 354, anch_b = 374, n = 3, t = 30,
+    nav = 'click', backend = 'selenium', limit = 1, cache = None, store = None,
+    state = None, batch = False, policy = None, checkpoint = None, resume = False,
+    xpaths = None, prefix = 'anch_', metrics = None):
 
     """
     Desc:
         Primary web scraping function. Unifies all subordinate functions to 
         traverses website through anchor ID's and pre-process the data returned 
-        in a DataFrame.
+        in a DataFrame. If 'driver' is a list of Selenium WebDriver objects, 
+        the anchor ID range is split across them and traversed concurrently, 
+        where results are merged in the original anchor ID order. If 'nav' is 
+        'index', reads all link anchors from 'url' once and navigates directly 
+        to each link, where 'anch_a' and 'anch_b' default to the anchor ID 
+        range found in the website when None. If 'backend' is 'lxml', web 
+        pages are requested over HTTP and parsed without a browser, where 
+        'driver' is an optional Requests HTTP session object and links are 
+        always navigated by index. With the 'lxml' backend, if 'limit' is 
+        greater than 1 or 'cache' is specified, all web pages are fetched 
+        concurrently and extracted as they arrive, with conditional requests 
+        for web pages cached in 'cache' by prior runs. If 'store' is specified, 
+        every web page visited is saved to the snapshot store. If 'backend' is 
+        'replay', web pages are loaded from the snapshot store in 'store' with 
+        no browser or web requests, where 'driver' and 'url' are unused. If 
+        'state' is specified, scraping is incremental, where processed rows of 
+        anchor ID's with an unchanged extracted block are reused from the state 
+        file of a prior run, and the global processing runs over the merged 
+        result. If 'batch' is True, the 'selenium' backend extracts all raw 
+        text of a web page in one WebDriver round trip. Retries, timeouts, and 
+        backoff follow 'policy', by default a retry policy of 'n' attempts with 
+        timeouts derived from observed latencies up to 't'. If 'checkpoint' is 
+        specified, the rows of each anchor ID are checkpointed as soon as it is 
+        scraped and checkpoints are removed once the traversal finishes. If 
+        'resume' is True, anchor ID's checkpointed by a prior failed run are 
+        skipped and the traversal continues from the point of failure, 
+        otherwise checkpoints of a prior run are discarded first. Web pages 
+        are read with 'xpaths' and link anchors by anchor ID's prefixed with 
+        'prefix', by default those of the NIAID DIR website. If 'metrics' is 
+        specified, records page load latency and rows per anchor ID, time of 
+        each stage, retries, and time waited on failed attempts and backoff.
 
     Args:
         feats (tuple): Columns as string values.
-        driver (obj): Selenium WebDriver object.
+        driver (obj): Selenium WebDriver object or lifecycle manager object, or 
+            list of them (pool), or Requests HTTP session object when 'backend' 
+            is 'lxml'.
         url (str): URL of website.
         anch_a (int): Anchor ID at start of website traversal.
         anch_b (int): Anchor ID at end of website traversal.
         n (int): Number of web request attempts after first failure.
         t (int): Load latency of website (seconds).
+        nav (str): Link navigation, either 'click' or 'index'.
+        backend (str): Extraction backend, either 'selenium', 'lxml', or 
+            'replay'.
+        limit (int): Max number of concurrent requests with 'lxml' backend.
+        cache (str): Path to cache directory for conditional requests (optional).
+        store (str): Path to snapshot store directory (optional).
+        state (str): Path to incremental state file (optional).
+        batch (bool): Extract all raw text in one WebDriver round trip.
+        policy (obj): Retry policy object (optional).
+        checkpoint (str): Path to checkpoint directory (optional).
+        resume (bool): Skip anchor ID's checkpointed by a prior failed run.
+        xpaths (dict): XPaths of web page by key 'anch_a' to 'anch_d' (optional).
+        prefix (str): Prefix of anchor ID's.
+        metrics (obj): Run metrics object (optional).
 
     Returns:
         DataFrame: 'Name', 'Education', 'Branch', 'Section' features.
     
     Raises:
         TypeError: Incorrect data type in an argument.
+        ValueError: Incorrect value in an argument.
     """
 
     ## arg quality
     if type(feats) is not tuple:
         raise TypeError('feats arg requires tuple of str.')
     
-    if driver is None:
+    if backend == 'selenium' and (driver is None or driver == list()):
         raise TypeError('driver arg requires Selenium WebDriver object.')
     
-    if type(url) is not str:
+    if type(url) is not str and backend != 'replay':
         raise TypeError('url arg requires a valid str.')
     
-    if type(anch_a) is not int:
+    if type(anch_a) is not int and not (anch_a is None and (nav == 'index' or backend != 'selenium')):
         raise TypeError('url arg requires a pos int within anchor ID range.')
 
-    if type(anch_b) is not int:
+    if type(anch_b) is not int and not (anch_b is None and (nav == 'index' or backend != 'selenium')):
         raise TypeError('url arg requires a pos int within anchor ID range.')
     
     if type(n) is not int or t < 1:
@@ -56,88 +660,438 @@ def data_scraper(feats, driver, url, anch_a = 354, anch_b = 374, n = 3, t = 30):
     
     if type(t) is not int or t < 1:
         raise TypeError('t arg requires a pos int.')
+
+    if nav not in ['click', 'index']:
+        raise ValueError("nav arg requires either 'click' or 'index'.")
+
+    if backend not in ['selenium', 'lxml', 'replay']:
+        raise ValueError("backend arg requires either 'selenium', 'lxml', or 'replay'.")
+
+    if backend == 'replay' and type(store) is not str:
+        raise TypeError("store arg requires a valid str with 'replay' backend.")
+
+    if type(limit) is not int or limit < 1:
+        raise TypeError('limit arg requires a pos int.')
+
+    if type(resume) is not bool:
+        raise TypeError('resume arg requires a bool.')
+
+    if xpaths is not None and not {'anch_a', 'anch_b', 'anch_c', 'anch_d'} <= set(xpaths):
+        raise ValueError("xpaths arg requires keys 'anch_a' to 'anch_d'.")
     
     else:
         pass
 
-    ## make dataframe
+    ## plain records, made into a dataframe once
     feats = list(feats)
-    data = pd.DataFrame(
-        columns = feats
-    )
-
-    ## traverse lab desc
-    for i in tqdm(range(anch_a, anch_b), 
-        ascii = True, 
-        desc = "Scraping Data from NIAID DIR Laboratory Descriptions"
-        ):
+    records = list()
 
-        ## link nav
-        link_clicker(
-            url = url,
-            driver = driver,
-            anch_x =  'anch_{x}'.format(x = i),
+    ## retry policy shared across web pages
+    if policy is None:
+        policy = RetryPolicy(
             n = n,
             t = t
         )
 
-        ## -- name, edu, section -- ##
-        ## name and section raw extraction
-        data_list = name_section_extractor(
-            driver = driver,
-            anch_a = '//*[@class="block block-layout-builder block-field-blocknodedivisionfield-subtopic-division"]',
-            anch_b = '//*[@class="clearfix text-formatted field field--name-field-body field--type-text-long field--label-hidden field__item"]',
-            anch_c = '//h1',
-            anch_d = '//*[@id="anch_346"]',
-            n = n,
-            t = t
+    retries = policy.retries
+    waited = policy.waited
+
+    ## -- checkpoints -- ##
+    ## finished lab desc of prior failed run
+    done = dict()
+
+    if checkpoint is not None:
+        if resume:
+            done = checkpoint_loader(
+                checkpoint = checkpoint,
+                feats = feats
+            )
+
+        else:
+            checkpoint_clearer(
+                checkpoint = checkpoint
+            )
+
+    ## -- incremental state -- ##
+    ## processed rows of prior run
+    blocks = None
+
+    if state is not None:
+        blocks = state_loader(
+            path = state
         )
 
-        ## name and section feat processing
-        data_loop = name_section_processor(
-            data = data_list,
-            feat_a = feats[0],
-            feat_b = feats[3]
+    ## -- anchor index -- ##
+    ## read link anchors once
+    index = dict()
+
+    with stage_timer(metrics, 'anchor_index'):
+        if backend == 'replay':
+            snapshots = snapshot_indexer(
+                store = store
+            )
+
+            index = {i: j['url'] for i, j in snapshots.items()}
+
+        elif backend == 'lxml':
+            if driver is None:
+                driver = session_maker()
+
+            index = anchor_reader(
+                tree = page_reader(
+                    session = driver,
+                    url = url,
+                    n = n,
+                    t = t,
+                    policy = policy
+                ),
+                prefix = prefix
+            )
+
+        elif nav == 'index':
+            index = driver_caller(
+                driver = driver[0] if type(driver) is list else driver,
+                func = lambda d: anchor_indexer(
+                    driver = d,
+                    url = url,
+                    t = t,
+                    prefix = prefix
+                )
+            )
+
+    if len(index) > 0:
+        anch_min, anch_max = anchor_ranger(
+            index = index,
+            prefix = prefix
         )
 
-        ## education feat processing
-        data_loop = name_educat_processor(
-            data = data_loop,
-            feat_a = feats[0],
-            feat_b = feats[1]
+        if anch_a is None:
+            anch_a = anch_min
+
+        if anch_b is None:
+            anch_b = anch_max
+
+    ## -- snapshot store -- ##
+    ## replay lab desc without browser or web requests
+    if backend == 'replay':
+        for i in tqdm(range(anch_a, anch_b), 
+            ascii = True, 
+            desc = "Replaying Data from NIAID DIR Laboratory Descriptions"
+            ):
+
+            anch_x = '{p}{x}'.format(p = prefix, x = i)
+
+            ## finished by prior run
+            if anch_x in done:
+                records.extend(
+                    done[anch_x].itertuples(index = False, name = None)
+                )
+                continue
+
+            if anch_x not in snapshots:
+                print('Cannot find anchor in snapshots, skipping. Anchor: {x}'.format(
+                        x = anch_x
+                    )
+                )
+                continue
+
+            data_loop = tree_parser(
+                feats = feats,
+                tree = page_parser(
+                    body = snapshot_loader(
+                        store = store,
+                        sha = snapshots[anch_x]['hash']
+                    ),
+                    url = snapshots[anch_x]['url']
+                ),
+                anch_x = anch_x,
+                state = blocks,
+                xpaths = xpaths,
+                metrics = metrics
+            )
+
+            ## keep finished lab desc
+            if checkpoint is not None:
+                checkpoint_saver(
+                    checkpoint = checkpoint,
+                    anch_x = anch_x,
+                    data = data_loop
+                )
+
+            ## -- global -- ##
+            ## create records
+            records.extend(
+                data_loop.itertuples(index = False, name = None)
+            )
+
+    ## -- async http session -- ##
+    ## fetch lab desc concurrently, extract as they arrive
+    elif backend == 'lxml' and (limit > 1 or cache is not None):
+        anchors = ['{p}{x}'.format(p = prefix, x = i) for i in range(anch_a, anch_b)]
+
+        for i in anchors:
+            if i not in index:
+                print('Cannot find anchor in index, skipping. Anchor: {x}'.format(
+                        x = i
+                    )
+                )
+
+        anchors = [i for i in anchors if i in index]
+        fetches = [i for i in anchors if i not in done]
+
+        progress = tqdm(
+            total = len(fetches),
+            ascii = True,
+            desc = "Scraping Data from NIAID DIR Laboratory Descriptions"
         )
 
-        ## -- branch and section -- ##
-        # branch raw extraction
-        data_loop = branch_extractor(
-            driver = driver,
-            data = data_loop,
-            feat_a = feats[3],
-            feat_b = feats[2],
-            anch_c = '//h1',
-            t = t
+        links = {index[i]: i for i in fetches}
+
+        def body_handler(url, body):
+
+            ## web page snapshot
+            if store is not None:
+                snapshot_saver(
+                    store = store,
+                    url = url,
+                    body = body,
+                    anch_x = links[url]
+                )
+
+            data_page = tree_parser(
+                feats = feats,
+                tree = page_parser(
+                    body = body,
+                    url = url
+                ),
+                anch_x = links[url],
+                state = blocks,
+                xpaths = xpaths,
+                metrics = metrics
+            )
+
+            ## keep finished lab desc
+            if checkpoint is not None:
+                checkpoint_saver(
+                    checkpoint = checkpoint,
+                    anch_x = links[url],
+                    data = data_page
+                )
+
+            progress.update(1)
+
+            return data_page
+
+        data_pool = pages_fetcher(
+            urls = [index[i] for i in fetches],
+            handler = body_handler,
+            limit = limit,
+            n = n,
+            t = t,
+            cache = cache,
+            metrics = metrics,
+            keys = links,
+            policy = policy
+        )
+
+        progress.close()
+
+        ## create records in original anchor order
+        for i in anchors:
+            records.extend(
+                (done[i] if i in done else data_pool[index[i]]).itertuples(index = False, name = None)
+            )
+
+    ## -- http session -- ##
+    ## traverse lab desc without browser
+    elif backend == 'lxml':
+        for i in tqdm(range(anch_a, anch_b), 
+            ascii = True, 
+            desc = "Scraping Data from NIAID DIR Laboratory Descriptions"
+            ):
+
+            anch_x = '{p}{x}'.format(p = prefix, x = i)
+
+            ## finished by prior run
+            if anch_x in done:
+                records.extend(
+                    done[anch_x].itertuples(index = False, name = None)
+                )
+                continue
+
+            if anch_x not in index:
+                print('Cannot find anchor in index, skipping. Anchor: {x}'.format(
+                        x = anch_x
+                    )
+                )
+                continue
+
+            data_loop = anchor_parser(
+                feats = feats,
+                session = driver,
+                link = index[anch_x],
+                n = n,
+                t = t,
+                policy = policy,
+                anch_x = anch_x,
+                store = store,
+                state = blocks,
+                xpaths = xpaths,
+                metrics = metrics
+            )
+
+            ## keep finished lab desc
+            if checkpoint is not None:
+                checkpoint_saver(
+                    checkpoint = checkpoint,
+                    anch_x = anch_x,
+                    data = data_loop
+                )
+
+            ## -- global -- ##
+            ## create records
+            records.extend(
+                data_loop.itertuples(index = False, name = None)
+            )
+
+    ## -- webdriver pool -- ##
+    ## traverse lab desc concurrently
+    elif type(driver) is list:
+        anchors = list(range(anch_a, anch_b))
+
+        ## anchors missing from page
+        if nav == 'index':
+            for i in anchors:
+                if '{p}{x}'.format(p = prefix, x = i) not in index:
+                    print('Cannot find anchor in index, skipping. Anchor: {p}{x}'.format(
+                            p = prefix,
+                            x = i
+                        )
+                    )
+
+            anchors = [i for i in anchors if '{p}{x}'.format(p = prefix, x = i) in index]
+
+        data_pool = pool_scraper(
+            feats = feats,
+            pool = driver,
+            url = url,
+            anchors = [i for i in anchors if '{p}{x}'.format(p = prefix, x = i) not in done],
+            n = n,
+            t = t,
+            policy = policy,
+            index = index,
+            store = store,
+            state = blocks,
+            batch = batch,
+            checkpoint = checkpoint,
+            xpaths = xpaths,
+            prefix = prefix,
+            metrics = metrics
         )
 
-        ## -- global -- ##
-        ## create data
-        data = data.append(
-            other = data_loop,
-            ignore_index = True
+        ## create records in original anchor order
+        for i in anchors:
+            records.extend(
+                done.get('{p}{x}'.format(p = prefix, x = i), data_pool.get(i)).itertuples(index = False, name = None)
+            )
+
+    ## -- single webdriver -- ##
+    ## traverse lab desc
+    else:
+        for i in tqdm(range(anch_a, anch_b), 
+            ascii = True, 
+            desc = "Scraping Data from NIAID DIR Laboratory Descriptions"
+            ):
+
+            anch_x = '{p}{x}'.format(p = prefix, x = i)
+
+            ## finished by prior run
+            if anch_x in done:
+                records.extend(
+                    done[anch_x].itertuples(index = False, name = None)
+                )
+                continue
+
+            if nav == 'index' and anch_x not in index:
+                print('Cannot find anchor in index, skipping. Anchor: {x}'.format(
+                        x = anch_x
+                    )
+                )
+                continue
+
+            data_loop = driver_caller(
+                driver = driver,
+                func = lambda d: anchor_scraper(
+                    feats = feats,
+                    driver = d,
+                    url = url,
+                    anch_x = anch_x,
+                    n = n,
+                    t = t,
+                    policy = policy,
+                    link = index.get(anch_x),
+                    store = store,
+                    state = blocks,
+                    batch = batch,
+                    xpaths = xpaths,
+                    metrics = metrics
+                )
+            )
+
+            ## keep finished lab desc
+            if checkpoint is not None:
+                checkpoint_saver(
+                    checkpoint = checkpoint,
+                    anch_x = anch_x,
+                    data = data_loop
+                )
+
+            ## -- global -- ##
+            ## create records
+            records.extend(
+                data_loop.itertuples(index = False, name = None)
+            )
+
+    ## make dataframe
+    data = pd.DataFrame.from_records(
+        data = records,
+        columns = feats
+    )
+
+    ## keep processed rows for next run
+    if state is not None:
+        state_saver(
+            path = state,
+            state = blocks
         )
 
     ## name feat processing
-    data = name_processor(
-        data = data,
-        feat = feats[0],
-        reap = 2
-    )
+    with stage_timer(metrics, 'name_processor'):
+        data = name_processor(
+            data = data,
+            feat = feats[0],
+            reap = 2
+        )
 
     ## branch and section processing
-    data = section_processor(
-        data = data,
-        feat_a = feats[3],
-        feat_b = feats[2]
-    )
+    with stage_timer(metrics, 'section_processor'):
+        data = section_processor(
+            data = data,
+            feat_a = feats[3],
+            feat_b = feats[2]
+        )
+
+    ## retries and rows of run
+    if metrics is not None:
+        metrics.count('retries', policy.retries - retries)
+        metrics.count('wait_seconds', policy.waited - waited)
+        metrics.count('rows', len(data))
+
+    ## traversal finished, nothing to resume
+    if checkpoint is not None:
+        checkpoint_clearer(
+            checkpoint = checkpoint
+        )
 
     return data
 
@@ -149,7 +1103,9 @@ def data_cleaner(data, feats):
     Desc:
         Utilized for global data cleaning results from web scraping and data
         manipulation. Removes whitespace, sorts, and resets index in DataFrame.
-    
+        'Education', 'Branch', and 'Section' are made categorical, as they hold
+        few distinct values repeated across rows.
+
     Args:
         data (df): A valid DataFrame.
         feats (list): List of column names as string values.
@@ -183,5 +1139,9 @@ def data_cleaner(data, feats):
         inplace = True
     )
 
+    ## low cardinality feats
+    for i in feats[1:4]:
+        data[i] = data[i].astype('category')
+
     return data
 
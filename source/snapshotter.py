@@ -0,0 +1,124 @@
+## libraries
+import os
+import json
+import hashlib
+import threading
+from datetime import datetime
+from datetime import timezone
+
+
+## serialize index writes across webdrivers
+lock = threading.Lock()
+
+
+## save web page snapshot
+def snapshot_saver(store, url, body, anch_x = None):
+
+    """
+    Desc:
+        Saves web page in 'body' to a content-addressed snapshot store. Bodies
+        are stored once per SHA-256 hash, and every visit is recorded in the
+        store index by URL, anchor ID, hash, and timestamp.
+
+    Args:
+        store (str): Path to snapshot store directory.
+        url (str): URL of web page.
+        body (bytes): HTML of web page.
+        anch_x (str): Anchor ID of link (optional).
+
+    Returns:
+        str: SHA-256 hash of web page.
+
+    Raises:
+        None.
+    """
+
+    if type(body) is str:
+        body = body.encode('utf-8')
+
+    sha = hashlib.sha256(body).hexdigest()
+    path = os.path.join(store, 'pages', sha + '.html')
+
+    with lock:
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok = True)
+            with open(path + '.tmp', 'wb') as file:
+                file.write(body)
+
+            os.replace(path + '.tmp', path)
+
+        with open(os.path.join(store, 'index.jsonl'), 'a') as file:
+            file.write(json.dumps({
+                'url': url,
+                'anchor': anch_x,
+                'hash': sha,
+                'time': datetime.now(timezone.utc).isoformat()
+            }) + '\n')
+
+    return sha
+
+
+## index of latest web page snapshots
+def snapshot_indexer(store):
+
+    """
+    Desc:
+        Reads the snapshot store index and determines the latest snapshot per
+        anchor ID.
+
+    Args:
+        store (str): Path to snapshot store directory.
+
+    Returns:
+        dict: Latest index record per anchor ID.
+
+    Raises:
+        ValueError: No snapshots found in store.
+    """
+
+    path = os.path.join(store, 'index.jsonl')
+
+    if not os.path.exists(path):
+        raise ValueError('Could not find snapshots in store.')
+
+    index = dict()
+
+    with open(path, 'r') as file:
+        for i in file:
+            if not i.strip():
+                continue
+
+            record = json.loads(i)
+
+            if record['anchor'] is None:
+                continue
+
+            if record['anchor'] not in index or record['time'] >= index[record['anchor']]['time']:
+                index[record['anchor']] = record
+
+    if len(index) == 0:
+        raise ValueError('Could not find snapshots in store.')
+
+    return index
+
+
+## load web page snapshot
+def snapshot_loader(store, sha):
+
+    """
+    Desc:
+        Loads web page snapshot by SHA-256 hash from snapshot store.
+
+    Args:
+        store (str): Path to snapshot store directory.
+        sha (str): SHA-256 hash of web page.
+
+    Returns:
+        bytes: HTML of web page.
+
+    Raises:
+        None.
+    """
+
+    with open(os.path.join(store, 'pages', sha + '.html'), 'rb') as file:
+        return file.read()
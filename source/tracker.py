@@ -0,0 +1,152 @@
+## libraries
+import os
+import json
+import hashlib
+import pandas as pd
+from ruler import rule_loader
+
+
+## state file version, increment when per anchor processing changes
+version = 1
+
+
+## load incremental state
+def state_loader(path):
+
+    """
+    Desc:
+        Loads incremental state of prior runs from 'path'. State from another
+        version of the per anchor processing is discarded.
+
+    Args:
+        path (str): Path to state file.
+
+    Returns:
+        dict: Fingerprint and processed rows per anchor ID.
+
+    Raises:
+        None.
+    """
+
+    if not os.path.exists(path):
+        return dict()
+
+    with open(path, 'r') as file:
+        state = json.load(file)
+
+    if state.get('version') != version:
+        return dict()
+
+    return state['anchors']
+
+
+## save incremental state
+def state_saver(path, state):
+
+    """
+    Desc:
+        Saves incremental state to 'path' for later runs.
+
+    Args:
+        path (str): Path to state file.
+        state (dict): Fingerprint and processed rows per anchor ID.
+
+    Returns:
+        None.
+
+    Raises:
+        None.
+    """
+
+    if os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok = True)
+
+    with open(path + '.tmp', 'w') as file:
+        json.dump({'version': version, 'anchors': state}, file)
+
+    os.replace(path + '.tmp', path)
+
+
+## fingerprint of extracted block
+def block_fingerprinter(data_list, heading):
+
+    """
+    Desc:
+        Determines content fingerprint of the raw block extracted from a single
+        laboratory description, including its heading and the hash of the 
+        normalization rules, where processed rows are not reused after the 
+        rules change.
+
+    Args:
+        data_list (list): List of lists containing strings of names and lab desc.
+        heading (str): Heading text of web page.
+
+    Returns:
+        str: SHA-256 hash of extracted block.
+
+    Raises:
+        None.
+    """
+
+    block = json.dumps(
+        obj = [data_list, heading, rule_loader()['hash']],
+        ensure_ascii = False
+    )
+
+    return hashlib.sha256(block.encode('utf-8')).hexdigest()
+
+
+## reuse processed rows of unchanged block
+def state_reuser(state, anch_x, fingerprint, feats):
+
+    """
+    Desc:
+        Returns processed rows of anchor ID in 'anch_x' from a prior run when
+        the fingerprint of its extracted block is unchanged.
+
+    Args:
+        state (dict): Fingerprint and processed rows per anchor ID.
+        anch_x (str): Anchor ID of link.
+        fingerprint (str): SHA-256 hash of extracted block.
+        feats (list): Columns as string values.
+
+    Returns:
+        DataFrame: Processed rows, or None when changed or new.
+
+    Raises:
+        None.
+    """
+
+    if anch_x not in state or state[anch_x]['fingerprint'] != fingerprint:
+        return None
+
+    return pd.DataFrame(
+        data = state[anch_x]['rows'],
+        columns = feats
+    )
+
+
+## update processed rows of changed block
+def state_updater(state, anch_x, fingerprint, data):
+
+    """
+    Desc:
+        Stores fingerprint and processed rows of anchor ID in 'anch_x' in state.
+
+    Args:
+        state (dict): Fingerprint and processed rows per anchor ID.
+        anch_x (str): Anchor ID of link.
+        fingerprint (str): SHA-256 hash of extracted block.
+        data (df): Processed rows.
+
+    Returns:
+        None.
+
+    Raises:
+        None.
+    """
+
+    state[anch_x] = {
+        'fingerprint': fingerprint,
+        'rows': data.values.tolist()
+    }
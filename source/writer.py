@@ -0,0 +1,162 @@
+## libraries
+import os
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pyarrow.feather as pf
+
+
+## schema of data set
+def schema_maker(feats):
+
+    """
+    Desc:
+        Makes the explicit Arrow schema of the data set. 'Name' is a plain
+        string, where 'Education', 'Branch', and 'Section' are dictionary
+        encoded strings, as they hold few distinct values repeated across
+        rows.
+
+    Args:
+        feats (tuple): Columns as string values.
+
+    Returns:
+        obj: Arrow schema object.
+
+    Raises:
+        None.
+    """
+
+    return pa.schema([
+        pa.field(feats[0], pa.string()),
+        pa.field(feats[1], pa.dictionary(pa.int32(), pa.string())),
+        pa.field(feats[2], pa.dictionary(pa.int32(), pa.string())),
+        pa.field(feats[3], pa.dictionary(pa.int32(), pa.string()))
+    ])
+
+
+## dataframe to arrow table
+def table_maker(data, feats):
+
+    """
+    Desc:
+        Converts the DataFrame from 'data_cleaner' into an Arrow table with
+        the schema from 'schema_maker'.
+
+    Args:
+        data (df): A valid DataFrame.
+        feats (tuple): Columns as string values.
+
+    Returns:
+        obj: Arrow table object.
+
+    Raises:
+        None.
+    """
+
+    return pa.Table.from_pandas(
+        df = data[list(feats)],
+        schema = schema_maker(
+            feats = feats
+        ),
+        preserve_index = False
+    )
+
+
+## parquet to disk
+def parquet_writer(data, feats, path):
+
+    """
+    Desc:
+        Writes the DataFrame from 'data_cleaner' to a Parquet file with
+        dictionary encoded columns, next to the CSV.
+
+    Args:
+        data (df): A valid DataFrame.
+        feats (tuple): Columns as string values.
+        path (str): Path to Parquet file.
+
+    Returns:
+        None.
+
+    Raises:
+        None.
+    """
+
+    if os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok = True)
+
+    pq.write_table(
+        table = table_maker(
+            data = data,
+            feats = feats
+        ),
+        where = path,
+        use_dictionary = True,
+        compression = 'snappy'
+    )
+
+
+## arrow to disk
+def arrow_writer(data, feats, path):
+
+    """
+    Desc:
+        Writes the DataFrame from 'data_cleaner' to an uncompressed Arrow IPC
+        (Feather V2) file with dictionary encoded columns, which can be memory
+        mapped when read.
+
+    Args:
+        data (df): A valid DataFrame.
+        feats (tuple): Columns as string values.
+        path (str): Path to Arrow file.
+
+    Returns:
+        None.
+
+    Raises:
+        None.
+    """
+
+    if os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok = True)
+
+    pf.write_feather(
+        df = table_maker(
+            data = data,
+            feats = feats
+        ),
+        dest = path,
+        compression = 'uncompressed'
+    )
+
+
+## parquet or arrow from disk
+def table_reader(path):
+
+    """
+    Desc:
+        Reads the data set from a Parquet or Arrow file by its extension into
+        a DataFrame, where dictionary encoded columns are read as categorical
+        dtypes. Arrow files are memory mapped.
+
+    Args:
+        path (str): Path to Parquet ('.parquet') or Arrow file.
+
+    Returns:
+        DataFrame: 'Name', 'Education', 'Branch', 'Section' features.
+
+    Raises:
+        None.
+    """
+
+    if path.endswith('.parquet'):
+        table = pq.read_table(
+            source = path
+        )
+
+    else:
+        table = pf.read_table(
+            source = path,
+            memory_map = True
+        )
+
+    return table.to_pandas()
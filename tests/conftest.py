@@ -0,0 +1,67 @@
+## libraries
+import os
+import sys
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+import pytest
+
+## flat modules of '/source'
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'source'))
+
+## fixture pages of local http stand-in
+site_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'site')
+
+
+## fixture page handler
+class SiteHandler(SimpleHTTPRequestHandler):
+
+    """
+    Desc:
+        Serves the fixture pages with 'Last-Modified', answers conditional
+        requests with 304, and logs the path, status, and request headers of
+        each request. Paths starting with '/flaky/' fail with 503 on their
+        first request, then serve the page of the rest of the path.
+    """
+
+    def do_GET(self):
+        with self.server.lock:
+            flaky = self.path.startswith('/flaky/') and self.path not in self.server.seen
+            self.server.seen.add(self.path)
+
+        if flaky:
+            self.send_error(503)
+            return
+
+        self.path = self.path.replace('/flaky/', '/', 1)
+        super().do_GET()
+
+    def log_request(self, code = '-', size = '-'):
+        with self.server.lock:
+            self.server.requests.append((self.path, int(code), dict(self.headers)))
+
+    def log_message(self, format, *args):
+        pass
+
+
+## local http stand-in
+@pytest.fixture
+def site():
+    server = ThreadingHTTPServer(
+        ('127.0.0.1', 0),
+        partial(SiteHandler, directory = site_path)
+    )
+
+    server.lock = threading.Lock()
+    server.seen = set()
+    server.requests = list()
+    server.url = 'http://127.0.0.1:{x}'.format(x = server.server_address[1])
+
+    thread = threading.Thread(target = server.serve_forever, daemon = True)
+    thread.start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
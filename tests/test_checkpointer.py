@@ -0,0 +1,104 @@
+## libraries
+import os
+import pandas as pd
+import pytest
+import scraper
+from checkpointer import checkpoint_loader
+from checkpointer import checkpoint_saver
+
+## data features
+feats = ('Name', 'Education', 'Branch', 'Section')
+
+
+## sequential lxml run of fixture site
+def run_maker(site, checkpoint, resume = False):
+    return scraper.data_scraper(
+        feats = feats,
+        driver = None,
+        url = site.url + '/index.html',
+        anch_a = None,
+        anch_b = None,
+        backend = 'lxml',
+        checkpoint = checkpoint,
+        resume = resume
+    )
+
+
+## page requests of fixture site
+def page_getter(site):
+    return sorted({i[0] for i in site.requests if i[0] != '/index.html'})
+
+
+## run failing at anchor 'fail'
+def interrupted_run(site, checkpoint, monkeypatch, fail):
+    parser = scraper.anchor_parser
+
+    def failer(**kwargs):
+        if kwargs['anch_x'] == fail:
+            raise RuntimeError('Unsuccessful request, now stopping. Max number of attempts.')
+
+        return parser(**kwargs)
+
+    with monkeypatch.context() as patch:
+        patch.setattr(scraper, 'anchor_parser', failer)
+
+        with pytest.raises(RuntimeError):
+            run_maker(site, checkpoint)
+
+
+def test_resumes_interrupted_run_from_checkpoints(site, tmp_path, monkeypatch):
+    checkpoint = str(tmp_path / 'checkpoint')
+    full = run_maker(site, None)
+
+    site.requests.clear()
+    interrupted_run(site, checkpoint, monkeypatch, fail = 'anch_356')
+
+    assert sorted(checkpoint_loader(checkpoint, feats)) == ['anch_354', 'anch_355']
+
+    site.requests.clear()
+    data = run_maker(site, checkpoint, resume = True)
+
+    ## only the unfinished anchor is scraped again
+    assert page_getter(site) == ['/lab356.html']
+    assert data.equals(full)
+
+
+def test_clears_checkpoints_after_finished_run(site, tmp_path):
+    checkpoint = str(tmp_path / 'checkpoint')
+
+    run_maker(site, checkpoint)
+
+    assert not os.path.exists(checkpoint)
+
+
+def test_new_run_ignores_checkpoints_without_resume(site, tmp_path):
+    checkpoint = str(tmp_path / 'checkpoint')
+
+    checkpoint_saver(checkpoint, 'anch_354', pd.DataFrame([['Stale Name', 'PhD', 'B', 'S']], columns = feats))
+
+    data = run_maker(site, checkpoint)
+
+    assert 'Stale Name' not in set(data[feats[0]])
+    assert page_getter(site) == ['/lab354.html', '/lab355.html', '/lab356.html']
+
+
+def test_ignores_partial_and_corrupt_checkpoints(site, tmp_path, monkeypatch):
+    checkpoint = str(tmp_path / 'checkpoint')
+    full = run_maker(site, None)
+
+    interrupted_run(site, checkpoint, monkeypatch, fail = 'anch_356')
+
+    ## truncated write, and record of another format
+    with open(os.path.join(checkpoint, 'anch_355.json'), 'w') as file:
+        file.write('{"anchor": "anch_355", "columns": ["Na')
+
+    with open(os.path.join(checkpoint, 'anch_999.json'), 'w') as file:
+        file.write('[1, 2, 3]')
+
+    assert sorted(checkpoint_loader(checkpoint, feats)) == ['anch_354']
+
+    site.requests.clear()
+    data = run_maker(site, checkpoint, resume = True)
+
+    assert page_getter(site) == ['/lab355.html', '/lab356.html']
+    assert data.equals(full)
@@ -0,0 +1,94 @@
+## libraries
+import pandas as pd
+import pytest
+from deduper import distance_bounder
+from deduper import merge_decider
+from deduper import name_blocker
+from deduper import person_deduper
+from deduper import phonetic_coder
+
+
+## candidate pairs as set of sorted tuples
+def pair_setter(pairs):
+    return set(zip(pairs['name_a'], pairs['name_b']))
+
+
+@pytest.mark.parametrize('name_a, name_b, k, distance', [
+    ('smith', 'smith', 2, 0),
+    ('smith', 'smyth', 2, 1),
+    ('smith', 'smithson', 3, 3),
+    ('kitten', 'sitting', 3, 3),
+    ('kitten', 'sitting', 2, 3),
+    ('smith', 'smithson', 2, 3),
+    ('', 'ab', 2, 2)
+])
+def test_distance_is_exact_within_bound(name_a, name_b, k, distance):
+    assert distance_bounder(name_a, name_b, k) == distance
+
+
+@pytest.mark.parametrize('name, code', [
+    ('robert', 'R163'),
+    ('rupert', 'R163'),
+    ('ashcraft', 'A261'),
+    ('tymczak', 'T522'),
+    ('pfister', 'P236'),
+    ('smith', 'S530'),
+    ('smyth', 'S530'),
+    ('lee', 'L000'),
+    ('', '')
+])
+def test_soundex_codes(name, code):
+    assert phonetic_coder(name) == code
+
+
+def test_blocks_on_soundex_and_prefix():
+    pairs = pair_setter(
+        name_blocker(
+            names = pd.Series(['Jane Smith', 'Jane Smyth', 'Jane Smithson', 'John Smith', 'Jane Doe'])
+        )
+    )
+
+    ## 'smi' and 'smy' only share a soundex block
+    assert ('Jane Smith', 'Jane Smyth') in pairs
+
+    ## 'smi' prefix block
+    assert ('Jane Smith', 'Jane Smithson') in pairs
+
+    ## other given name or surname
+    assert not any('John Smith' in i or 'Jane Doe' in i for i in pairs)
+
+
+def test_merges_at_threshold_boundary():
+    names = pd.Series(['Jane Smith', 'Jane Smitt'])
+
+    at = merge_decider(names = names, threshold = 0.9)
+    above = merge_decider(names = names, threshold = 0.91)
+
+    assert at['score'].tolist() == [pytest.approx(0.9)]
+    assert at['merge'].tolist() == [True]
+    assert above['merge'].tolist() == [False]
+
+
+def test_merges_groups_transitively():
+    data = pd.DataFrame(
+        data = {
+            'Name': ['Jane Smith', 'Jane Smyth', 'Jane Smythe', 'Karen Lee'],
+            'Section': ['A', 'B', 'C', 'D']
+        }
+    )
+
+    pairs = merge_decider(names = data['Name'], threshold = 0.9)
+    merged = pair_setter(pairs[pairs['merge']])
+
+    ## ends of the chain are not similar enough by themselves
+    assert ('Jane Smith', 'Jane Smythe') not in merged
+    assert {('Jane Smith', 'Jane Smyth'), ('Jane Smyth', 'Jane Smythe')} <= merged
+
+    data = person_deduper(data = data, feat = 'Name', threshold = 0.9)
+
+    assert data['Name'].tolist() == ['Jane Smythe'] * 3 + ['Karen Lee']
+
+
+def test_rejects_threshold_out_of_range():
+    with pytest.raises(ValueError):
+        merge_decider(names = pd.Series(['Jane Smith']), threshold = 0)
@@ -0,0 +1,105 @@
+## libraries
+import os
+import aiohttp
+import pytest
+from conftest import site_path
+from fetcher import pages_fetcher
+from retrier import RetryPolicy
+from scraper import data_scraper
+
+## fixture lab desc pages
+pages = ['/lab354.html', '/lab355.html', '/lab356.html']
+
+
+## fixture page body
+def body_loader(page):
+    with open(os.path.join(site_path, page.lstrip('/')), 'rb') as file:
+        return file.read()
+
+
+def test_fetches_all_pages_concurrently(site):
+    urls = [site.url + i for i in pages]
+
+    results = pages_fetcher(
+        urls = urls + urls[:1],
+        handler = lambda url, body: body,
+        limit = 2
+    )
+
+    assert results == {site.url + i: body_loader(i) for i in pages}
+    assert sorted(i[0] for i in site.requests) == pages
+
+
+def test_rerun_sends_validators_and_reuses_cached_body(site, tmp_path):
+    urls = [site.url + i for i in pages]
+
+    first = pages_fetcher(
+        urls = urls,
+        handler = lambda url, body: body,
+        cache = str(tmp_path)
+    )
+
+    site.requests.clear()
+
+    second = pages_fetcher(
+        urls = urls,
+        handler = lambda url, body: body,
+        cache = str(tmp_path)
+    )
+
+    assert second == first
+    assert [i[1] for i in site.requests] == [304] * len(pages)
+    assert all('If-Modified-Since' in i[2] for i in site.requests)
+
+
+def test_retries_transient_error_with_backoff(site):
+    policy = RetryPolicy(
+        n = 3,
+        t = 5,
+        base = 0.01
+    )
+
+    results = pages_fetcher(
+        urls = [site.url + '/flaky/lab354.html'],
+        handler = lambda url, body: body,
+        policy = policy
+    )
+
+    assert list(results.values()) == [body_loader('/lab354.html')]
+    assert [i[1] for i in site.requests] == [503, 200]
+    assert policy.retries == 1
+
+
+def test_raises_client_error_at_once(site):
+    policy = RetryPolicy(
+        n = 3,
+        t = 5,
+        base = 0.01
+    )
+
+    with pytest.raises(aiohttp.ClientResponseError) as err:
+        pages_fetcher(
+            urls = [site.url + '/lab999.html'],
+            handler = lambda url, body: body,
+            policy = policy
+        )
+
+    assert err.value.status == 404
+    assert len(site.requests) == 1
+    assert policy.retries == 0
+
+
+def test_hands_bodies_to_extractor(site):
+    feats = ('Name', 'Education', 'Branch', 'Section')
+
+    data = data_scraper(
+        feats = feats,
+        driver = None,
+        url = site.url + '/index.html',
+        anch_a = None,
+        anch_b = None,
+        backend = 'lxml',
+        limit = 3
+    )
+
+    assert set(data[feats[0]]) >= {'Jane Q Doe354', 'John Roe355', 'Jane Q Doe356'}
@@ -0,0 +1,78 @@
+## libraries
+import numpy as np
+import pandas as pd
+from namer import first_namer
+from namer import last_namer
+from namer import middle_namer
+from namer import name_canonizer
+
+
+## names frame
+def data_maker(names):
+    return pd.DataFrame(
+        data = {
+            'Name': names
+        }
+    )
+
+
+def test_canon_prefers_rank_then_count_then_greater_name():
+    names = pd.Series(['Ann B Lee', 'Ann Lee', 'Ann Lee', 'Bo Ng', 'Bo Ng', 'Bo Nu', 'Cy Li', 'Cy Lo', np.nan])
+    keys = pd.Series(['a', 'a', 'a', 'b', 'b', 'b', 'c', 'c', 'c'])
+    ranks = pd.Series([3, 2, 2, 1, 1, 1, 1, 1, 1])
+
+    canon = name_canonizer(
+        names = names,
+        keys = keys,
+        ranks = ranks
+    )
+
+    assert canon.to_dict() == {'a': 'Ann B Lee', 'b': 'Bo Ng', 'c': 'Cy Lo'}
+
+
+def test_first_namer_corrects_first_names_only():
+    data = first_namer(
+        data = data_maker(['Beth Fischer', 'David Sacks', 'Jane Doe']),
+        feat = 'Name'
+    )
+
+    ## middle name correction left to 'middle_namer'
+    assert data['Name'].tolist() == ['Elizabeth Fischer', 'David Sacks', 'Jane Doe']
+
+
+def test_middle_namer_inserts_most_frequent_middle():
+    data = middle_namer(
+        data = data_maker(['John Smith', 'John A Smith', 'John A Smith', 'John B Smith', 'Jane Smith']),
+        feat = 'Name'
+    )
+
+    assert data['Name'].tolist() == ['John A Smith', 'John B Smith', 'Jane Smith']
+
+
+def test_middle_namer_applies_middle_corrections():
+    data = middle_namer(
+        data = data_maker(['David Sacks', 'Elizabeth Fischer']),
+        feat = 'Name'
+    )
+
+    assert data['Name'].tolist() == ['David L Sacks', 'Elizabeth R Fischer']
+
+
+def test_last_namer_fills_missing_letters_and_suffixes():
+    data = last_namer(
+        data = data_maker(['John Smith', 'John Smit', 'John Smithe Jr', 'Sumati Ragagopalan', 'Jane Doe']),
+        feat = 'Name',
+        reap = 3
+    )
+
+    assert data['Name'].tolist() == ['John Smithe', 'John Smithe', 'John Smithe', 'Sumati Rajagopalan', 'Jane Doe']
+
+
+def test_last_namer_keeps_conflicting_middle_name():
+    data = last_namer(
+        data = data_maker(['Jane B Smith', 'Jane Lee Smit', 'Jane Smit', 'Jane Bo Smit']),
+        feat = 'Name',
+        reap = 2
+    )
+
+    assert data['Name'].tolist() == ['Jane B Smith', 'Jane Lee Smith', 'Jane B Smith', 'Jane B Smith']
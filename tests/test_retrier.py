@@ -0,0 +1,89 @@
+## libraries
+import asyncio
+import pytest
+import requests
+from retrier import RetryPolicy
+
+
+## policy warmed on fast pages
+def policy_maker(n = 3, t = 12):
+    policy = RetryPolicy(
+        n = n,
+        t = t,
+        base = 0.001
+    )
+
+    for i in range(0, policy.warmup):
+        policy.record(0.1)
+
+    return policy
+
+
+## fails with 'err' until timeout reaches 'needs'
+def slow_page(needs, seen, err = requests.Timeout):
+    def func(timeout):
+        seen.append(timeout)
+        if timeout < needs:
+            raise err()
+
+        return 'body'
+
+    return func
+
+
+def test_timeouts_rise_to_t_on_last_attempt():
+    policy = policy_maker(n = 5)
+
+    timeouts = [policy.timeout(attempt = i) for i in range(1, 5)]
+
+    assert timeouts[0] == policy.floor
+    assert timeouts == sorted(timeouts)
+    assert timeouts[-1] == policy.t
+
+
+def test_slow_page_loads_on_retry_and_widens_percentiles():
+    policy = policy_maker()
+    seen = list()
+
+    assert policy.call(slow_page(3, seen)) == 'body'
+    assert seen == [policy.floor, policy.t]
+    assert policy.retries == 1
+    assert policy.percentile(q = 1) >= policy.floor
+
+
+def test_non_transient_error_raised_at_once():
+    policy = policy_maker()
+    seen = list()
+
+    with pytest.raises(ValueError):
+        policy.call(slow_page(100, seen, err = ValueError))
+
+    assert len(seen) == 1
+    assert policy.retries == 0
+
+
+def test_max_attempts_raise_runtime_error():
+    policy = policy_maker(n = 3, t = 2)
+    seen = list()
+
+    with pytest.raises(RuntimeError):
+        policy.call(slow_page(100, seen))
+
+    assert len(seen) == 2
+
+
+def test_acall_matches_call_and_releases_semaphore():
+    policy = policy_maker()
+    seen = list()
+
+    async def func(timeout):
+        return slow_page(3, seen)(timeout)
+
+    async def caller():
+        sem = asyncio.Semaphore(1)
+        result = await policy.acall(func, sem = sem)
+        return result, sem.locked()
+
+    assert asyncio.run(caller()) == ('body', False)
+    assert seen == [policy.floor, policy.t]
+    assert policy.retries == 1
@@ -0,0 +1,79 @@
+## libraries
+import pandas as pd
+import tracker
+from monitor import RunMetrics
+from scraper import data_scraper
+
+## data features
+feats = ('Name', 'Education', 'Branch', 'Section')
+
+## extracted block of fixture page
+block = [['Jane Q Doe, MD, PhD', 'Thing Section']]
+
+
+def test_fingerprint_changes_with_block_and_rules(monkeypatch):
+    first = tracker.block_fingerprinter(block, 'Laboratory of Thing')
+
+    assert tracker.block_fingerprinter(block, 'Laboratory of Thing') == first
+    assert tracker.block_fingerprinter(block, 'Laboratory of Other') != first
+    assert tracker.block_fingerprinter([['John Roe, PhD', 'Thing Section']], 'Laboratory of Thing') != first
+
+    monkeypatch.setattr(tracker, 'rule_loader', lambda: {'hash': 'changed rules'})
+
+    assert tracker.block_fingerprinter(block, 'Laboratory of Thing') != first
+
+
+def test_reuses_rows_of_unchanged_fingerprint_only():
+    state = dict()
+    rows = pd.DataFrame([['Jane Q Doe', 'MD, PhD', 'Laboratory of Thing', 'Thing Section']], columns = feats)
+
+    tracker.state_updater(state, 'anch_1', 'abc', rows)
+
+    assert tracker.state_reuser(state, 'anch_1', 'abc', feats).equals(rows)
+    assert tracker.state_reuser(state, 'anch_1', 'abd', feats) is None
+    assert tracker.state_reuser(state, 'anch_2', 'abc', feats) is None
+
+
+def test_discards_state_of_other_version(monkeypatch, tmp_path):
+    path = str(tmp_path / 'state.json')
+    state = {'anch_1': {'fingerprint': 'abc', 'rows': []}}
+
+    tracker.state_saver(path, state)
+
+    assert tracker.state_loader(path) == state
+
+    monkeypatch.setattr(tracker, 'version', tracker.version + 1)
+
+    assert tracker.state_loader(path) == dict()
+    assert tracker.state_loader(str(tmp_path / 'missing.json')) == dict()
+
+
+def test_rerun_of_unchanged_site_reuses_rows(site, tmp_path):
+    runs = list()
+
+    for i in range(0, 2):
+        metrics = RunMetrics()
+        data = data_scraper(
+            feats = feats,
+            driver = None,
+            url = site.url + '/index.html',
+            anch_a = None,
+            anch_b = None,
+            backend = 'lxml',
+            limit = 3,
+            cache = str(tmp_path / 'cache'),
+            state = str(tmp_path / 'state.json'),
+            metrics = metrics
+        )
+
+        runs.append((data, metrics.report()))
+
+    first, second = runs
+
+    assert second[0].equals(first[0])
+
+    ## conditional requests, no processing of unchanged pages
+    pages = [i for i in site.requests if i[0] != '/index.html']
+    assert [i[1] for i in pages[-3:]] == [304] * 3
+    assert 'name_section_processor' in {i['stage'] for i in first[1]['stages']}
+    assert 'name_section_processor' not in {i['stage'] for i in second[1]['stages']}